@@ -0,0 +1,251 @@
+"""
+파이프라인 출력(JSON·.evb·.oab·.peaks·.lod/·.spec/) content-addressed 저장소.
+samples/ 아래 고정 이름 출력은 실행마다 다시 쓰이고, 다른 트랙 실행이 같은 이름을 덮어씀
+→ 출력 내용을 SHA-256 객체로 한 번만 저장하고, 트랙별 manifest가 논리 이름 → 해시를 기록.
+
+구조:
+    store_dir / objects / hash[:2] / {hash}{확장자}   — 읽기 전용, 내용이 같으면 다시 쓰지 않음
+    store_dir / tracks / {track}.json                 — {version, track, artifacts: {이름: {hash, size, object}}}
+논리 이름 = 파일명 (디렉터리 출력은 "{디렉터리명}/{상대 경로}").
+객체는 임시 파일 → rename으로 게시 (동시 실행 시 먼저 끝난 쪽 채택, 내용은 같음).
+원래 출력 경로와 web/public/{track}/은 객체를 하드링크(→ 심볼릭 링크 → 복사, io.link_file)로 가리킴.
+게시도 트랙별 폴더 → 트랙마다 같은 출력 이름이어도 서로 덮어쓰지 않음 (문서 안 참조는 트랙 상대 경로).
+게시 시 미리 압축본({hash}{확장자}.gz|.br)도 객체로 한 번만 만들고, hash 파일명·assets.json은 web_assets.py 참고.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from audio_engine.engine.io import file_content_hash, link_file
+from audio_engine.engine.web_assets import (
+    ENCODINGS,
+    compress_bytes,
+    hashed_name,
+    is_compressible,
+    update_asset_manifest,
+)
+
+ARTIFACT_STORE_VERSION = 1
+OBJECTS_DIR = "objects"
+TRACKS_DIR = "tracks"
+
+
+def _tmp_name(path: Path) -> Path:
+    return path.with_name(f"{path.name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
+
+
+def object_path(store_dir: Path | str, content_hash: str, suffix: str = "") -> Path:
+    return Path(store_dir) / OBJECTS_DIR / content_hash[:2] / f"{content_hash}{suffix}"
+
+
+def put_file(store_dir: Path | str, src: Path | str) -> dict[str, Any]:
+    """
+    파일 → 객체. 같은 해시 객체가 이미 있으면 쓰지 않음.
+    Returns: {hash, size, object (store_dir 기준 상대 경로), created}
+    """
+    src = Path(src)
+    content_hash = file_content_hash(src)
+    obj = object_path(store_dir, content_hash, "".join(src.suffixes[-1:]))
+    created = False
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _tmp_name(obj)
+        try:
+            shutil.copy2(src, tmp)
+            # 게시 후 출력 경로·web/public에서 하드링크로 공유되므로 읽기 전용
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+            created = True
+        finally:
+            tmp.unlink(missing_ok=True)
+    return {
+        "hash": content_hash,
+        "size": obj.stat().st_size,
+        "object": obj.relative_to(store_dir).as_posix(),
+        "created": created,
+    }
+
+
+def _manifest_path(store_dir: Path | str, track: str) -> Path:
+    return Path(store_dir) / TRACKS_DIR / f"{track}.json"
+
+
+def load_track_manifest(store_dir: Path | str, track: str) -> dict[str, Any]:
+    """트랙 manifest. 없거나 깨졌으면 빈 manifest."""
+    try:
+        with open(_manifest_path(store_dir, track), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": ARTIFACT_STORE_VERSION, "track": track, "artifacts": {}}
+    manifest.setdefault("artifacts", {})
+    return manifest
+
+
+def _save_track_manifest(store_dir: Path | str, manifest: dict[str, Any]) -> None:
+    path = _manifest_path(store_dir, manifest["track"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_name(path)
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _output_files(path: Path) -> list[tuple[str, Path]]:
+    """출력 경로 → [(논리 이름, 파일)]. 디렉터리는 하위 파일 전부 (임시 파일 제외)."""
+    if not path.is_dir():
+        return [(path.name, path)]
+    return [
+        (f"{path.name}/{p.relative_to(path).as_posix()}", p)
+        for p in sorted(path.rglob("*"))
+        if p.is_file() and ".tmp" not in p.name
+    ]
+
+
+def store_outputs(
+    store_dir: Path | str,
+    track: str,
+    paths: Iterable[Path | str],
+    publish_dir: Path | str | None = None,
+    encodings: Iterable[str] = (),
+    hashed_names: bool = False,
+) -> dict[str, str]:
+    """
+    이미 기록된 출력 파일·디렉터리 → 객체 저장 + 트랙 manifest 갱신.
+    원래 경로는 객체 링크로 교체 (같은 내용이면 이전 실행의 객체를 그대로 가리킴).
+    디렉터리 출력은 그 디렉터리 아래 이전 항목을 지우고 새로 기록 (남은 타일 방지).
+    publish_dir가 있으면 publish_dir/{track}/{논리 이름}으로 객체를 링크 (publish_track, encodings·hashed_names 전달).
+    Returns: {논리 이름: "new" | "changed" | "unchanged"}
+    """
+    manifest = load_track_manifest(store_dir, track)
+    artifacts: dict[str, dict] = manifest["artifacts"]
+    status: dict[str, str] = {}
+    for path in map(Path, paths):
+        files = _output_files(path)
+        if path.is_dir():
+            prefix = f"{path.name}/"
+            previous = {k: artifacts.pop(k) for k in list(artifacts) if k.startswith(prefix)}
+        else:
+            previous = {path.name: artifacts.pop(path.name)} if path.name in artifacts else {}
+        for name, file in files:
+            entry = put_file(store_dir, file)
+            entry.pop("created")
+            old = previous.get(name)
+            status[name] = "new" if old is None else "unchanged" if old["hash"] == entry["hash"] else "changed"
+            artifacts[name] = entry
+            link_file(Path(store_dir) / entry["object"], file)
+    manifest["version"] = ARTIFACT_STORE_VERSION
+    _save_track_manifest(store_dir, manifest)
+    if publish_dir is not None:
+        publish_track(store_dir, track, publish_dir, names=list(status), encodings=encodings, hashed_names=hashed_names)
+    return status
+
+
+def publish_track(
+    store_dir: Path | str,
+    track: str,
+    dest_dir: Path | str,
+    names: Iterable[str] | None = None,
+    encodings: Iterable[str] = (),
+    hashed_names: bool = False,
+) -> dict[str, str]:
+    """
+    트랙 manifest의 객체를 dest_dir/{track}/{논리 이름}에 링크 (이미 같은 파일이면 건드리지 않음 → mtime 유지).
+    names: 게시할 논리 이름 (None이면 전부).
+    encodings: ("gzip", "br") 중 → 압축 가능한 항목(.json)은 {이름}.gz / .br 도 링크 (압축본은 저장소 객체로 캐시).
+    hashed_names: 최상위 파일은 {stem}.{hash12}{확장자}로도 게시하고 dest_dir/assets.json에 기록
+                  (디렉터리 출력은 index가 상대 경로로 타일을 참조하므로 이름 유지, assets.json에는 기록).
+                  assets.json 키 = {track}/{논리 이름}.
+    Returns: {논리 이름: link_file 결과}
+    """
+    artifacts = load_track_manifest(store_dir, track)["artifacts"]
+    dest_dir = Path(dest_dir)
+    track_dir = dest_dir / track
+    wanted = list(artifacts) if names is None else [n for n in names if n in artifacts]
+    encodings = tuple(encodings)
+    for encoding in encodings:
+        if encoding not in ENCODINGS:
+            raise ValueError(f"알 수 없는 encoding: {encoding} (가능: {', '.join(ENCODINGS)})")
+    # 디렉터리 출력은 manifest에 없는 이전 파일 제거 (압축본은 원본 이름 기준)
+    for top in {n.split("/", 1)[0] for n in wanted if "/" in n}:
+        if not (track_dir / top).is_dir():
+            continue
+        for name, file in _output_files(track_dir / top):
+            if _strip_encoding(name) not in artifacts:
+                file.unlink()
+    result: dict[str, str] = {}
+    assets: dict[str, dict[str, Any]] = {}
+    for name in wanted:
+        entry = artifacts[name]
+        obj = Path(store_dir) / entry["object"]
+        variants = {"": obj}
+        if is_compressible(name):
+            for encoding in encodings:
+                variants[ENCODINGS[encoding]] = _encoded_object(obj, encoding)
+        published = [name]
+        if hashed_names and "/" not in name:
+            published.append(hashed_name(name, entry["hash"]))
+        for target in published:
+            for ext, src in variants.items():
+                mode = link_file(src, track_dir / f"{target}{ext}")
+                if target == name and not ext:
+                    result[name] = mode
+        if hashed_names:
+            assets[name] = {
+                "url": f"/{track}/{published[-1]}",
+                "hash": entry["hash"],
+                "size": entry["size"],
+                "encodings": [e for e in encodings if ENCODINGS[e] in variants],
+            }
+    if assets:
+        update_asset_manifest(dest_dir, track, assets)
+    return result
+
+
+def _strip_encoding(name: str) -> str:
+    for ext in ENCODINGS.values():
+        if name.endswith(ext):
+            return name[: -len(ext)]
+    return name
+
+
+def _encoded_object(obj: Path, encoding: str) -> Path:
+    """객체의 압축본 ({객체}.gz|.br). 없을 때만 만듦 (내용이 같으면 압축도 다시 하지 않음)."""
+    path = obj.with_name(obj.name + ENCODINGS[encoding])
+    if not path.exists():
+        tmp = _tmp_name(path)
+        try:
+            tmp.write_bytes(compress_bytes(obj.read_bytes(), encoding))
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return path
+
+
+def referenced_objects(store_dir: Path | str) -> set[str]:
+    """모든 트랙 manifest가 가리키는 객체 (상대 경로). 정리 도구용."""
+    refs: set[str] = set()
+    tracks = Path(store_dir) / TRACKS_DIR
+    for path in tracks.glob("*.json") if tracks.is_dir() else ():
+        refs.update(e["object"] for e in load_track_manifest(store_dir, path.stem)["artifacts"].values())
+    return refs
+
+
+def prune_objects(store_dir: Path | str) -> int:
+    """어느 manifest도 가리키지 않는 객체(와 압축본) 삭제. Returns: 삭제한 객체 수."""
+    refs = referenced_objects(store_dir)
+    objects = Path(store_dir) / OBJECTS_DIR
+    removed = 0
+    for path in objects.glob("*/*") if objects.is_dir() else ():
+        if ".tmp" not in path.name and _strip_encoding(path.relative_to(store_dir).as_posix()) not in refs:
+            path.unlink()
+            removed += 1
+    return removed
@@ -0,0 +1,368 @@
+"""
+카탈로그 일괄 추출 (extract_stages DAG를 트랙 여러 개에 적용).
+
+카탈로그 = glob·디렉터리·오디오 파일·manifest(.json / .txt) → CatalogEntry(audio_path, track).
+단계마다 별도 프로세스 풀(단계별 동시 실행 수) → 분리 워커는 모델을 한 번만 로드하고, 가벼운 단계는 더 넓게.
+트랙은 의존 단계가 끝나는 대로 다음 단계 풀에 제출 (트랙 A의 CNN과 트랙 B의 분리가 동시에 진행).
+
+체크포인트: 각 작업은 run_stages(targets=[단계])로 실행 → 끝난 단계는 stage_graph 기록이 남고,
+중단 후 같은 명령을 다시 실행하면 키가 같은 단계는 "cached"로 건너뜀 (다시 시작 = 재개).
+진행 기록(journal): 트랙별 단계 상태·오류·처리량을 단계가 끝날 때마다 원자적으로 저장.
+
+처리량: 이번 실행에서 한 단계라도 실행한 트랙 기준 tracks/hour, audio-hours/hour (= 실시간 배수).
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from audio_engine.engine.extract_stages import ExtractConfig, extract_stages, publish_outputs
+from audio_engine.engine.io import audio_info
+from audio_engine.engine.onset.warmup import warm_process
+from audio_engine.engine.stage_graph import StageResult, run_stages, topo_order
+
+BATCH_JOURNAL_VERSION = 1
+AUDIO_EXTENSIONS = (".wav", ".flac", ".mp3", ".ogg", ".m4a", ".aif", ".aiff")
+MANIFEST_SUFFIXES = (".json", ".txt")
+# 단계별 동시 실행 수 기본값: 분리는 모델 메모리가 커서 1, 대역 분할은 I/O 위주, CNN은 코어 수에 맞춰 조정
+DEFAULT_STAGE_CONCURRENCY = {"separate": 1, "band_split": 2, "cnn_band_onsets": 2, "streams_layers": 2}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    audio_path: Path
+    track: str
+
+
+def _is_audio(path: Path) -> bool:
+    return path.suffix.lower() in AUDIO_EXTENSIONS
+
+
+def _manifest_items(path: Path) -> list[tuple[str, str | None]]:
+    """
+    .json: ["a.wav", {"audio": "b.wav", "track": "b"}, ...] 또는 {"tracks": [...]}.
+    .txt: 줄마다 경로 (탭 뒤 트랙 이름 선택), # 주석·빈 줄 무시.
+    """
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        items = data.get("tracks", []) if isinstance(data, dict) else data
+        out = []
+        for item in items:
+            if isinstance(item, str):
+                out.append((item, None))
+            else:
+                out.append((item["audio"], item.get("track")))
+        return out
+    out = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        audio, _, track = line.partition("\t")
+        out.append((audio.strip(), track.strip() or None))
+    return out
+
+
+def load_catalog(sources: Iterable[Path | str]) -> list[CatalogEntry]:
+    """
+    sources 각각: manifest(.json/.txt, 상대 경로는 manifest 기준) | 디렉터리(하위 오디오 전부) | 오디오 파일 | glob.
+    같은 파일은 1번만. 트랙 이름(기본 파일명)이 다른 파일과 겹치면 ValueError
+    (stem 폴더·출력·단계 기록이 모두 트랙 이름 기준 → 섞임). manifest의 track으로 이름을 나누면 폴더도 나뉨.
+    """
+    items: list[tuple[Path, str | None]] = []
+    for src in sources:
+        path = Path(src)
+        if path.is_file() and path.suffix.lower() in MANIFEST_SUFFIXES:
+            items.extend((path.parent / audio, track) for audio, track in _manifest_items(path))
+        elif path.is_dir():
+            items.extend((p, None) for p in sorted(path.rglob("*")) if p.is_file() and _is_audio(p))
+        elif path.is_file():
+            items.append((path, None))
+        else:
+            matches = [Path(p) for p in sorted(glob.glob(str(src), recursive=True))]
+            if not matches:
+                raise FileNotFoundError(f"카탈로그 항목 없음: {src}")
+            items.extend((p, None) for p in matches if p.is_file() and _is_audio(p))
+
+    entries: list[CatalogEntry] = []
+    seen_paths: set[Path] = set()
+    tracks: dict[str, Path] = {}
+    for audio, track in items:
+        audio = audio.resolve()
+        if audio in seen_paths:
+            continue
+        if not audio.exists():
+            raise FileNotFoundError(f"오디오 파일 없음: {audio}")
+        track = track or audio.stem
+        if track in tracks:
+            raise ValueError(f"트랙 이름 중복: {track} ({tracks[track]}, {audio}) — manifest에 track 지정")
+        seen_paths.add(audio)
+        tracks[track] = audio
+        entries.append(CatalogEntry(audio, track))
+    return entries
+
+
+@dataclass
+class BatchStats:
+    """일괄 실행 처리량. processed = 이번 실행에서 한 단계라도 실행한 완료 트랙 (전부 캐시면 cached)."""
+    processed: int = 0
+    cached: int = 0
+    failed: int = 0
+    audio_sec: float = 0.0
+    wall_sec: float = 0.0
+    stage_sec: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def tracks_per_hour(self) -> float:
+        return self.processed * 3600.0 / self.wall_sec if self.wall_sec > 0 else 0.0
+
+    @property
+    def audio_hours_per_hour(self) -> float:
+        return self.audio_sec / self.wall_sec if self.wall_sec > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "cached": self.cached,
+            "failed": self.failed,
+            "audio_sec": round(self.audio_sec, 3),
+            "wall_sec": round(self.wall_sec, 3),
+            "stage_sec": {k: round(v, 3) for k, v in self.stage_sec.items()},
+            "tracks_per_hour": round(self.tracks_per_hour, 2),
+            "audio_hours_per_hour": round(self.audio_hours_per_hour, 3),
+        }
+
+
+# 단계 풀 워커 initializer 워밍업: {단계: warm_process kwargs}. 없는 단계는 Numba 캐시 경로만 설정
+# cnn_band_onsets는 madmom + librosa.load만 씀 → librosa(Numba) 워밍업 생략
+STAGE_WARMUP: dict[str, dict[str, bool]] = {
+    "cnn_band_onsets": {"librosa": False, "madmom": True},
+    "streams_layers": {"librosa": True, "madmom": False},
+}
+
+
+def _init_stage_worker(stage: str) -> None:
+    """단계 풀 워커 initializer: Numba 캐시 활성화 + 단계가 쓰는 librosa·madmom 경로 워밍업."""
+    kwargs = STAGE_WARMUP.get(stage)
+    if kwargs is None:
+        warm_process(librosa=False)
+    else:
+        warm_process(**kwargs)
+
+
+def _stage_pool(stage: str, workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=max(1, int(workers)), initializer=_init_stage_worker, initargs=(stage,))
+
+
+def _run_track_stage(cfg: ExtractConfig, stage: str, force: bool) -> list[StageResult]:
+    """워커 프로세스 작업: 단계 1개 (조상 단계는 기록이 유효하면 cached, 아니면 같이 실행)."""
+    return run_stages(
+        extract_stages(), cfg, cfg.track, cfg.stage_state_dir, targets=[stage], force=[stage] if force else ()
+    )
+
+
+def _track_duration(results: dict[str, StageResult]) -> float:
+    """처리한 오디오 길이 (초). drums stem(wav/flac) 헤더 기준, 읽을 수 없으면 0."""
+    drums = results.get("separate", StageResult("separate", "skipped")).outputs.get("drums")
+    if drums is None:
+        return 0.0
+    try:
+        return float(audio_info(drums)[0])
+    except Exception:
+        return 0.0
+
+
+def _save_journal(path: Path, journal: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(journal, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def run_batch(
+    entries: list[CatalogEntry],
+    *,
+    config_kwargs: dict[str, Any] | None = None,
+    concurrency: dict[str, int] | None = None,
+    targets: Iterable[str] | None = None,
+    force: Iterable[str] = (),
+    journal_path: Path | str | None = None,
+    publish_dir: Path | str | None = None,
+    on_event: Callable[[str, str, StageResult | None, str | None], None] | None = None,
+) -> BatchStats:
+    """
+    카탈로그 트랙마다 extract_stages(targets까지)를 단계별 프로세스 풀로 실행.
+    config_kwargs: ExtractConfig.from_audio 인자 (backend, stem_format, cnn_runtime 등; 트랙 공통).
+    concurrency: {단계: 동시 실행 수} (DEFAULT_STAGE_CONCURRENCY 덮어쓰기).
+    force: 모든 트랙에서 다시 실행할 단계. journal_path: 진행 기록 JSON (None이면 기록 안 함).
+    publish_dir: 트랙이 끝나면 분석 출력 게시 위치 (None이면 artifact 저장소에만 기록).
+    on_event(track, stage, result, error): 단계 완료·실패마다 호출.
+    실패한 트랙은 하위 단계를 건너뛰고 다른 트랙은 계속 진행 (다시 실행하면 실패 단계부터).
+    워커가 비정상 종료되면 그 단계 풀만 새로 만들고, 영향받은 작업은 1개씩 다시 실행해 원인 작업만 실패 처리.
+    """
+    config_kwargs = dict(config_kwargs or {})
+    config_kwargs.setdefault("max_workers", None)  # 단계 풀 안에서 대역별 풀을 또 만들지 않음
+    stages = topo_order(extract_stages(), targets)
+    names = [s.name for s in stages]
+    deps = {s.name: s.deps for s in stages}
+    limits = {**DEFAULT_STAGE_CONCURRENCY, **(concurrency or {})}
+    force = set(force)
+    configs = {e.track: ExtractConfig.from_audio(e.audio_path, track=e.track, **config_kwargs) for e in entries}
+
+    journal: dict[str, Any] = {
+        "version": BATCH_JOURNAL_VERSION,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": names,
+        "concurrency": {name: limits.get(name, 1) for name in names},
+        "tracks": {
+            e.track: {"audio": str(e.audio_path), "status": "pending", "stages": {}, "error": None} for e in entries
+        },
+    }
+    stats = BatchStats(stage_sec={name: 0.0 for name in names})
+    results: dict[str, dict[str, StageResult]] = {e.track: {} for e in entries}
+    submitted: dict[str, set[str]] = {e.track: set() for e in entries}
+    pools = {name: _stage_pool(name, limits.get(name, 1)) for name in names}
+    futures: dict[Future, tuple[str, str, ProcessPoolExecutor]] = {}
+    # 풀이 깨진 뒤(워커 비정상 종료) 영향받은 작업은 한 번에 1개씩 다시 실행 → 다시 깨지면 그 작업이 원인
+    probe_queue: dict[str, list[str]] = {name: [] for name in names}
+    probe_active: dict[str, str | None] = {name: None for name in names}
+    start = time.perf_counter()
+
+    def save() -> None:
+        if journal_path is not None:
+            stats.wall_sec = time.perf_counter() - start
+            journal["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            journal["stats"] = stats.as_dict()
+            _save_journal(Path(journal_path), journal)
+
+    def submit(track: str, name: str) -> None:
+        if probe_active[name] is not None or probe_queue[name]:
+            probe_queue[name].append(track)
+            return
+        fut = pools[name].submit(_run_track_stage, configs[track], name, name in force)
+        futures[fut] = (track, name, pools[name])
+
+    def next_probe(name: str) -> None:
+        if probe_active[name] is None and probe_queue[name]:
+            track = probe_queue[name].pop(0)
+            probe_active[name] = track
+            fut = pools[name].submit(_run_track_stage, configs[track], name, name in force)
+            futures[fut] = (track, name, pools[name])
+
+    def submit_ready(track: str) -> None:
+        for name in names:
+            if name in submitted[track] or not all(d in results[track] for d in deps[name]):
+                continue
+            submitted[track].add(name)
+            submit(track, name)
+        journal["tracks"][track]["status"] = "running"
+
+    def pool_broken(track: str, name: str, pool: ProcessPoolExecutor, exc: BaseException) -> None:
+        """
+        워커 비정상 종료 (메모리 부족 등): 그 풀의 미완료 작업은 모두 BrokenProcessPool.
+        단독 실행 중이었으면 그 작업 실패, 아니면 원인을 알 수 없으므로 영향받은 작업 전부를 1개씩 다시 실행.
+        """
+        affected = [track]
+        for other, (t, n, p) in list(futures.items()):
+            if p is pool and not (other.done() and other.exception() is None):
+                del futures[other]
+                affected.append(t)
+        if pools[name] is pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            pools[name] = _stage_pool(name, limits.get(name, 1))
+        if probe_active[name] == track:
+            probe_active[name] = None
+        if len(affected) == 1:
+            fail(track, name, exc)
+        else:
+            probe_queue[name][:0] = affected
+        next_probe(name)
+
+    def fail(track: str, name: str, exc: BaseException) -> None:
+        entry = journal["tracks"][track]
+        entry["stages"][name] = {"status": "failed"}
+        if entry["status"] == "failed":
+            return
+        entry["status"] = "failed"
+        entry["error"] = f"{name}: {type(exc).__name__}: {exc}"
+        stats.failed += 1
+        if on_event is not None:
+            on_event(track, name, None, entry["error"])
+
+    def finish_track(track: str) -> None:
+        entry = journal["tracks"][track]
+        track_results = results[track]
+        publish_outputs(configs[track], list(track_results.values()), publish_dir=publish_dir)
+        if any(r.status == "ran" for r in track_results.values()):
+            stats.processed += 1
+            stats.audio_sec += _track_duration(track_results)
+        else:
+            stats.cached += 1
+        entry["status"] = "done"
+
+    try:
+        for e in entries:
+            submit_ready(e.track)
+        save()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut not in futures:  # pool_broken이 이미 다시 실행 대기열로 옮긴 작업
+                    continue
+                track, name, pool = futures.pop(fut)
+                entry = journal["tracks"][track]
+                try:
+                    stage_results = fut.result()
+                except BrokenProcessPool as exc:
+                    pool_broken(track, name, pool, exc)
+                    save()
+                    continue
+                except Exception as exc:
+                    if probe_active[name] == track:
+                        probe_active[name] = None
+                        next_probe(name)
+                    fail(track, name, exc)
+                    save()
+                    continue
+                if probe_active[name] == track:
+                    probe_active[name] = None
+                    next_probe(name)
+                for r in stage_results:
+                    # 조상 단계는 보통 cached (같은 트랙의 앞 작업이 기록) → 대상 단계 결과만 집계
+                    if r.name == name or r.name not in results[track]:
+                        results[track][r.name] = r
+                target = results[track][name]
+                stats.stage_sec[name] += target.wall_sec
+                entry["stages"][name] = {"status": target.status, "wall_sec": round(target.wall_sec, 3)}
+                if on_event is not None:
+                    on_event(track, name, target, None)
+                if entry["status"] != "failed":
+                    if all(n in results[track] for n in names):
+                        try:
+                            finish_track(track)
+                        except Exception as exc:
+                            fail(track, "publish", exc)
+                    else:
+                        submit_ready(track)
+                save()
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        stats.wall_sec = time.perf_counter() - start
+        for entry in journal["tracks"].values():
+            if entry["status"] == "running":
+                entry["status"] = "interrupted"
+        save()
+    return stats
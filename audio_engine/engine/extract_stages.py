@@ -0,0 +1,351 @@
+"""
+추출 파이프라인 단계 정의 (stage_graph DAG).
+번호 스크립트 02_split_stem → 04_split_drum_by_band → 10_cnn_band_onsets → 11_cnn_streams_layers와 같은 처리를
+한 번의 실행으로 묶음. 단계 키 = 입력 content hash + 설정 + onset 상수 → 바뀐 단계와 그 하위만 다시 실행.
+
+    separate          오디오 → stems/{모델}/{track}/{stem}.{wav|flac}   (stem_cache 공유)
+    band_split        drums → drum_{low,mid,high}                       (04)
+    cnn_band_onsets   drum 대역 → cnn_band_onsets.json + .spec/          (10)
+    streams_layers    drum 대역 → streams_sections_cnn.json + .lod/ + .peaks (11)
+
+streams_layers는 cnn_band_onsets 뒤에 실행 → 같은 대역의 CNN activation은 캐시 hit (ODF만 계산),
+두 단계가 같은 activation을 동시에 추론·저장하지 않음.
+
+출력은 out_dir(기본 samples/cache/outputs/{track}) 아래 고정 이름 → publish_outputs가 artifact 저장소·web/public/{track}/에 게시.
+문서 안 참조(spectrogram·event_pyramid·waveform_peaks)는 문서 기준 상대 경로 → 게시 위치와 무관.
+CLI: scripts/extract.py. 일괄 실행: 같은 extract_stages()를 트랙마다 run_stages로 실행.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from audio_engine.engine import stems
+from audio_engine.engine.artifact_store import store_outputs
+from audio_engine.engine.io import DEFAULT_STEM_FORMAT, load_audio, stem_file
+from audio_engine.engine.onset import constants
+from audio_engine.engine.onset.constants import CNN_RUNTIME, DEFAULT_POINT_COLOR
+from audio_engine.engine.stage_graph import Stage, StageResult
+from audio_engine.engine.web_assets import available_encodings
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SAMPLES_DIR = PROJECT_ROOT / "audio_engine" / "samples"
+CACHE_DIR = SAMPLES_DIR / "cache"
+WEB_PUBLIC_DIR = PROJECT_ROOT / "web" / "public"
+
+# 이벤트가 이보다 많으면 JSON에는 넣지 않고 LOD 피라미드로만 제공 (긴 트랙 첫 로드 속도)
+INLINE_EVENTS_MAX = 5000
+LAYER_COLORS = {"P0": "#2ecc71", "P1": "#f39c12", "P2": "#3498db"}
+
+
+@dataclass(frozen=True)
+class ExtractConfig:
+    """트랙 1개 추출 설정. 경로 기본값은 from_audio 참고."""
+    audio_path: Path
+    track: str
+    stems_dir: Path
+    out_dir: Path
+    cache_dir: Path = CACHE_DIR
+    backend: str = "demucs"
+    model_name: str = "htdemucs"
+    stem_format: str = DEFAULT_STEM_FORMAT
+    cnn_runtime: str = CNN_RUNTIME
+    max_workers: int | None = None
+
+    @classmethod
+    def from_audio(cls, audio_path: Path | str, track: str | None = None, **kwargs: Any) -> "ExtractConfig":
+        """track 기본값 = 파일명(확장자 제외). stems_dir = samples/stems, out_dir = samples/cache/outputs/{track}."""
+        audio_path = Path(audio_path).resolve()
+        track = track or audio_path.stem
+        kwargs.setdefault("stems_dir", SAMPLES_DIR / "stems")
+        kwargs.setdefault("out_dir", CACHE_DIR / "outputs" / track)
+        return cls(audio_path=audio_path, track=track, **kwargs)
+
+    @property
+    def stage_state_dir(self) -> Path:
+        return self.cache_dir / "stages"
+
+    @property
+    def artifact_store_dir(self) -> Path:
+        return self.cache_dir / "artifacts"
+
+    @property
+    def activation_cache_dir(self) -> Path:
+        return self.cache_dir / "activations"
+
+
+def onset_constants() -> dict[str, Any]:
+    """onset/constants.py의 대문자 상수 전체 (튜닝 값이 바뀌면 분석 단계 키가 바뀜)."""
+    return {k: v for k, v in vars(constants).items() if k.isupper()}
+
+
+def extract_keypoints(streams: list[dict], sections: list[dict]) -> list[dict]:
+    """섹션 경계 + 스트림 accent 시점을 키포인트로 추출."""
+    keypoints = []
+    seen = set()
+    for sec in sections:
+        t_start = round(float(sec.get("start", 0)), 4)
+        t_end = round(float(sec.get("end", 0)), 4)
+        sid = sec.get("id", 0)
+        if t_start not in seen:
+            seen.add(t_start)
+            keypoints.append({
+                "time": t_start,
+                "type": "section_boundary",
+                "section_id": sid,
+                "label": "섹션 시작",
+            })
+        if t_end not in seen:
+            seen.add(t_end)
+            keypoints.append({
+                "time": t_end,
+                "type": "section_boundary",
+                "section_id": sid,
+                "label": "섹션 끝",
+            })
+    for s in streams:
+        stream_id = s.get("id", "")
+        for t in s.get("accents") or []:
+            t = round(float(t), 4)
+            if t not in seen:
+                seen.add(t)
+                keypoints.append({
+                    "time": t,
+                    "type": "accent",
+                    "stream_id": stream_id,
+                    "label": "accent",
+                })
+    keypoints.sort(key=lambda x: x["time"])
+    return keypoints
+
+
+def stream_events(streams: list[dict]) -> list[dict]:
+    """스트림별 이벤트 → 시간순 평탄 이벤트 목록 (layer 색 포함)."""
+    events_out = []
+    for s in streams:
+        layer = s.get("layer", "P2")
+        evs = s.get("events") or []
+        str_list = s.get("strengths") or []
+        for i, t in enumerate(evs):
+            str_val = float(str_list[i]) if i < len(str_list) else s.get("strength_median", 0)
+            events_out.append({
+                "time": round(float(t), 4),
+                "t": round(float(t), 4),
+                "band": s.get("band", ""),
+                "stream_id": s.get("id", ""),
+                "layer": layer,
+                "strength": round(float(str_val), 4),
+                "color": LAYER_COLORS.get(layer, DEFAULT_POINT_COLOR),
+            })
+    events_out.sort(key=lambda e: e["time"])
+    return events_out
+
+
+def write_cnn_band_onsets(
+    stem_folder: Path | str,
+    out_dir: Path | str,
+    *,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """
+    (10) stem 폴더의 drum 대역 → out_dir/cnn_band_onsets.json + cnn_band_onsets.spec/ (drums 스펙트로그램 타일).
+    Returns: {"json": 경로, "spec": 디렉터리}
+    """
+    from audio_engine.engine.onset import (
+        compute_cnn_band_onsets,
+        stft_magnitude,
+        write_drum_band_energy_json,
+        write_spectrogram_tiles,
+    )
+
+    stem_folder, out_dir = Path(stem_folder), Path(out_dir)
+    result = compute_cnn_band_onsets(
+        stem_folder.name, stem_folder.parent, cache_dir=cache_dir, cnn_runtime=cnn_runtime, max_workers=max_workers
+    )
+    # 대역 행 배경용 스펙트로그램 (분석과 같은 n_fft·hop, 원본 sr)
+    drums_y, drums_sr = load_audio(stem_file(stem_folder, "drums"), sr=None)
+    spec_manifest = write_spectrogram_tiles(
+        stft_magnitude(drums_y), drums_sr, out_dir / "cnn_band_onsets.spec", source=stem_folder.name
+    )
+    result["spectrogram"] = f"{spec_manifest.parent.name}/{spec_manifest.name}"
+    json_path = out_dir / "cnn_band_onsets.json"
+    write_drum_band_energy_json(result, json_path)
+    return {"json": json_path, "spec": spec_manifest.parent}
+
+
+def write_streams_layers(
+    stem_folder: Path | str,
+    out_dir: Path | str,
+    *,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """
+    (11) CNN + ODF → 스트림·레이어(P0/P1/P2)·섹션 → out_dir/streams_sections_cnn.json
+    + .lod/ (이벤트 LOD 피라미드) + .peaks (drums 파형 피크).
+    Returns: {"json": 경로, "lod": 디렉터리, "peaks": 경로}
+    """
+    from audio_engine.engine.onset import (
+        assign_layer_to_streams,
+        build_streams,
+        compute_cnn_band_onsets_with_odf,
+        segment_sections,
+        segment_sections_hierarchical,
+        simplify_shaker_clap_streams,
+        write_event_pyramid,
+        write_streams_sections_json,
+        write_waveform_peaks,
+    )
+
+    stem_folder, out_dir = Path(stem_folder), Path(out_dir)
+    band_onsets, band_strengths, duration, sr = compute_cnn_band_onsets_with_odf(
+        stem_folder.name, stem_folder.parent, cache_dir=cache_dir, cnn_runtime=cnn_runtime, max_workers=max_workers
+    )
+    streams = build_streams(band_onsets, band_strengths)
+    simplify_shaker_clap_streams(streams)
+    layer_map = assign_layer_to_streams(streams)
+    for s in streams:
+        s["layer"] = layer_map.get(s["id"], "P2")
+    sections = segment_sections(streams, duration)
+    section_tree = segment_sections_hierarchical(streams, duration)
+    keypoints = extract_keypoints(streams, sections)
+    events_out = stream_events(streams)
+
+    pyramid_index = write_event_pyramid(
+        events_out, out_dir / "streams_sections_cnn.lod", duration_sec=duration, source=stem_folder.name
+    )
+    drums_y, drums_sr = load_audio(stem_file(stem_folder, "drums"), sr=None)
+    peaks_path = write_waveform_peaks(drums_y, drums_sr, out_dir / "streams_sections_cnn.peaks")
+    json_path = out_dir / "streams_sections_cnn.json"
+    write_streams_sections_json(
+        json_path,
+        source=stem_folder.name,
+        sr=sr,
+        duration_sec=duration,
+        streams=streams,
+        sections=sections,
+        keypoints=keypoints,
+        events=events_out if len(events_out) <= INLINE_EVENTS_MAX else None,
+        section_tree=section_tree,
+        event_pyramid=f"{pyramid_index.parent.name}/{pyramid_index.name}",
+        waveform_peaks=peaks_path.name,
+    )
+    return {"json": json_path, "lod": pyramid_index.parent, "peaks": peaks_path}
+
+
+def _stem_folder(upstream: dict[str, dict[str, Path]]) -> Path:
+    return upstream["separate"]["drums"].parent
+
+
+def _run_separate(cfg: ExtractConfig, upstream: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    paths = stems.separate(
+        str(cfg.audio_path),
+        out_dir=str(cfg.stems_dir),
+        model_name=cfg.model_name,
+        backend=cfg.backend,
+        cache_dir=str(cfg.cache_dir / "stems"),
+        stem_format=cfg.stem_format,
+        track_name=cfg.track,
+    )
+    return {name: Path(p) for name, p in paths.items()}
+
+
+def _run_band_split(cfg: ExtractConfig, upstream: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    from audio_engine.engine.onset.band_split import load_drum_bands, write_band_files
+
+    drums = upstream["separate"]["drums"]
+    written = write_band_files(load_drum_bands(drums), drums.parent, cfg.stem_format)
+    return {f"drum_{band}": path for band, path in written.items()}
+
+
+def _run_cnn_band_onsets(cfg: ExtractConfig, upstream: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    return write_cnn_band_onsets(
+        _stem_folder(upstream),
+        cfg.out_dir,
+        cache_dir=cfg.activation_cache_dir,
+        cnn_runtime=cfg.cnn_runtime,
+        max_workers=cfg.max_workers,
+    )
+
+
+def _run_streams_layers(cfg: ExtractConfig, upstream: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    return write_streams_layers(
+        _stem_folder(upstream),
+        cfg.out_dir,
+        cache_dir=cfg.activation_cache_dir,
+        cnn_runtime=cfg.cnn_runtime,
+        max_workers=cfg.max_workers,
+    )
+
+
+def _analysis_params(cfg: ExtractConfig) -> dict[str, Any]:
+    # max_workers는 결과에 영향 없음 → 키 제외
+    return {"cnn_runtime": cfg.cnn_runtime, "out_dir": str(cfg.out_dir), "constants": onset_constants()}
+
+
+def extract_stages() -> list[Stage]:
+    """02 → 04 → 10 → 11 단계 (11은 10이 남긴 CNN activation 캐시 재사용)."""
+    return [
+        Stage(
+            "separate",
+            _run_separate,
+            inputs=lambda cfg: {"audio": cfg.audio_path},
+            params=lambda cfg: {
+                "backend": cfg.backend,
+                "model_name": cfg.model_name if cfg.backend == "demucs" else None,
+                "stem_format": cfg.stem_format,
+                "stems_dir": str(cfg.stems_dir),
+                "track": cfg.track,  # stem 폴더 = stems_dir / backend / track
+            },
+        ),
+        Stage(
+            "band_split",
+            _run_band_split,
+            deps=("separate",),
+            params=lambda cfg: {
+                "stem_format": cfg.stem_format,
+                "band_hz": constants.BAND_HZ,
+            },
+        ),
+        Stage("cnn_band_onsets", _run_cnn_band_onsets, deps=("separate", "band_split"), params=_analysis_params),
+        Stage(
+            "streams_layers",
+            _run_streams_layers,
+            deps=("separate", "band_split", "cnn_band_onsets"),
+            params=_analysis_params,
+        ),
+    ]
+
+
+PUBLISHED_STAGES = ("cnn_band_onsets", "streams_layers")
+
+
+def publish_outputs(
+    cfg: ExtractConfig,
+    results: list[StageResult],
+    publish_dir: Path | str | None = None,
+) -> dict[str, str]:
+    """
+    실행·캐시된 분석 단계 출력 → artifact 저장소(트랙 manifest) + publish_dir 게시 (.gz/.br·hash 파일명).
+    캐시된 단계도 매번 호출 (내용이 같으면 저장소는 "unchanged", web/public만 필요 시 다시 링크).
+    """
+    paths = [
+        path
+        for r in results
+        if r.name in PUBLISHED_STAGES and r.status != "skipped"
+        for path in r.outputs.values()
+    ]
+    if not paths:
+        return {}
+    return store_outputs(
+        cfg.artifact_store_dir,
+        cfg.track,
+        paths,
+        publish_dir=publish_dir,
+        encodings=available_encodings(),
+        hashed_names=True,
+    )
@@ -1,3 +1,140 @@
 """
 오디오 파일 로드/저장 및 리샘플링 유틸리티
+
+stem 파일(Demucs 출력, drum_{band})은 WAV 또는 FLAC (둘 다 16-bit PCM).
+엔진의 모든 stem 읽기는 stem_file / load_audio / audio_info (madmom은 madmom_processors.load_signal)를 거치므로
+저장 형식을 바꿔도 다른 코드는 그대로. 이름으로 찾을 때 STEM_EXTENSIONS 순서대로 있는 파일 사용.
 """
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+# stem 저장 형식: 이름 → (확장자, soundfile format, subtype). FLAC은 무손실, 드럼 대역 stem 기준 WAV 대비 수 배 작음
+STEM_FORMATS: dict[str, tuple[str, str, str]] = {
+    "wav": (".wav", "WAV", "PCM_16"),
+    "flac": (".flac", "FLAC", "PCM_16"),
+}
+DEFAULT_STEM_FORMAT = "wav"
+STEM_EXTENSIONS = tuple(ext for ext, _, _ in STEM_FORMATS.values())
+
+
+def stem_file(folder: Path | str, name: str) -> Path:
+    """
+    folder 안의 stem 파일 (name = 확장자 없는 이름, 예: "drums", "drum_low").
+    STEM_EXTENSIONS 중 존재하는 첫 파일. 없으면 기본 형식 경로 (exists() False → 호출 측 FileNotFoundError 메시지용).
+    """
+    folder = Path(folder)
+    for ext in STEM_EXTENSIONS:
+        path = folder / f"{name}{ext}"
+        if path.exists():
+            return path
+    return folder / f"{name}{STEM_FORMATS[DEFAULT_STEM_FORMAT][0]}"
+
+
+def load_audio(
+    path: Path | str,
+    sr: int | None = 22050,
+    mono: bool = True,
+) -> tuple[np.ndarray, int]:
+    """librosa.load와 같은 결과 (float32, sr 리샘플링, mono 다운믹스). WAV·FLAC은 soundfile, 그 외는 audioread."""
+    import librosa
+
+    return librosa.load(str(path), sr=sr, mono=mono)
+
+
+def audio_info(path: Path | str) -> tuple[float, int]:
+    """(길이 초, 샘플레이트). 헤더만 읽음."""
+    import soundfile as sf
+
+    info = sf.info(str(path))
+    return info.duration, info.samplerate
+
+
+def write_audio(
+    path: Path | str,
+    samples: np.ndarray,
+    sr: int,
+    stem_format: str = DEFAULT_STEM_FORMAT,
+) -> Path:
+    """
+    samples (frames[, channels]) float → 16-bit PCM stem 파일. path의 확장자는 stem_format 기준으로 교체.
+    임시 파일 → rename (기존 파일이 캐시 하드링크여도 원본 내용은 바뀌지 않음). Returns: 실제 기록 경로.
+    """
+    import soundfile as sf
+
+    if stem_format not in STEM_FORMATS:
+        raise ValueError(f"알 수 없는 stem 형식: {stem_format} (가능: {', '.join(STEM_FORMATS)})")
+    ext, fmt, subtype = STEM_FORMATS[stem_format]
+    path = Path(path).with_suffix(ext)
+    tmp = path.with_name(path.name + ".tmp")
+    sf.write(str(tmp), samples, sr, subtype=subtype, format=fmt)
+    tmp.replace(path)
+    drop_stem_variants(path)
+    return path
+
+
+def drop_stem_variants(path: Path | str) -> None:
+    """path와 이름이 같고 확장자만 다른 stem 파일 삭제 (형식 전환 후 stem_file이 이전 형식을 먼저 찾지 않도록)."""
+    path = Path(path)
+    for ext in STEM_EXTENSIONS:
+        other = path.with_suffix(ext)
+        if other != path and (other.exists() or other.is_symlink()):
+            other.unlink()
+
+
+def file_content_hash(path: Path | str, algorithm: str = "sha256") -> str:
+    """파일 바이트 기준 content hash (hex). 파일명·경로와 무관하게 같은 내용이면 같은 값."""
+    h = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK_BYTES)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def array_content_hash(samples: np.ndarray, sr: int, algorithm: str = "sha256") -> str:
+    """메모리 내 오디오(샘플 배열 + sr) content hash (hex). dtype·shape 포함 → 같은 신호·형식이면 같은 값."""
+    samples = np.ascontiguousarray(samples)
+    h = hashlib.new(algorithm)
+    h.update(f"{samples.dtype.str}|{samples.shape}|{int(sr)}|".encode("ascii"))
+    h.update(samples.data)
+    return h.hexdigest()
+
+
+def link_file(src: Path | str, dst: Path | str) -> str:
+    """
+    src를 dst에 게시. 하드링크 → (다른 파일시스템이면) 심볼릭 링크 → 복사 순으로 시도.
+    dst가 이미 src와 같은 파일이면 아무것도 하지 않음. Returns: "existing" | "hardlink" | "symlink" | "copy".
+    """
+    src, dst = Path(src), Path(dst)
+    if dst.exists() and os.path.samefile(src, dst):
+        return "existing"
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # 게시자마다 다른 임시 이름 (배치 워커·extract CLI가 같은 dst에 동시에 게시해도 서로의 임시 파일을 건드리지 않음)
+    tmp = dst.with_name(f"{dst.name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
+    try:
+        try:
+            os.link(src, tmp)
+            mode = "hardlink"
+        except OSError:
+            try:
+                os.symlink(src.resolve(), tmp)
+                mode = "symlink"
+            except OSError:
+                shutil.copy2(src, tmp)
+                mode = "copy"
+        # 기존 dst 교체 (rename은 원자적, 열려 있는 기존 파일 내용은 건드리지 않음)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return mode
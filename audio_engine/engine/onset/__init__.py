@@ -1,7 +1,14 @@
 """
 Onset 기반 레이어링 엔진.
 L1+L2+L3+L4+L5 공개 API re-export (스크립트/CLI용).
+L1(상수·타입·utils)만 즉시 import. 나머지는 첫 속성 접근 시 해당 서브모듈만 import (PEP 562)
+→ build_streams·segment_sections만 쓰는 호출은 librosa·scipy.signal·madmom을 로드하지 않음.
 """
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 # L1
 from audio_engine.engine.onset.types import OnsetContext
 from audio_engine.engine.onset.constants import (
@@ -15,56 +22,109 @@ from audio_engine.engine.onset.constants import (
 )
 from audio_engine.engine.onset.utils import robust_norm
 
-# L2
-from audio_engine.engine.onset.pipeline import (
-    detect_onsets,
-    refine_onset_times,
-    build_context,
-    build_context_with_band_evidence,
-)
-from audio_engine.engine.onset.band_classification import compute_band_hz
+# 공개 이름 → 서브모듈 (audio_engine.engine.onset 기준 상대 경로)
+_LAZY_ATTRS: dict[str, str] = {
+    # L2
+    "detect_onsets": "pipeline",
+    "refine_onset_times": "pipeline",
+    "build_context": "pipeline",
+    "build_context_with_band_evidence": "pipeline",
+    "compute_band_hz": "band_classification",
 
-# L3
-from audio_engine.engine.onset.features.energy import compute_energy
-from audio_engine.engine.onset.features.clarity import compute_clarity
-from audio_engine.engine.onset.features.temporal import compute_temporal
-from audio_engine.engine.onset.features.spectral import compute_spectral
-from audio_engine.engine.onset.features.context import compute_context_dependency
+    # L3
+    "compute_energy": "features.energy",
+    "compute_clarity": "features.clarity",
+    "compute_temporal": "features.temporal",
+    "compute_spectral": "features.spectral",
+    "compute_context_dependency": "features.context",
 
-# L4
-from audio_engine.engine.onset.scoring import (
-    normalize_metrics_per_track,
-    assign_roles_by_band,
-)
+    # L4
+    "normalize_metrics_per_track": "scoring",
+    "assign_roles_by_band": "scoring",
 
-# Streams / Sections
-from audio_engine.engine.onset.streams import build_streams
-from audio_engine.engine.onset.sections import segment_sections
+    # Streams / Sections
+    "build_streams": "streams",
+    "segment_sections": "sections",
+    "segment_sections_hierarchical": "sections",
+    "sections_at_level": "sections",
 
-# Drum band energy (stem 폴더 기반 low/mid/high onset 에너지)
-from audio_engine.engine.onset.drum_band_energy import compute_drum_band_energy
-from audio_engine.engine.onset.madmom_drum_band import compute_madmom_drum_band_keypoints
-from audio_engine.engine.onset.cnn_band_onsets import compute_cnn_band_onsets
-from audio_engine.engine.onset.cnn_band_pipeline import compute_cnn_band_onsets_with_odf
-from audio_engine.engine.onset.stream_layer import assign_layer_to_streams
-from audio_engine.engine.onset.stream_simplify import simplify_shaker_clap_streams
-from audio_engine.engine.onset.band_onset_merge import (
-    merge_close_onsets,
-    merge_close_band_onsets,
-    filter_by_strength,
-)
+    # Drum band energy (stem 폴더 기반 low/mid/high onset 에너지)
+    "compute_drum_band_energy": "drum_band_energy",
+    "compute_madmom_drum_band_keypoints": "madmom_drum_band",
+    "compute_cnn_band_onsets": "cnn_band_onsets",
+    "compute_cnn_band_onsets_with_odf": "cnn_band_pipeline",
+    "compute_cnn_band_onsets_with_odf_batch": "cnn_band_pipeline",
+    "compute_cnn_band_onsets_from_bands": "cnn_band_pipeline",
+    "BandAudio": "band_split",
+    "split_bands": "band_split",
+    "load_drum_bands": "band_split",
+    "OnsetDetector": "detectors",
+    "OnsetDetection": "detectors",
+    "get_onset_detector": "detectors",
+    "detector_throughput": "detectors",
+    "peak_pick_sweep": "peak_sweep",
+    "peak_count_sweep": "peak_sweep",
+    "sweep_cnn_band_thresholds": "peak_sweep",
+    "CnnOnsetRuntime": "cnn_runtime",
+    "get_cnn_runtime": "cnn_runtime",
+    "warmup": "warmup",
+    "enable_numba_cache": "warmup",
+    "assign_layer_to_streams": "stream_layer",
+    "simplify_shaker_clap_streams": "stream_simplify",
+    "merge_close_onsets": "band_onset_merge",
+    "merge_close_band_onsets": "band_onset_merge",
+    "filter_by_strength": "band_onset_merge",
+
+    # L5
+    "write_energy_json": "export",
+    "write_clarity_json": "export",
+    "write_temporal_json": "export",
+    "write_spectral_json": "export",
+    "write_context_json": "export",
+    "write_layered_json": "export",
+    "write_streams_sections_json": "export",
+    "write_drum_band_energy_json": "export",
+    "build_energy_doc": "export",
+    "build_clarity_doc": "export",
+    "build_temporal_doc": "export",
+    "build_spectral_doc": "export",
+    "build_context_doc": "export",
+    "build_layered_doc": "export",
+    "build_streams_sections_doc": "export",
+    "build_feature_sections": "bundle",
+    "write_analysis_bundle": "bundle",
+    "read_analysis_bundle": "bundle",
+    "read_bundle_index": "bundle",
+    "build_event_pyramid": "event_pyramid",
+    "write_event_pyramid": "event_pyramid",
+    "read_event_pyramid_index": "event_pyramid",
+    "build_peak_pyramid": "waveform_peaks",
+    "write_waveform_peaks": "waveform_peaks",
+    "read_waveform_peaks": "waveform_peaks",
+    "stft_magnitude": "spectrogram_tiles",
+    "build_spectrogram_tiles": "spectrogram_tiles",
+    "write_spectrogram_tiles": "spectrogram_tiles",
+    "read_spectrogram_manifest": "spectrogram_tiles",
+    "write_event_doc": "columnar",
+    "read_event_doc": "columnar",
+    "read_event_columns": "columnar",
+    "to_columnar": "columnar",
+    "from_columnar": "columnar",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # 이후 접근은 __getattr__ 없이 바로 조회
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# L5
-from audio_engine.engine.onset.export import (
-    write_energy_json,
-    write_clarity_json,
-    write_temporal_json,
-    write_spectral_json,
-    write_context_json,
-    write_layered_json,
-    write_streams_sections_json,
-    write_drum_band_energy_json,
-)
 
 __all__ = [
     "OnsetContext",
@@ -97,14 +157,58 @@ __all__ = [
     "write_streams_sections_json",
     "build_streams",
     "segment_sections",
+    "segment_sections_hierarchical",
+    "sections_at_level",
     "compute_drum_band_energy",
     "compute_madmom_drum_band_keypoints",
     "compute_cnn_band_onsets",
     "compute_cnn_band_onsets_with_odf",
+    "compute_cnn_band_onsets_with_odf_batch",
+    "compute_cnn_band_onsets_from_bands",
+    "BandAudio",
+    "split_bands",
+    "load_drum_bands",
+    "OnsetDetector",
+    "OnsetDetection",
+    "get_onset_detector",
+    "detector_throughput",
+    "peak_pick_sweep",
+    "peak_count_sweep",
+    "sweep_cnn_band_thresholds",
+    "CnnOnsetRuntime",
+    "get_cnn_runtime",
+    "warmup",
+    "enable_numba_cache",
     "assign_layer_to_streams",
     "simplify_shaker_clap_streams",
     "merge_close_onsets",
     "merge_close_band_onsets",
     "filter_by_strength",
     "write_drum_band_energy_json",
+    "build_energy_doc",
+    "build_clarity_doc",
+    "build_temporal_doc",
+    "build_spectral_doc",
+    "build_context_doc",
+    "build_layered_doc",
+    "build_streams_sections_doc",
+    "build_feature_sections",
+    "write_analysis_bundle",
+    "read_analysis_bundle",
+    "read_bundle_index",
+    "build_event_pyramid",
+    "write_event_pyramid",
+    "read_event_pyramid_index",
+    "build_peak_pyramid",
+    "write_waveform_peaks",
+    "read_waveform_peaks",
+    "stft_magnitude",
+    "build_spectrogram_tiles",
+    "write_spectrogram_tiles",
+    "read_spectrogram_manifest",
+    "write_event_doc",
+    "read_event_doc",
+    "read_event_columns",
+    "to_columnar",
+    "from_columnar",
 ]
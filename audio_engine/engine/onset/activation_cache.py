@@ -0,0 +1,116 @@
+"""
+CNN/ODF activation 디스크 캐시.
+stem 파일 content hash로 키잉, 모델 식별자(madmom 버전·모델 파일·ODF 방식)를 함께 저장해 불일치 시 miss.
+cnn_threshold, STRENGTH_FLOOR_*, MERGE_CLOSE_SEC_* 는 activation에 영향이 없으므로
+튜닝 시 peak picking 이후 단계만 캐시에서 재실행.
+"""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from audio_engine.engine.io import file_content_hash
+
+ACTIVATION_CACHE_VERSION = 1
+# float32 = 원본 activation 그대로 (무손실). float16이면 용량 절반, peak 결과가 경계값에서 달라질 수 있음.
+ACTIVATION_CACHE_DTYPE = "float32"
+
+
+def model_identity(kind: str) -> str:
+    """
+    kind: "cnn" | "cnn_numpy" | "superflux" | "complex_flux" | "rnn".
+    캐시 항목의 모델 식별자. madmom 버전, 모델 파일명, 캐시 포맷 버전 포함.
+    """
+    from audio_engine.engine.onset.madmom_processors import ensure_madmom_compat
+
+    ensure_madmom_compat()
+    import madmom
+    from madmom.models import ONSETS_CNN, ONSETS_RNN
+
+    if kind.startswith("cnn"):
+        model = ",".join(Path(p).name for p in ONSETS_CNN)
+    elif kind == "rnn":
+        model = ",".join(Path(p).name for p in ONSETS_RNN)
+    else:
+        model = kind
+    return f"madmom-{madmom.__version__}/{model}/v{ACTIVATION_CACHE_VERSION}"
+
+
+def cnn_cache_kind(cnn_runtime: str) -> str:
+    """CNN 런타임별 캐시 kind. 런타임마다 activation이 미세하게 다르므로 항목을 분리 ("madmom" → "cnn")."""
+    return "cnn" if cnn_runtime == "madmom" else f"cnn_{cnn_runtime}"
+
+
+def _entry_path(cache_dir: Path, content_hash: str, kind: str) -> Path:
+    return cache_dir / content_hash[:2] / f"{content_hash}.{kind}.npz"
+
+
+def load_activation(
+    cache_dir: Path | str,
+    audio_path: Path | str,
+    kind: str,
+    *,
+    content_hash: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    캐시 조회. 없거나 모델 식별자가 다르면 None.
+    Returns: {"activation": np.ndarray(float32), "fps": float, "duration": float, "sr": int, "model": str}
+    """
+    content_hash = content_hash or file_content_hash(audio_path)
+    path = _entry_path(Path(cache_dir), content_hash, kind)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            model = str(data["model"])
+            if model != model_identity(kind):
+                return None
+            return {
+                "activation": data["activation"].astype(np.float32),
+                "fps": float(data["fps"]),
+                "duration": float(data["duration"]),
+                "sr": int(data["sr"]),
+                "model": model,
+            }
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_activation(
+    cache_dir: Path | str,
+    audio_path: Path | str,
+    kind: str,
+    activation: np.ndarray,
+    *,
+    fps: float,
+    duration: float,
+    sr: int,
+    content_hash: str | None = None,
+    dtype: str = ACTIVATION_CACHE_DTYPE,
+) -> Path:
+    """
+    activation을 압축 npz로 저장 (임시 파일 → rename으로 원자적 교체).
+    임시 파일명은 프로세스·시각별 → 같은 stem을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않음 (내용은 같음).
+    """
+    content_hash = content_hash or file_content_hash(audio_path)
+    path = _entry_path(Path(cache_dir), content_hash, kind)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                activation=np.asarray(activation).astype(dtype),
+                fps=np.float64(fps),
+                duration=np.float64(duration),
+                sr=np.int64(sr),
+                model=np.str_(model_identity(kind)),
+            )
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
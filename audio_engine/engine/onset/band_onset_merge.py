@@ -10,6 +10,7 @@ from typing import Literal
 
 import numpy as np
 
+from audio_engine.engine.io import load_audio
 from audio_engine.engine.onset.constants import (
     MERGE_CLOSE_SEC_LOW,
     MERGE_CLOSE_SEC_MID,
@@ -122,7 +123,7 @@ def merge_close_band_onsets(
 def filter_transient_mid_high(
     band_onsets: dict[str, np.ndarray],
     band_strengths: dict[str, np.ndarray],
-    band_audio_paths: dict[str, Path],
+    band_audio_paths: dict[str, Path | np.ndarray],
     sr: int,
     *,
     window_sec: float = CLAP_SHAKER_TRANSIENT_WINDOW_SEC,
@@ -132,11 +133,10 @@ def filter_transient_mid_high(
     mid/high 대역만 트랜지언트(어택) 비율로 필터: 클랩·쉐이커처럼
     어택 후 에너지가 어택 전보다 충분히 큰 onset만 유지. low는 변경 없음.
 
-    band_audio_paths: {"mid": Path, "high": Path} (해당 band만 있으면 됨)
+    band_audio_paths: {"mid": Path, "high": Path} (해당 band만 있으면 됨).
+        이미 디코드된 mono 배열(sr 기준)을 넘기면 다시 읽지 않음.
     ratio_min: post_energy / (pre_energy + eps) >= ratio_min 인 onset만 유지.
     """
-    import librosa
-
     out_onsets = dict(band_onsets)
     out_strengths = dict(band_strengths)
 
@@ -150,7 +150,11 @@ def filter_transient_mid_high(
         if len(times) == 0:
             continue
 
-        y, _ = librosa.load(band_audio_paths[band], sr=sr, mono=True)
+        src = band_audio_paths[band]
+        if isinstance(src, np.ndarray):
+            y = np.asarray(src, dtype=float)
+        else:
+            y, _ = load_audio(src, sr=sr, mono=True)
         n = len(y)
         w = int(round(window_sec * sr))
         w = max(1, min(w, n // 4))
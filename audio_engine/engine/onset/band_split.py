@@ -0,0 +1,108 @@
+"""
+드럼 stem → low/mid/high 대역 분할 (메모리 내).
+대역별 butter 2차 band-pass를 SOS로 1회 설계해 (sr, band_hz)별로 캐시, sosfiltfilt(zero-phase)를 float32로 적용.
+결과 BandAudio를 cnn_band_pipeline에 바로 전달 → drum_{band}.wav 기록·재디코드 생략.
+WAV 파일은 write_band_files()로 필요할 때만 기록 (04_split_drum_by_band, 시각화·청취용).
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from audio_engine.engine.io import DEFAULT_STEM_FORMAT, load_audio, write_audio
+from audio_engine.engine.onset.constants import BAND_HZ
+
+BAND_KEYS = ("low", "mid", "high")
+BAND_FILTER_ORDER = 2
+
+
+class BandAudio(NamedTuple):
+    """메모리 내 대역 신호 (mono float32). name은 로그·캐시 manifest용 표시 이름 (예: "drum_low")."""
+    samples: np.ndarray
+    sr: int
+    name: str = ""
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / float(self.sr)
+
+
+def to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """
+    float → int16 (soundfile/libsndfile PCM_16 기록과 같은 변환: floor(x * 32768), 범위 밖은 클리핑).
+    CNN·ODF는 16-bit WAV 입력 기준으로 동작 (log 스펙트럼 바닥이 양자화 잡음 수준) → 메모리 입력도 같은 형식으로 전달.
+    """
+    scaled = np.floor(np.asarray(samples, dtype=np.float64) * 32768.0)
+    return np.clip(scaled, -32768, 32767).astype(np.int16)
+
+
+@lru_cache(maxsize=16)
+def band_sos(
+    sr: int,
+    band_hz: tuple[tuple[float, float], ...],
+    order: int = BAND_FILTER_ORDER,
+) -> tuple[np.ndarray | None, ...]:
+    """대역별 SOS 계수 (pipeline._bandpass와 같은 정규화·클리핑). 빈 대역은 None."""
+    from scipy.signal import butter
+
+    nyq = sr / 2.0
+    sos = []
+    for f_lo, f_hi in band_hz:
+        low = max(f_lo / nyq, 0.001)
+        high = min(f_hi / nyq, 0.999)
+        sos.append(butter(order, [low, high], btype="band", output="sos") if low < high else None)
+    return tuple(sos)
+
+
+def split_bands(
+    y: np.ndarray,
+    sr: int,
+    band_hz: list[tuple[float, float]] = BAND_HZ,
+) -> dict[str, np.ndarray]:
+    """
+    mono 신호 → {"low", "mid", "high": float32 배열}. filter_y_into_bands와 같은 필터 (SOS·float32).
+    """
+    y = np.asarray(y, dtype=np.float32)
+    if len(band_hz) < 3:
+        return {band: y.copy() for band in BAND_KEYS}
+    from scipy.signal import sosfiltfilt
+
+    out = {}
+    for band, sos in zip(BAND_KEYS, band_sos(int(sr), tuple(tuple(b) for b in band_hz[:3]))):
+        if sos is None:
+            out[band] = np.zeros_like(y)
+        else:
+            out[band] = sosfiltfilt(sos.astype(np.float32), y).astype(np.float32, copy=False)
+    return out
+
+
+def load_drum_bands(
+    drums_path: Path | str,
+    band_hz: list[tuple[float, float]] = BAND_HZ,
+) -> dict[str, BandAudio]:
+    """drums stem 1회 디코드(원본 sr, mono float32; WAV·FLAC) → 대역별 BandAudio."""
+    y, sr = load_audio(drums_path, sr=None, mono=True)
+    return {
+        band: BandAudio(samples, int(sr), f"drum_{band}")
+        for band, samples in split_bands(y, sr, band_hz).items()
+    }
+
+
+def write_band_files(
+    bands: dict[str, BandAudio],
+    folder: Path | str,
+    stem_format: str = DEFAULT_STEM_FORMAT,
+) -> dict[str, Path]:
+    """
+    대역 신호를 folder/drum_{band}.{wav|flac} (16-bit PCM)로 기록. Returns: {band: 경로}.
+    다른 형식의 같은 대역 파일은 write_audio가 삭제 (stem_file이 이전 형식을 먼저 찾지 않도록).
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    return {
+        band: write_audio(folder / f"drum_{band}", audio.samples, audio.sr, stem_format)
+        for band, audio in bands.items()
+    }
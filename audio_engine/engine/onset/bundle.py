@@ -0,0 +1,238 @@
+"""
+L5 I/O Adapters: 트랙당 분석 번들 (피처별 JSON 여러 개 → 파일 1개).
+
+01_energy … 07_streams_sections가 각각 쓰던 onset_events_*.json·streams_sections.json을 섹션으로 묶음.
+이벤트 공통 열(index·time·frame·strength)은 timeline에 한 번만 저장하고, 각 섹션의 같은 값 열은
+{"timeline": 이름} 참조로 대체. 섹션은 columnar.encode_binary(.evb)로 인코딩.
+
+파일 구조 (.oab):
+    b"OABN" | uint32 버전 | uint32 인덱스 길이 | 인덱스 JSON | 8바이트 정렬 | timeline blob | 섹션 blob...
+    인덱스 = {source, sr, duration_sec, bpm, n_events, timeline: {offset, length}, sections: {이름: {offset, length}}}
+    offset은 blob 영역 시작 기준. 읽기는 인덱스 + 요청한 섹션 blob만 (seek / HTTP Range).
+
+섹션 문서는 export.build_*_doc 결과 그대로 → read_analysis_bundle이 같은 dict를 돌려줌.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from audio_engine.engine.onset.columnar import block_to_rows, decode_binary, encode_binary, from_columnar, to_columnar
+from audio_engine.engine.onset.types import OnsetContext
+
+BUNDLE_MAGIC = b"OABN"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".oab"
+# 섹션 이름 = 기존 개별 JSON 파일 (onset_events_{이름}.json, streams_sections.json)
+BUNDLE_SECTIONS = ("energy", "clarity", "temporal", "spectral", "context", "layered", "streams_sections")
+TIMELINE_KEYS = ("index", "time", "frame", "strength")
+
+_ALIGN = 8
+
+
+def _timeline_rows(ctx: OnsetContext) -> list[dict]:
+    """export.build_*_doc와 같은 반올림의 이벤트 공통 열."""
+    return [
+        {
+            "index": i,
+            "time": round(float(ctx.onset_times[i]), 4),
+            "frame": int(ctx.onset_frames[i]),
+            "strength": round(float(ctx.strengths[i]), 4),
+        }
+        for i in range(ctx.n_events)
+    ]
+
+
+def _link_timeline(doc: dict[str, Any], timeline: dict[str, list]) -> dict[str, Any]:
+    """columnar 문서의 events 열 중 timeline과 값이 같은 열 → {"timeline": 이름} 참조."""
+    block = doc.get("events")
+    if not isinstance(block, dict) or "columns" not in block or block["n"] != len(timeline["time"]):
+        return doc
+    for name, col in block["columns"].items():
+        if not isinstance(col, list):
+            continue
+        for key in TIMELINE_KEYS:
+            ref = timeline[key]
+            if col == ref and [type(v) for v in col] == [type(v) for v in ref]:
+                block["columns"][name] = {"timeline": key}
+                break
+    return doc
+
+
+def _resolve_timeline(doc: dict[str, Any], timeline: dict[str, list]) -> dict[str, Any]:
+    block = doc.get("events")
+    if isinstance(block, dict) and "columns" in block:
+        for name, col in block["columns"].items():
+            if isinstance(col, dict) and "timeline" in col:
+                block["columns"][name] = list(timeline[col["timeline"]])
+    return doc
+
+
+def build_feature_sections(
+    ctx: OnsetContext,
+    source: str = "unknown",
+    names: Iterable[str] = BUNDLE_SECTIONS[:6],
+) -> dict[str, dict]:
+    """
+    컨텍스트 1회로 피처 섹션 문서 계산 (01~06 스크립트가 각자 build_context하던 것을 한 번에).
+    layered는 5개 지표 + ctx.band_evidence (build_context_with_band_evidence) 필요.
+    streams_sections는 스트림·섹션·키포인트가 스크립트 쪽에서 만들어지므로 build_streams_sections_doc로 직접 추가.
+    """
+    from audio_engine.engine.onset import export
+    from audio_engine.engine.onset.features.clarity import compute_clarity
+    from audio_engine.engine.onset.features.context import compute_context_dependency
+    from audio_engine.engine.onset.features.energy import compute_energy
+    from audio_engine.engine.onset.features.spectral import compute_spectral
+    from audio_engine.engine.onset.features.temporal import compute_temporal
+
+    names = list(names)
+    need = set(names)
+    if "layered" in need:
+        need |= {"energy", "clarity", "temporal", "spectral", "context"}
+    computed: dict[str, tuple] = {}
+    for name, fn in (
+        ("energy", compute_energy),
+        ("clarity", compute_clarity),
+        ("temporal", compute_temporal),
+        ("spectral", compute_spectral),
+        ("context", compute_context_dependency),
+    ):
+        if name in need:
+            computed[name] = fn(ctx)
+
+    builders = {
+        "energy": export.build_energy_doc,
+        "clarity": export.build_clarity_doc,
+        "temporal": export.build_temporal_doc,
+        "spectral": export.build_spectral_doc,
+        "context": export.build_context_doc,
+    }
+    sections: dict[str, dict] = {}
+    for name in names:
+        if name in builders:
+            scores, extras = computed[name]
+            sections[name] = builders[name](ctx, scores, extras, source)
+        elif name == "layered":
+            from audio_engine.engine.onset.scoring import assign_roles_by_band
+
+            metrics = {
+                "energy": computed["energy"][0],
+                "clarity": computed["clarity"][0],
+                "temporal": computed["temporal"][0],
+                "focus": computed["spectral"][0],
+                "dependency": computed["context"][0],
+            }
+            role_composition = assign_roles_by_band(
+                computed["energy"][1],
+                temporal=metrics["temporal"],
+                dependency=metrics["dependency"],
+                focus=metrics["focus"],
+                onset_times=ctx.onset_times,
+                band_evidence=ctx.band_evidence,
+            )
+            sections[name] = export.build_layered_doc(ctx, metrics, role_composition, source)
+        else:
+            raise ValueError(f"알 수 없는 번들 섹션: {name} (계산 가능: {', '.join(BUNDLE_SECTIONS[:6])})")
+    return sections
+
+
+def write_analysis_bundle(
+    path: Path | str,
+    ctx: OnsetContext,
+    sections: dict[str, dict],
+    source: str = "unknown",
+    project_root: Optional[Path | str] = None,
+) -> Path:
+    """
+    섹션 문서들(export.build_*_doc 결과) → .oab 파일 1개. 임시 파일 → rename.
+    project_root 지정 시 web/public에도 복사 (웹은 트랙당 1회 fetch).
+    """
+    from audio_engine.engine.onset.export import _copy_to_web_public, _ensure_dir
+
+    path = Path(path).with_suffix(BUNDLE_SUFFIX)
+    _ensure_dir(path)
+    timeline_doc = {"events": _timeline_rows(ctx)}
+    timeline = {k: [row[k] for row in timeline_doc["events"]] for k in TIMELINE_KEYS}
+
+    blobs = [encode_binary(timeline_doc)]
+    names = list(sections)
+    for name in names:
+        blobs.append(encode_binary(_link_timeline(to_columnar(sections[name]), timeline)))
+
+    offsets = []
+    offset = 0
+    for blob in blobs:
+        offsets.append({"offset": offset, "length": len(blob)})
+        offset += -(-len(blob) // _ALIGN) * _ALIGN
+    index = {
+        "source": source,
+        "sr": int(ctx.sr),
+        "duration_sec": round(float(ctx.duration), 4),
+        "bpm": round(float(ctx.bpm), 2),
+        "n_events": ctx.n_events,
+        "timeline": offsets[0],
+        "sections": dict(zip(names, offsets[1:])),
+    }
+    head = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    prefix = BUNDLE_MAGIC + struct.pack("<II", BUNDLE_VERSION, len(head)) + head
+    prefix += b"\0" * (-len(prefix) % _ALIGN)
+
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    with open(tmp, "wb") as f:
+        f.write(prefix)
+        for blob in blobs:
+            f.write(blob)
+            f.write(b"\0" * (-len(blob) % _ALIGN))
+    tmp.replace(path)
+    if project_root is not None:
+        _copy_to_web_public(path, Path(project_root))
+    return path
+
+
+def _read_index(f) -> tuple[dict[str, Any], int]:
+    head = f.read(12)
+    if head[:4] != BUNDLE_MAGIC:
+        raise ValueError("OABN 번들이 아닙니다")
+    version, index_len = struct.unpack_from("<II", head, 4)
+    if version > BUNDLE_VERSION:
+        raise ValueError(f"지원하지 않는 OABN 버전: {version}")
+    index = json.loads(f.read(index_len).decode("utf-8"))
+    start = 12 + index_len
+    return index, start + (-start % _ALIGN)
+
+
+def read_bundle_index(path: Path | str) -> dict[str, Any]:
+    """번들 인덱스 (메타 + 섹션 목록)만 읽기."""
+    with open(path, "rb") as f:
+        return _read_index(f)[0]
+
+
+def read_analysis_bundle(
+    path: Path | str,
+    sections: Optional[Iterable[str]] = None,
+) -> dict[str, dict]:
+    """
+    번들 → {섹션 이름: 문서}. sections 지정 시 그 섹션 blob만 읽음 (나머지는 디스크에서 읽지 않음).
+    문서는 export.build_*_doc / 기존 개별 JSON과 같은 구조.
+    """
+    with open(path, "rb") as f:
+        index, base = _read_index(f)
+
+        def blob(entry: dict[str, int]) -> bytes:
+            f.seek(base + entry["offset"])
+            return f.read(entry["length"])
+
+        available = index["sections"]
+        names = list(available) if sections is None else list(sections)
+        missing = [n for n in names if n not in available]
+        if missing:
+            raise KeyError(f"번들에 없는 섹션: {', '.join(missing)} (있음: {', '.join(available)})")
+        timeline_rows = block_to_rows(decode_binary(blob(index["timeline"]))["events"])
+        timeline_cols = {k: [row[k] for row in timeline_rows] for k in TIMELINE_KEYS}
+        return {
+            name: from_columnar(_resolve_timeline(decode_binary(blob(available[name])), timeline_cols))
+            for name in names
+        }
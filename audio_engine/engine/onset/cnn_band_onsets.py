@@ -2,87 +2,112 @@
 madmom CNN 기반 드럼 low/mid/high 대역별 포인트 추출.
 stems/htdemucs/{stem_folder_name}/ 에서 drum_low.wav, drum_mid.wav, drum_high.wav 각각
 CNNOnsetProcessor + OnsetPeakPickingProcessor로 onset 검출. strength는 CNN activation에서 샘플링.
+대역별 backend는 detectors 레지스트리에서 선택 (기본 BAND_ONSET_BACKENDS = 전 대역 CNN).
+cache_dir 지정 시 CNN activation을 stem content hash 기준으로 디스크 캐시 (activation_cache).
 """
 from __future__ import annotations
 
-import collections
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from audio_engine.engine.io import audio_info, stem_file
+from audio_engine.engine.onset.activation_cache import cnn_cache_kind, load_activation, save_activation
 from audio_engine.engine.onset.band_onset_merge import merge_close_onsets, filter_by_strength
 from audio_engine.engine.onset.constants import (
+    BAND_ONSET_BACKENDS,
+    CNN_ONSET_THRESHOLD,
+    CNN_RUNTIME,
+    MADMOM_FPS,
     MERGE_CLOSE_SEC_LOW,
     MERGE_CLOSE_SEC_MID,
     MERGE_CLOSE_SEC_HIGH,
     STRENGTH_FLOOR_BAND_ONSET,
     STRENGTH_FLOOR_MID_HIGH,
 )
+from audio_engine.engine.onset.cnn_runtime import get_cnn_runtime
+from audio_engine.engine.onset.detectors import get_onset_detector
+from audio_engine.engine.onset.madmom_processors import (
+    get_cnn_onset_processor,
+    load_signal,
+    run_on_warm_executor,
+)
 
-# Python 3.10+ 호환: madmom이 collections.MutableSequence를 사용하므로 패치
-if not hasattr(collections, "MutableSequence"):
-    import collections.abc
-
-    collections.MutableSequence = collections.abc.MutableSequence  # type: ignore
 
-# NumPy 2.0+ 호환: madmom이 deprecated np.float, np.int 등 사용
-for _attr, _val in [("float", np.float64), ("int", np.int64), ("bool", np.bool_), ("complex", np.complex128)]:
-    if not hasattr(np, _attr):
-        setattr(np, _attr, _val)
+def _cnn_activation(
+    audio_path: Path,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[np.ndarray, float, int]:
+    """
+    단일 대역 파일의 CNN activation. cache_dir가 있으면 캐시 조회 후 miss일 때만 추론·저장.
+    cnn_runtime: "madmom" (CNNOnsetProcessor) | "numpy" (전처리는 madmom, 네트워크는 cnn_runtime float32).
+    Returns: (activations, duration, sr)
+    """
+    kind = cnn_cache_kind(cnn_runtime)
+    if cache_dir is not None:
+        cached = load_activation(cache_dir, audio_path, kind)
+        if cached is not None:
+            return cached["activation"], cached["duration"], cached["sr"]
+
+    proc = get_cnn_onset_processor()
+    if cnn_runtime == "numpy":
+        activations = get_cnn_runtime().forward(proc.processors[0](load_signal(audio_path)))
+    elif cnn_runtime == "madmom":
+        activations = np.asarray(proc(load_signal(audio_path)))
+    else:
+        raise ValueError(f"알 수 없는 cnn_runtime: {cnn_runtime} (가능: madmom, numpy)")
+    duration, sr = audio_info(audio_path)
+    if cache_dir is not None:
+        save_activation(
+            cache_dir, audio_path, kind, activations,
+            fps=MADMOM_FPS, duration=duration, sr=sr,
+        )
+    return activations, duration, sr
 
 
-def _cnn_band_onsets(audio_path: Path, threshold: float = 0.35) -> tuple[np.ndarray, np.ndarray, float, int]:
+def _band_onsets(
+    audio_path: Path,
+    backend: str = "cnn",
+    threshold: float = CNN_ONSET_THRESHOLD,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[np.ndarray, np.ndarray, float, int]:
     """
-    단일 대역 파일에서 madmom CNN onset 검출.
+    단일 대역 파일에서 backend(detectors)로 onset 검출. detector·프로세서는 레지스트리에서 재사용.
+    threshold·cache_dir·cnn_runtime은 "cnn" backend에만 적용 (나머지는 backend 기본값).
     Returns: (onset_times, strengths, duration, sr)
     """
-    from madmom.features.onsets import CNNOnsetProcessor, OnsetPeakPickingProcessor
-
-    fps = 100
-    proc_onset = CNNOnsetProcessor()
-    proc_peak = OnsetPeakPickingProcessor(
-        threshold=threshold,
-        smooth=0.0,
-        pre_avg=0.0,
-        post_avg=0.0,
-        pre_max=0.02,
-        post_max=0.02,
-        combine=0.03,
-        fps=fps,
-    )
-    activations = proc_onset(str(audio_path))
-    onset_times = proc_peak(activations)
-    onset_times = np.asarray(onset_times).flatten()
-
-    if len(onset_times) == 0:
-        return onset_times, np.array([]), 0.0, 22050
-
-    # strength: activation at onset frame
-    frame_indices = np.clip(
-        np.round(onset_times * fps).astype(int),
-        0,
-        len(activations) - 1,
-    )
-    strengths = np.asarray(activations, dtype=float)[frame_indices]
-
-    import soundfile as sf
-    info = sf.info(str(audio_path))
-    duration = info.duration
-    sr = info.samplerate
-    return onset_times, strengths, duration, sr
+    if backend == "cnn":
+        detector = get_onset_detector("cnn", threshold=threshold, cache_dir=cache_dir, cnn_runtime=cnn_runtime)
+    else:
+        detector = get_onset_detector(backend)
+    detection = detector.detect(audio_path)
+
+    if len(detection.times) == 0:
+        return detection.times, np.array([]), 0.0, 22050
+    return detection.times, detection.strengths, detection.duration, detection.sr
 
 
 def compute_cnn_band_onsets(
     stem_folder_name: str,
     stems_base_dir: Path | str,
     *,
-    threshold: float = 0.35,
+    threshold: float = CNN_ONSET_THRESHOLD,
     strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
+    max_workers: int | None = None,
+    cache_dir: Path | str | None = None,
+    backends: dict[str, str] | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
 ) -> dict[str, Any]:
     """
     stem 폴더명만 지정. stems_base_dir 아래 {stem_folder_name}/ 에서
     drum_low.wav, drum_mid.wav, drum_high.wav **각각** madmom CNN onset 검출.
+    max_workers: 2 이상이면 대역별 CNN을 워커 프로세스(모델 로드 완료 상태)에서 병렬 실행.
+    cache_dir: CNN activation 디스크 캐시 경로. hit면 추론 없이 peak picking부터 실행.
+    backends: 대역별 onset backend 덮어쓰기 (예: {"low": "spectral_flux"}). 기본 BAND_ONSET_BACKENDS.
+    cnn_runtime: "madmom" | "numpy" (float32 cnn_runtime, 결과는 activation 1e-6 수준 차이).
 
     Returns:
         {
@@ -99,9 +124,9 @@ def compute_cnn_band_onsets(
     """
     stems_base_dir = Path(stems_base_dir)
     folder = stems_base_dir / stem_folder_name
-    drum_low_path = folder / "drum_low.wav"
-    drum_mid_path = folder / "drum_mid.wav"
-    drum_high_path = folder / "drum_high.wav"
+    drum_low_path = stem_file(folder, "drum_low")
+    drum_mid_path = stem_file(folder, "drum_mid")
+    drum_high_path = stem_file(folder, "drum_high")
 
     for p in (drum_low_path, drum_mid_path, drum_high_path):
         if not p.exists():
@@ -116,12 +141,27 @@ def compute_cnn_band_onsets(
         "mid": MERGE_CLOSE_SEC_MID,
         "high": MERGE_CLOSE_SEC_HIGH,
     }
-    for band_key, path in [
-        ("low", drum_low_path),
-        ("mid", drum_mid_path),
-        ("high", drum_high_path),
-    ]:
-        onset_times, strengths, dur, sr = _cnn_band_onsets(path, threshold=threshold)
+    band_paths = {"low": drum_low_path, "mid": drum_mid_path, "high": drum_high_path}
+    band_backends = {**BAND_ONSET_BACKENDS, **(backends or {})}
+    if max_workers is not None and max_workers > 1:
+        band_results = run_on_warm_executor(
+            {
+                band: (_band_onsets, (path, band_backends[band], threshold, cache_dir, cnn_runtime))
+                for band, path in band_paths.items()
+            },
+            max_workers,
+            warm_librosa="librosa" in band_backends.values(),
+        )
+    else:
+        band_results = {
+            band: _band_onsets(
+                path, band_backends[band], threshold=threshold, cache_dir=cache_dir, cnn_runtime=cnn_runtime
+            )
+            for band, path in band_paths.items()
+        }
+
+    for band_key in ("low", "mid", "high"):
+        onset_times, strengths, dur, sr = band_results[band_key]
         onset_times, strengths = merge_close_onsets(
             onset_times, strengths, sec_per_band[band_key], keep="strongest"
         )
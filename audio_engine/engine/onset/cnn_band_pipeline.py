@@ -1,33 +1,46 @@
 """
 madmom CNN + ODF 기반 band onset/stength 파이프라인.
 대역별 CNN onset → ODF(superflux/complex_flux)로 strength 보강 → build_streams 입력용.
+대역 파일은 1회만 디코드(Signal)하고, frame 2048 STFT를 CNN 전처리와 ODF가 공유.
+drum_{band}.wav가 없으면 drums.wav를 메모리에서 분할(band_split)해 바로 사용 (대역 WAV 파일은 선택).
+cache_dir 지정 시 CNN·ODF activation을 stem content hash 기준으로 디스크 캐시 (activation_cache).
+대역별 onset backend는 backends 인자로 교체 가능 (detectors; 기본 전 대역 CNN).
+대역 입력은 모아 1회 추론 (run_stacked). cnn_runtime="numpy"면 CNN을 float32 NumPy 런타임(cnn_runtime)으로 실행.
 """
 from __future__ import annotations
 
-import collections
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 
+from audio_engine.engine.io import array_content_hash, audio_info, file_content_hash, stem_file
+from audio_engine.engine.onset.activation_cache import cnn_cache_kind, load_activation, save_activation
+from audio_engine.engine.onset.band_split import BandAudio, load_drum_bands, to_pcm16
 from audio_engine.engine.onset.band_onset_merge import (
     merge_close_band_onsets,
     filter_by_strength,
     filter_transient_mid_high,
 )
 from audio_engine.engine.onset.constants import (
+    BAND_ONSET_BACKENDS,
+    CNN_BATCH_FRAMES,
+    CNN_ONSET_THRESHOLD,
+    CNN_RUNTIME,
+    MADMOM_FPS,
     STRENGTH_FLOOR_BAND_ONSET,
     STRENGTH_FLOOR_MID_HIGH,
 )
-
-# Python 3.10+ / NumPy 2.0+ 호환 패치 (madmom)
-if not hasattr(collections, "MutableSequence"):
-    import collections.abc
-
-    collections.MutableSequence = collections.abc.MutableSequence  # type: ignore
-for _attr, _val in [("float", np.float64), ("int", np.int64), ("bool", np.bool_), ("complex", np.complex128)]:
-    if not hasattr(np, _attr):
-        setattr(np, _attr, _val)
+from audio_engine.engine.onset.cnn_runtime import get_cnn_runtime, run_stacked
+from audio_engine.engine.onset.detectors import get_onset_detector
+from audio_engine.engine.onset.madmom_processors import (
+    get_cnn_onset_processor,
+    get_complex_flux_processor,
+    get_peak_picking_processor,
+    get_superflux_processor,
+    load_signal,
+    run_on_warm_executor,
+)
 
 
 def _sample_odf_at_times(activation: np.ndarray, times: np.ndarray, duration: float) -> np.ndarray:
@@ -43,82 +56,227 @@ def _sample_odf_at_times(activation: np.ndarray, times: np.ndarray, duration: fl
     return np.asarray(activation, dtype=float)[indices]
 
 
-def compute_cnn_band_onsets_with_odf(
-    stem_folder_name: str,
-    stems_base_dir: Path | str,
-    *,
-    cnn_threshold: float = 0.35,
-    strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
-) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]:
+# SpectralOnsetProcessor.processors 순서: [signal, frames, stft, spectrogram, (filterbank), odf 함수]
+_ODF_FRAMES_IDX = 1
+_ODF_SPEC_START_IDX = 3
+
+
+def _run_chain(processors: list, data):
+    for proc in processors:
+        data = proc(data)
+    return data
+
+
+def _cnn_features(cnn_proc, sig, source: Path | BandAudio, shared_stft=None) -> np.ndarray:
     """
-    band별 CNN onset + ODF strength.
-    low/mid: superflux, high: complex_flux.
+    CNNOnsetProcessor와 동일한 전처리(멀티 해상도 log-mel → stack → pad) → 네트워크 입력 (frames + 14, 80, 3).
+    sig: 디코드된 madmom Signal. CNN 샘플레이트와 다르면 source에서 리샘플링(드묾).
+    shared_stft: frame_size·hop이 같은 브랜치는 이 STFT를 재사용 (magnitude만 사용하므로 circular_shift 무관).
+    """
+    sig_proc, multi, stack, pad = cnn_proc.processors[0].processors
+    if sig_proc.sample_rate is not None and sig.sample_rate != sig_proc.sample_rate:
+        if isinstance(source, BandAudio):
+            import librosa
+            from madmom.audio.signal import Signal
 
-    Returns:
-        (band_onsets, band_strengths, duration, sr)
-        band_onsets[band] = 1d array of onset times (sec)
-        band_strengths[band] = 1d array, same length as band_onsets[band]
+            resampled = librosa.resample(source.samples, orig_sr=source.sr, target_sr=sig_proc.sample_rate)
+            sig = Signal(to_pcm16(resampled), sample_rate=sig_proc.sample_rate)
+        else:
+            sig = sig_proc(load_signal(source))
+    specs = []
+    for branch in multi.processors:
+        frames_proc, stft_proc, filt_proc, log_proc = branch.processors
+        if (
+            shared_stft is not None
+            and shared_stft.frames.frame_size == frames_proc.frame_size
+            and shared_stft.frames.hop_size == sig.sample_rate / frames_proc.fps
+        ):
+            stft = shared_stft
+        else:
+            stft = stft_proc(frames_proc(sig))
+        specs.append(log_proc(filt_proc(stft)))
+    return pad(stack(specs))
+
+
+def _run_cnn(features: list[np.ndarray], cnn_runtime: str = CNN_RUNTIME) -> list[np.ndarray]:
     """
-    from madmom.features.onsets import (
-        CNNOnsetProcessor,
-        OnsetPeakPickingProcessor,
-        SpectralOnsetProcessor,
-    )
-    from madmom.audio.filters import LogarithmicFilterbank
-
-    stems_base_dir = Path(stems_base_dir)
-    folder = stems_base_dir / stem_folder_name
-    drum_low_path = folder / "drum_low.wav"
-    drum_mid_path = folder / "drum_mid.wav"
-    drum_high_path = folder / "drum_high.wav"
-
-    for p in (drum_low_path, drum_mid_path, drum_high_path):
-        if not p.exists():
-            raise FileNotFoundError(f"필요한 파일이 없습니다: {p} (폴더: {stem_folder_name})")
-
-    fps = 100
-    cnn_proc = CNNOnsetProcessor()
-    peak_proc = OnsetPeakPickingProcessor(
-        threshold=cnn_threshold,
-        smooth=0.0,
-        pre_avg=0.0,
-        post_avg=0.0,
-        pre_max=0.02,
-        post_max=0.02,
-        combine=0.03,
-        fps=fps,
-    )
-    superflux_proc = SpectralOnsetProcessor(
-        onset_method="superflux",
-        filterbank=LogarithmicFilterbank,
-        num_bands=24,
-    )
-    complexflux_proc = SpectralOnsetProcessor(onset_method="complex_flux")
+    네트워크 입력 목록 → activation 목록. 두 런타임 모두 입력을 시간축으로 이어 붙여 1회 추론 (run_stacked).
+    "madmom": madmom NeuralNetwork (레이어별 호출 오버헤드를 입력 수와 무관하게 1회로). "numpy": cnn_runtime.
+    """
+    if cnn_runtime == "numpy":
+        return get_cnn_runtime().run_batch(features)
+    if cnn_runtime != "madmom":
+        raise ValueError(f"알 수 없는 cnn_runtime: {cnn_runtime} (가능: madmom, numpy)")
+    return run_stacked(get_cnn_onset_processor().processors[1], features)
+
+
+def _signal_to_float(sig: np.ndarray) -> np.ndarray:
+    """정수 PCM Signal → [-1, 1] float32 (librosa.load와 같은 스케일)."""
+    if np.issubdtype(sig.dtype, np.integer):
+        return np.asarray(sig, dtype=np.float32) / float(np.iinfo(sig.dtype).max + 1)
+    return np.asarray(sig, dtype=np.float32)
+
+
+def _band_features(source: Path | BandAudio, odf_proc) -> tuple[np.ndarray, np.ndarray, float, int, np.ndarray]:
+    """
+    단일 대역 파일 또는 메모리 내 BandAudio → (cnn_features, odf_activation, duration, sr, samples).
+    파일은 1회 디코드. ODF용 frame 2048 STFT(circular_shift 포함)를 CNN 2048 브랜치가 재사용.
+    samples: 트랜지언트 필터용 mono float32 (원본 sr).
+    """
+    from madmom.audio.signal import Signal
+
+    if isinstance(source, BandAudio):
+        # 대역 WAV(PCM_16)를 읽은 것과 같은 int16 Signal → 파일 경유와 같은 결과
+        sig = Signal(to_pcm16(source.samples), sample_rate=source.sr)
+    else:
+        sig = load_signal(source)
+    sr = int(sig.sample_rate)
+    duration = len(sig) / float(sr)
+
+    odf_frames = odf_proc.processors[_ODF_FRAMES_IDX](sig)
+    stft = _run_chain([odf_proc.processors[_ODF_FRAMES_IDX + 1]], odf_frames)
+    odf_activation = _run_chain(odf_proc.processors[_ODF_SPEC_START_IDX:], stft)
+
+    features = _cnn_features(get_cnn_onset_processor(), sig, source, shared_stft=stft)
+    return features, np.asarray(odf_activation), duration, sr, _signal_to_float(sig)
+
+
+# low/mid: superflux, high: complex_flux
+_BAND_ODF = {"low": "superflux", "mid": "superflux", "high": "complex_flux"}
+_ODF_GETTERS = {"superflux": get_superflux_processor, "complex_flux": get_complex_flux_processor}
+
+
+def _source_hash(source: Path | BandAudio) -> str:
+    """activation 캐시 키: 파일은 바이트, BandAudio는 샘플 배열 기준 content hash."""
+    if isinstance(source, BandAudio):
+        return array_content_hash(source.samples, source.sr)
+    return file_content_hash(source)
+
+
+def _band_activations_batch(
+    items: list[tuple[Path | BandAudio, str]],
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> list[tuple[np.ndarray, np.ndarray, float, int, np.ndarray | None]]:
+    """
+    (대역 파일 또는 BandAudio, ODF 이름) 목록 → 항목별 (cnn_activations, odf_activation, duration, sr, samples).
+    cache_dir가 있으면 CNN·ODF activation을 캐시에서 읽음. 둘 다 hit면 디코드하지 않으므로 samples는 None.
+    miss 항목은 전처리 후 CNN을 한 번에 실행 (numpy 런타임이면 여러 stem 입력을 연결해 1회 추론).
+    """
+    cnn_kind = cnn_cache_kind(cnn_runtime)
+    results: list[Any] = [None] * len(items)
+    hashes: list[str | None] = [None] * len(items)
+    pending: list[tuple[int, np.ndarray, np.ndarray, float, int, np.ndarray]] = []
+    for i, (path, odf_method) in enumerate(items):
+        if cache_dir is not None:
+            hashes[i] = _source_hash(path)
+            cnn = load_activation(cache_dir, path, cnn_kind, content_hash=hashes[i])
+            odf = load_activation(cache_dir, path, odf_method, content_hash=hashes[i])
+            if cnn is not None and odf is not None:
+                results[i] = (cnn["activation"], odf["activation"], cnn["duration"], cnn["sr"], None)
+                continue
+        pending.append((i, *_band_features(path, _ODF_GETTERS[odf_method]())))
+
+    activations = _run_cnn([features for _, features, *_ in pending], cnn_runtime)
+    for (i, _, odf_activation, duration, sr, samples), act in zip(pending, activations):
+        results[i] = (act, odf_activation, duration, sr, samples)
+        if cache_dir is not None:
+            path, odf_method = items[i]
+            save_activation(
+                cache_dir, path, cnn_kind, act,
+                fps=MADMOM_FPS, duration=duration, sr=sr, content_hash=hashes[i],
+            )
+            save_activation(
+                cache_dir, path, odf_method, odf_activation,
+                fps=len(odf_activation) / max(duration, 0.001), duration=duration, sr=sr,
+                content_hash=hashes[i],
+            )
+    return results
+
+
+def _band_activations_for(
+    path: Path | BandAudio,
+    odf_method: str,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[np.ndarray, np.ndarray, float, int, np.ndarray | None]:
+    """단일 대역용 _band_activations_batch (워커 프로세스 진입점; 프로세서 대신 ODF 이름을 받음)."""
+    return _band_activations_batch([(path, odf_method)], cache_dir, cnn_runtime)[0]
+
+
+def _cnn_onset_times(activations: np.ndarray, cnn_threshold: float) -> np.ndarray:
+    return np.asarray(get_peak_picking_processor(cnn_threshold)(activations)).flatten()
+
+
+def _band_onsets_with_odf(
+    path: Path | BandAudio,
+    backend: str,
+    odf_method: str,
+    cnn_threshold: float = CNN_ONSET_THRESHOLD,
+    cache_dir: Path | str | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[np.ndarray, np.ndarray, float, int, np.ndarray | None]:
+    """
+    단일 대역 onset + strength용 ODF activation (워커 프로세스에서도 실행 가능).
+    backend "cnn": 공유 STFT 경로(_band_activations_for). 그 외: detectors로 onset, ODF는 별도 계산.
+    BandAudio(메모리 내 대역)는 "cnn" backend만 지원 (detectors는 파일 경로 입력).
+    Returns: (onset_times, odf_activation, duration, sr, samples 또는 None)
+    """
+    if backend == "cnn":
+        activations, odf_activation, duration, sr, samples = _band_activations_for(
+            path, odf_method, cache_dir, cnn_runtime
+        )
+        return _cnn_onset_times(activations, cnn_threshold), odf_activation, duration, sr, samples
+
+    if isinstance(path, BandAudio):
+        raise ValueError(f"메모리 내 대역 입력은 cnn backend만 지원합니다: {path.name} (backend: {backend})")
+    detection = get_onset_detector(backend).detect(path)
+    odf_activation = np.asarray(_ODF_GETTERS[odf_method]()(load_signal(path)))
+    return detection.times, odf_activation, detection.duration, detection.sr, None
 
+
+def _stem_band_paths(stem_folder_name: str, stems_base_dir: Path | str) -> dict[str, Path | BandAudio]:
+    """
+    {stems_base_dir}/{stem_folder_name}/drum_{low,mid,high}.wav 경로.
+    대역 파일이 없고 drums.wav가 있으면 메모리에서 분할한 BandAudio (band_split). 둘 다 없으면 FileNotFoundError.
+    """
+    folder = Path(stems_base_dir) / stem_folder_name
+    band_paths = {band: stem_file(folder, f"drum_{band}") for band in ("low", "mid", "high")}
+    missing = [p for p in band_paths.values() if not p.exists()]
+    if not missing:
+        return band_paths
+    drums_path = stem_file(folder, "drums")
+    if drums_path.exists():
+        return load_drum_bands(drums_path)
+    raise FileNotFoundError(f"필요한 파일이 없습니다: {missing[0]} (폴더: {stem_folder_name})")
+
+
+def _finalize_band_onsets(
+    band_results: dict[str, tuple[np.ndarray, np.ndarray, float, int, np.ndarray | None]],
+    band_paths: dict[str, Path | BandAudio],
+    strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]:
+    """
+    대역별 (onset_times, odf_activation, duration, sr, samples) → ODF strength 샘플링·병합·필터.
+    Returns: (band_onsets, band_strengths, duration, sr)
+    """
     band_onsets: dict[str, np.ndarray] = {}
     band_strengths: dict[str, np.ndarray] = {}
+    band_audio: dict[str, np.ndarray | Path] = {}
     duration = 0.0
     sr = 22050
 
-    import soundfile as sf
-
-    for band_key, path, odf_proc in [
-        ("low", drum_low_path, superflux_proc),
-        ("mid", drum_mid_path, superflux_proc),
-        ("high", drum_high_path, complexflux_proc),
-    ]:
-        path_str = str(path)
-        activations = cnn_proc(path_str)
-        onset_times = peak_proc(activations)
-        onset_times = np.asarray(onset_times).flatten()
-
-        info = sf.info(path_str)
-        dur = info.duration
-        if sr == 22050 and hasattr(info, "samplerate"):
-            sr = info.samplerate
+    for band_key in ("low", "mid", "high"):
+        onset_times, odf_activation, dur, band_sr, samples = band_results[band_key]
+        source = band_paths[band_key]
+        if samples is None:
+            samples = source.samples if isinstance(source, BandAudio) else source
+        band_audio[band_key] = samples
+
+        if sr == 22050:
+            sr = band_sr
         duration = max(duration, dur)
 
-        odf_activation = odf_proc(path_str)
         strengths = _sample_odf_at_times(odf_activation, onset_times, dur)
         if len(strengths) != len(onset_times):
             strengths = np.zeros(len(onset_times))  # fallback
@@ -141,7 +299,154 @@ def compute_cnn_band_onsets_with_odf(
     band_onsets, band_strengths = filter_transient_mid_high(
         band_onsets,
         band_strengths,
-        {"mid": drum_mid_path, "high": drum_high_path},
+        {"mid": band_audio["mid"], "high": band_audio["high"]},
         sr,
     )
     return band_onsets, band_strengths, duration, sr
+
+
+def compute_cnn_band_onsets_with_odf(
+    stem_folder_name: str,
+    stems_base_dir: Path | str,
+    *,
+    cnn_threshold: float = CNN_ONSET_THRESHOLD,
+    strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
+    max_workers: int | None = None,
+    cache_dir: Path | str | None = None,
+    backends: dict[str, str] | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]:
+    """
+    band별 CNN onset + ODF strength.
+    low/mid: superflux, high: complex_flux.
+    max_workers: 2 이상이면 low/mid/high CNN·ODF를 워커 프로세스(모델 로드 완료 상태)에서 병렬 실행.
+    cache_dir: activation 디스크 캐시 경로. hit면 추론 없이 peak picking·병합·필터만 실행.
+    backends: 대역별 onset backend 덮어쓰기 (예: {"low": "spectral_flux"}). strength는 backend와 무관하게 ODF.
+    cnn_runtime: "madmom" | "numpy" (float32 cnn_runtime). 순차 실행 시 CNN 대역 입력을 모아 1회 추론.
+
+    Returns:
+        (band_onsets, band_strengths, duration, sr)
+        band_onsets[band] = 1d array of onset times (sec)
+        band_strengths[band] = 1d array, same length as band_onsets[band]
+    """
+    return compute_cnn_band_onsets_from_bands(
+        _stem_band_paths(stem_folder_name, stems_base_dir),
+        cnn_threshold=cnn_threshold,
+        strength_floor=strength_floor,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+        backends=backends,
+        cnn_runtime=cnn_runtime,
+    )
+
+
+def compute_cnn_band_onsets_from_bands(
+    band_sources: dict[str, Path | BandAudio],
+    *,
+    cnn_threshold: float = CNN_ONSET_THRESHOLD,
+    strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
+    max_workers: int | None = None,
+    cache_dir: Path | str | None = None,
+    backends: dict[str, str] | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]:
+    """
+    compute_cnn_band_onsets_with_odf의 대역 입력 버전.
+    band_sources: {"low", "mid", "high": 대역 wav 경로 또는 BandAudio (band_split.load_drum_bands 결과)}.
+    BandAudio면 WAV 기록·재디코드 없이 메모리 신호로 CNN·ODF 계산. 인자·반환은 compute_cnn_band_onsets_with_odf와 동일.
+    """
+    # 프로세서·detector는 프로세스 전역 레지스트리에서 재사용 (모델·필터뱅크 1회 생성)
+    band_backends = {**BAND_ONSET_BACKENDS, **(backends or {})}
+    if max_workers is not None and max_workers > 1:
+        band_results = run_on_warm_executor(
+            {
+                band: (
+                    _band_onsets_with_odf,
+                    (path, band_backends[band], _BAND_ODF[band], cnn_threshold, cache_dir, cnn_runtime),
+                )
+                for band, path in band_sources.items()
+            },
+            max_workers,
+            warm_librosa="librosa" in band_backends.values(),
+        )
+    else:
+        cnn_bands = [band for band in band_sources if band_backends[band] == "cnn"]
+        batch = _band_activations_batch(
+            [(band_sources[band], _BAND_ODF[band]) for band in cnn_bands], cache_dir, cnn_runtime
+        )
+        band_results = {
+            band: (_cnn_onset_times(activations, cnn_threshold), *rest)
+            for band, (activations, *rest) in zip(cnn_bands, batch)
+        }
+        for band, path in band_sources.items():
+            if band not in band_results:
+                band_results[band] = _band_onsets_with_odf(path, band_backends[band], _BAND_ODF[band])
+
+    return _finalize_band_onsets(band_results, band_sources, strength_floor)
+
+
+def compute_cnn_band_onsets_with_odf_batch(
+    stem_folder_names: Sequence[str],
+    stems_base_dir: Path | str,
+    *,
+    cnn_threshold: float = CNN_ONSET_THRESHOLD,
+    strength_floor: float = STRENGTH_FLOOR_BAND_ONSET,
+    cache_dir: Path | str | None = None,
+    backends: dict[str, str] | None = None,
+    cnn_runtime: str = CNN_RUNTIME,
+    batch_frames: int = CNN_BATCH_FRAMES,
+) -> dict[str, tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]]:
+    """
+    여러 stem 폴더를 트랙 경계와 무관하게 고정 크기 CNN 배치로 묶어 추론하는 compute_cnn_band_onsets_with_odf.
+    CNN 대역 파일을 큐에 쌓다가 예상 프레임 수(헤더 길이 × fps)가 batch_frames를 넘으면
+    전처리 → 런타임과 무관하게 이어 붙인 입력으로 1회 추론(run_stacked) → 대역·트랙별로 activation 분리.
+    대역 입력(BandAudio 분할 포함)은 큐에 넣을 트랙 차례에 읽고, 트랙의 모든 대역이 끝나면 즉시 병합·필터까지
+    마치고 입력·오디오 버퍼를 해제 (메모리 ≈ 배치 1개 분량).
+    cnn_runtime: 단일 폴더 API와 같은 기본값 (constants.CNN_RUNTIME) → 같은 activation·캐시 항목.
+
+    Returns:
+        {stem_folder_name: (band_onsets, band_strengths, duration, sr)}  # 단일 호출과 같은 형식, 입력 순서 유지
+    """
+    band_backends = {**BAND_ONSET_BACKENDS, **(backends or {})}
+    cnn_bands = [band for band in ("low", "mid", "high") if band_backends[band] == "cnn"]
+    # 큐에 올라간(아직 병합 전) 트랙의 대역 입력만 보관
+    sources: dict[str, dict[str, Path | BandAudio]] = {}
+
+    results: dict[str, tuple[dict[str, np.ndarray], dict[str, np.ndarray], float, int]] = {}
+    pending: dict[str, dict[str, tuple]] = {}
+    queue: list[tuple[str, str]] = []
+    queued_frames = 0
+
+    def finish_ready() -> None:
+        for name in [n for n, bands in pending.items() if len(bands) == 3]:
+            results[name] = _finalize_band_onsets(pending.pop(name), sources.pop(name), strength_floor)
+
+    def flush() -> None:
+        nonlocal queued_frames
+        if not queue:
+            return
+        batch = _band_activations_batch(
+            [(sources[name][band], _BAND_ODF[band]) for name, band in queue], cache_dir, cnn_runtime
+        )
+        for (name, band), (activations, *rest) in zip(queue, batch):
+            pending[name][band] = (_cnn_onset_times(activations, cnn_threshold), *rest)
+        queue.clear()
+        queued_frames = 0
+        finish_ready()
+
+    for name in dict.fromkeys(stem_folder_names):
+        band_paths = sources[name] = _stem_band_paths(name, stems_base_dir)
+        pending[name] = {}
+        for band, path in band_paths.items():
+            if band not in cnn_bands:
+                pending[name][band] = _band_onsets_with_odf(path, band_backends[band], _BAND_ODF[band])
+                continue
+            queue.append((name, band))
+            duration = path.duration if isinstance(path, BandAudio) else audio_info(path)[0]
+            queued_frames += int(duration * MADMOM_FPS)
+            if queued_frames >= batch_frames:
+                flush()
+        finish_ready()
+    flush()
+    return {name: results[name] for name in stem_folder_names}
+
@@ -0,0 +1,212 @@
+"""
+madmom onset CNN(ONSETS_CNN)용 NumPy float32 추론 런타임.
+CNNOnsetProcessor와 같은 모델 파라미터를 madmom 레이어에서 읽어 재배치:
+  BatchNorm → Conv(7x3, 3→10) tanh → MaxPool(1x3) → Conv(3x3, 10→20) tanh → MaxPool(1x3)
+  → Stride(7 frames) → Dense 1120→256 sigmoid → Dense 256→1 sigmoid
+conv는 im2col(sliding_window_view) + matmul, stride+dense는 프레임 시프트 matmul 합.
+madmom은 true convolution(커널 뒤집기)·valid 패딩이므로 커널을 미리 뒤집어 둠.
+입력 = CNN 전처리 출력 (frames, 80, 3), 앞뒤 7프레임 pad 포함 → 출력 frames - 14.
+receptive field가 15프레임이므로 여러 stem/트랙 입력을 시간축으로 이어 붙여 한 번에 추론 후 잘라냄.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from audio_engine.engine.onset.constants import CNN_RUNTIME_CHUNK_FRAMES
+
+# 입력 pad(앞뒤 7) = conv1(7) + conv2(3) + stride(7) 의 receptive field - 1
+CNN_CONTEXT_FRAMES = 14
+
+
+def _activation_name(layer: Any) -> str:
+    """madmom 레이어의 activation_fn 이름 (madmom.ml.nn.activations.tanh = np.tanh → "tanh"). 없으면 "linear"."""
+    fn = getattr(layer, "activation_fn", None)
+    return "linear" if fn is None else getattr(fn, "__name__", repr(fn))
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    # 0.5 * (1 + tanh(x / 2)): overflow 없는 sigmoid
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class CnnOnsetRuntime:
+    """ONSETS_CNN float32 추론기. from_madmom()으로 CNNOnsetProcessor의 네트워크에서 생성."""
+
+    def __init__(
+        self,
+        bn_mean: np.ndarray,
+        bn_scale: np.ndarray,
+        bn_shift: np.ndarray,
+        conv1_w: np.ndarray,
+        conv1_b: np.ndarray,
+        conv2_w: np.ndarray,
+        conv2_b: np.ndarray,
+        pool1: int,
+        pool2: int,
+        stride_frames: int,
+        dense1_w: np.ndarray,
+        dense1_b: np.ndarray,
+        dense2_w: np.ndarray,
+        dense2_b: np.ndarray,
+    ) -> None:
+        f32 = np.float32
+        self.bn_mean = bn_mean.astype(f32)
+        self.bn_scale = bn_scale.astype(f32)
+        self.bn_shift = bn_shift.astype(f32)
+        # madmom conv weights: (in_ch, out_ch, kt, kf), true convolution → 뒤집어서 correlation 커널로
+        self.conv1_shape = conv1_w.shape[2:]
+        self.conv2_shape = conv2_w.shape[2:]
+        self.conv1_w = self._im2col_weights(conv1_w)
+        self.conv1_b = conv1_b.astype(f32)
+        self.conv2_w = self._im2col_weights(conv2_w)
+        self.conv2_b = conv2_b.astype(f32)
+        self.pool1 = int(pool1)
+        self.pool2 = int(pool2)
+        self.stride_frames = int(stride_frames)
+        # dense1 입력 = (stride_frames, bins, channels) 평탄화 → 프레임별 블록 (stride_frames, bins*channels, 256)
+        self.dense1_w = dense1_w.astype(f32).reshape(self.stride_frames, -1, dense1_w.shape[1])
+        self.dense1_b = dense1_b.astype(f32)
+        self.dense2_w = dense2_w.astype(f32)
+        self.dense2_b = dense2_b.astype(f32)
+
+    @staticmethod
+    def _im2col_weights(w: np.ndarray) -> np.ndarray:
+        """(in_ch, out_ch, kt, kf) → (in_ch*kt*kf, out_ch), sliding_window_view 축 순서 (c, kt, kf)와 일치."""
+        flipped = w[:, :, ::-1, ::-1].astype(np.float32)
+        in_ch, out_ch, kt, kf = flipped.shape
+        return np.ascontiguousarray(flipped.transpose(0, 2, 3, 1).reshape(in_ch * kt * kf, out_ch))
+
+    @classmethod
+    def from_madmom(cls, nn: Any) -> "CnnOnsetRuntime":
+        """madmom NeuralNetwork (CNNOnsetProcessor.processors[1])에서 파라미터 추출."""
+        bn, conv1, pool1, conv2, pool2, stride, dense1, dense2 = nn.layers
+        for pool in (pool1, pool2):
+            if tuple(pool.size) != tuple(pool.stride) or pool.size[0] != 1:
+                raise ValueError(f"지원하지 않는 MaxPool 설정: size={pool.size}, stride={pool.stride}")
+        # 런타임은 activation을 고정 구현 (_forward_chunk) → 모델의 activation_fn이 다르면 변환 거부
+        expected = (
+            ("batch_norm", bn, "linear"),
+            ("conv1", conv1, "tanh"),
+            ("conv2", conv2, "tanh"),
+            ("dense1", dense1, "sigmoid"),
+            ("dense2", dense2, "sigmoid"),
+        )
+        for label, layer, name in expected:
+            actual = _activation_name(layer)
+            if actual != name:
+                raise ValueError(f"지원하지 않는 activation: {label}={actual} (기대: {name})")
+        gamma_inv_std = np.asarray(bn.gamma * bn.inv_std, dtype=np.float64)
+        return cls(
+            bn_mean=np.asarray(bn.mean),
+            bn_scale=gamma_inv_std,
+            bn_shift=np.broadcast_to(np.asarray(bn.beta, dtype=np.float64), gamma_inv_std.shape),
+            conv1_w=np.asarray(conv1.weights),
+            conv1_b=np.asarray(conv1.bias),
+            conv2_w=np.asarray(conv2.weights),
+            conv2_b=np.asarray(conv2.bias),
+            pool1=pool1.size[1],
+            pool2=pool2.size[1],
+            stride_frames=int(stride.block_size),
+            dense1_w=np.asarray(dense1.weights),
+            dense1_b=np.asarray(dense1.bias),
+            dense2_w=np.asarray(dense2.weights),
+            dense2_b=np.asarray(dense2.bias),
+        )
+
+    @staticmethod
+    def _conv_tanh(x: np.ndarray, w: np.ndarray, b: np.ndarray, kernel: tuple[int, int]) -> np.ndarray:
+        """x: (T, F, C) → (T-kt+1, F-kf+1, out_ch). im2col 후 matmul 1회."""
+        kt, kf = kernel
+        cols = sliding_window_view(x, (kt, kf), axis=(0, 1))  # (T', F', C, kt, kf)
+        t_out, f_out = cols.shape[:2]
+        out = cols.reshape(t_out * f_out, -1) @ w
+        out += b
+        np.tanh(out, out=out)
+        return out.reshape(t_out, f_out, -1)
+
+    @staticmethod
+    def _max_pool_bins(x: np.ndarray, size: int) -> np.ndarray:
+        """주파수축 size개 묶음 최대값 (madmom MaxPool (1,size)/stride (1,size) 중앙 슬라이스와 동일)."""
+        t, f, c = x.shape
+        n = f // size
+        return x[:, : n * size].reshape(t, n, size, c).max(axis=2)
+
+    def _forward_chunk(self, x: np.ndarray) -> np.ndarray:
+        """x: (T, 80, 3) float32 → (T - CNN_CONTEXT_FRAMES,) activation."""
+        h = (x - self.bn_mean) * self.bn_scale + self.bn_shift
+        h = self._conv_tanh(h.astype(np.float32, copy=False), self.conv1_w, self.conv1_b, self.conv1_shape)
+        h = self._max_pool_bins(h, self.pool1)
+        h = self._conv_tanh(h, self.conv2_w, self.conv2_b, self.conv2_shape)
+        h = self._max_pool_bins(h, self.pool2)
+        # stride + dense1: out[n] = sum_k h[n+k] @ W[k]
+        flat = h.reshape(len(h), -1)
+        n_out = len(flat) - self.stride_frames + 1
+        dense = flat[:n_out] @ self.dense1_w[0]
+        for k in range(1, self.stride_frames):
+            dense += flat[k:k + n_out] @ self.dense1_w[k]
+        dense += self.dense1_b
+        dense = _sigmoid(dense)
+        out = _sigmoid(dense @ self.dense2_w + self.dense2_b)
+        return out.ravel()
+
+    def forward(self, x: np.ndarray, chunk_frames: int = CNN_RUNTIME_CHUNK_FRAMES) -> np.ndarray:
+        """
+        전처리된 입력 1개 (pad 포함) → activation float32 (len(x) - 14,).
+        chunk_frames 단위로 나눠 계산 (앞 청크와 14프레임 겹침) → 메모리 사용량 고정.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        n_out = len(x) - CNN_CONTEXT_FRAMES
+        if n_out <= 0:
+            return np.zeros(0, dtype=np.float32)
+        step = max(chunk_frames - CNN_CONTEXT_FRAMES, 1)
+        parts = [
+            self._forward_chunk(x[start:start + step + CNN_CONTEXT_FRAMES])
+            for start in range(0, n_out, step)
+        ]
+        return np.concatenate(parts).astype(np.float32, copy=False)
+
+    def run_batch(
+        self,
+        inputs: Sequence[np.ndarray],
+        chunk_frames: int = CNN_RUNTIME_CHUNK_FRAMES,
+    ) -> list[np.ndarray]:
+        """
+        여러 stem/트랙의 전처리 입력을 시간축으로 이어 붙여 한 번에 추론 후 입력별로 분리.
+        경계에 걸친 14프레임 출력은 버림 → 각 결과는 forward(x)와 동일.
+        """
+        return run_stacked(
+            lambda x: self.forward(x, chunk_frames=chunk_frames),
+            [np.asarray(x, dtype=np.float32) for x in inputs],
+        )
+
+
+def run_stacked(network: Callable[[np.ndarray], np.ndarray], inputs: Sequence[np.ndarray]) -> list[np.ndarray]:
+    """
+    시간축 valid 연산(출력 = 입력 - CNN_CONTEXT_FRAMES 프레임) network를 여러 입력에 1회 적용.
+    입력을 시간축으로 이어 붙여 호출 → 입력별 구간만 잘라냄 (경계에 걸친 14프레임은 버림).
+    madmom NeuralNetwork·CnnOnsetRuntime.forward 모두 해당 (conv valid·freq 방향 pool·frame별 dense).
+    """
+    if not inputs:
+        return []
+    joined = np.asarray(network(np.concatenate(inputs)))
+    results = []
+    offset = 0
+    for x in inputs:
+        n_out = max(len(x) - CNN_CONTEXT_FRAMES, 0)
+        results.append(joined[offset:offset + n_out])
+        offset += len(x)
+    return results
+
+
+def get_cnn_runtime() -> CnnOnsetRuntime:
+    """CNNOnsetProcessor 모델로 만든 런타임 (프로세스 전역 1개)."""
+    from audio_engine.engine.onset.madmom_processors import _get_or_create, get_cnn_onset_processor
+
+    return _get_or_create(
+        "cnn_runtime",
+        {},
+        lambda: CnnOnsetRuntime.from_madmom(get_cnn_onset_processor().processors[1]),
+    )
@@ -0,0 +1,377 @@
+"""
+L5 I/O Adapters: 이벤트 출력 columnar(struct-of-arrays) 형식 + 바이너리 컨테이너.
+
+행 형식(export.py 기본): events = [{필드: 값, ...}, ...] (indent=2, 키 이름이 이벤트마다 반복).
+columnar 형식: 이벤트 목록을 블록 하나로 → 필드당 배열 1개. 같은 값 배열은 alias, 상수는 const,
+문자열·역할 같은 반복 값은 사전(dict) + 코드로 저장. 행 형식으로 되돌리면 원래 JSON과 같은 값·키 순서.
+
+블록 (이벤트 목록 자리에 들어감):
+    {"n": 이벤트 수, "keys": [행 키 순서], "columns": {이름: 열}, "aliases": {이름: 원본 이름}}
+열:
+    [v0, v1, ...]                     — 숫자·bool (None 허용)
+    {"const": v}                      — 모든 행이 같은 값
+    {"dict": [값...], "codes": [...]} — 사전 인코딩 (문자열, 리스트·dict 값)
+    + "absent": [행 인덱스...]        — 해당 행에 키 자체가 없음 (예: temporal ioi_prev)
+
+바이너리 컨테이너 (.evb, 웹은 ArrayBuffer → TypedArray로 바로 읽음):
+    b"OEVB" | uint32 버전 | uint32 헤더 길이 | 헤더 JSON (utf-8) | 8바이트 정렬 | 버퍼...
+    헤더 = columnar 문서, 숫자 열·codes는 {"buf": i, ...} 로 대체.
+    buffers[i] = {"offset", "count", "dtype": f4|f8|i4|u1|u2}. 리틀 엔디언.
+    f4 열은 "decimals"로 반올림해 복원 (원래 JSON의 round(x, d) 값 그대로).
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+COLUMNAR_FORMAT = "columnar"
+COLUMNAR_VERSION = 1
+BINARY_MAGIC = b"OEVB"
+BINARY_SUFFIX = ".evb"
+# 이벤트 목록이 들어가는 최상위 키. "bands"는 {band: [이벤트...]} (drum_band_energy)
+EVENT_TABLE_KEYS = ("events", "bands")
+
+_ALIGN = 8
+_MAX_F4_DECIMALS = 6
+
+
+# ---------------------------------------------------------------------------
+# 행 ↔ 열
+# ---------------------------------------------------------------------------
+
+
+def _is_numeric(v: Any) -> bool:
+    return v is None or isinstance(v, (bool, int, float))
+
+
+def _dict_key(v: Any) -> str:
+    return json.dumps(v, sort_keys=False, ensure_ascii=False)
+
+
+def rows_to_block(rows: list[dict]) -> dict[str, Any]:
+    """이벤트 dict 목록 → columnar 블록."""
+    # 키 순서: 처음 나온 행 기준. 일부 행에만 있는 키는 그 행에서 바로 앞 키 뒤에 삽입 (행별 순서 유지)
+    keys: list[str] = []
+    seen: set[str] = set()
+    for row in rows:
+        prev = None
+        for k in row:
+            if k not in seen:
+                seen.add(k)
+                keys.insert(keys.index(prev) + 1 if prev is not None else 0, k)
+            prev = k
+
+    columns: dict[str, Any] = {}
+    aliases: dict[str, str] = {}
+    by_values: dict[str, str] = {}
+    for k in keys:
+        values = [row.get(k) for row in rows]
+        absent = [i for i, row in enumerate(rows) if k not in row]
+        # 같은 값 배열이 이미 있으면 alias (t/time, strength/e_norm/energy_score ...)
+        sig = _dict_key([values, absent])
+        if sig in by_values:
+            aliases[k] = by_values[sig]
+            continue
+        by_values[sig] = k
+
+        present = [v for i, v in enumerate(values) if k in rows[i]]
+        first = present[0] if present else None
+        if len(rows) > 1 and present and all(v == first and type(v) is type(first) for v in present):
+            col: Any = {"const": present[0]}
+        elif all(_is_numeric(v) for v in values):
+            col = values
+        else:
+            table: dict[str, int] = {}
+            uniq: list[Any] = []
+            codes = []
+            for v in values:
+                key = _dict_key(v)
+                if key not in table:
+                    table[key] = len(uniq)
+                    uniq.append(v)
+                codes.append(table[key])
+            col = {"dict": uniq, "codes": codes}
+        if absent:
+            col = {"values": col, "absent": absent} if isinstance(col, list) else {**col, "absent": absent}
+        columns[k] = col
+    return {"n": len(rows), "keys": keys, "columns": columns, "aliases": aliases}
+
+
+def _column_values(col: Any, n: int) -> Any:
+    if isinstance(col, (list, np.ndarray)):
+        return col
+    if "values" in col:
+        return col["values"]
+    if "const" in col:
+        return [col["const"]] * n
+    uniq = col["dict"]
+    return [uniq[c] for c in col["codes"]]
+
+
+def block_to_rows(block: dict[str, Any]) -> list[dict]:
+    """columnar 블록 → 이벤트 dict 목록 (키 순서·생략된 키 복원)."""
+    n = int(block["n"])
+    columns = block["columns"]
+    aliases = block.get("aliases", {})
+    values: dict[str, list[Any]] = {}
+    absent: dict[str, set[int]] = {}
+    for k in block["keys"]:
+        src = aliases.get(k, k)
+        col = columns[src]
+        if src not in values:
+            values[src] = _column_values(col, n)
+            absent[src] = set(col.get("absent", ())) if isinstance(col, dict) else set()
+    rows = []
+    for i in range(n):
+        row = {}
+        for k in block["keys"]:
+            src = aliases.get(k, k)
+            if i not in absent[src]:
+                row[k] = values[src][i]
+        rows.append(row)
+    return rows
+
+
+def _is_block(v: Any) -> bool:
+    return isinstance(v, dict) and "columns" in v and "keys" in v and "n" in v
+
+
+def _is_rows(v: Any) -> bool:
+    return isinstance(v, list) and all(isinstance(x, dict) for x in v)
+
+
+def to_columnar(doc: dict[str, Any]) -> dict[str, Any]:
+    """행 형식 문서 → columnar 문서 (EVENT_TABLE_KEYS의 이벤트 목록만 변환, 나머지 키는 그대로)."""
+    out: dict[str, Any] = {"format": COLUMNAR_FORMAT, "format_version": COLUMNAR_VERSION}
+    for k, v in doc.items():
+        if k in EVENT_TABLE_KEYS and _is_rows(v):
+            out[k] = rows_to_block(v)
+        elif k in EVENT_TABLE_KEYS and isinstance(v, dict) and v and all(_is_rows(x) for x in v.values()):
+            out[k] = {name: rows_to_block(rows) for name, rows in v.items()}
+        else:
+            out[k] = v
+    return out
+
+
+def is_columnar(doc: Any) -> bool:
+    return isinstance(doc, dict) and doc.get("format") == COLUMNAR_FORMAT
+
+
+def from_columnar(doc: dict[str, Any]) -> dict[str, Any]:
+    """columnar 문서 → 행 형식 문서 (export.py가 쓰는 JSON과 같은 구조). 행 형식이면 그대로 반환."""
+    if not is_columnar(doc):
+        return doc
+    out: dict[str, Any] = {}
+    for k, v in doc.items():
+        if k in ("format", "format_version"):
+            continue
+        if _is_block(v):
+            out[k] = block_to_rows(v)
+        elif k in EVENT_TABLE_KEYS and isinstance(v, dict) and v and all(_is_block(x) for x in v.values()):
+            out[k] = {name: block_to_rows(b) for name, b in v.items()}
+        else:
+            out[k] = v
+    return out
+
+
+# ---------------------------------------------------------------------------
+# 바이너리 컨테이너
+# ---------------------------------------------------------------------------
+
+
+def _numeric_buffer(values: list[Any]) -> tuple[np.ndarray, dict[str, Any]]:
+    """숫자 열 → (배열, 열 메타). None은 NaN (nulls), bool은 u1."""
+    meta: dict[str, Any] = {}
+    if any(v is None for v in values):
+        meta["nulls"] = True
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present) and not meta:
+        meta["bool"] = True
+        return np.asarray(values, dtype=np.uint8), meta
+    if present and all(isinstance(v, int) and not isinstance(v, bool) for v in present) and not meta:
+        arr = np.asarray(values, dtype=np.int64)
+        if arr.size == 0 or (arr.min() >= -(2**31) and arr.max() < 2**31):
+            meta["int"] = True
+            return arr.astype(np.int32), meta
+    arr = np.asarray([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+    finite = arr[np.isfinite(arr)]
+    f4 = finite.astype(np.float32).astype(np.float64)
+    # 값이 소수점 d자리 이하(round(x, d) 결과)이고 f4 → 반올림으로 그대로 복원되면 f4
+    for d in range(_MAX_F4_DECIMALS + 1):
+        if np.array_equal(np.round(finite, d), finite):
+            if np.array_equal(np.round(f4, d), finite):
+                meta["decimals"] = d
+                return arr.astype(np.float32), meta
+            break
+    return arr, meta
+
+
+def encode_binary(doc: dict[str, Any]) -> bytes:
+    """행 또는 columnar 문서 → .evb 바이트."""
+    header = to_columnar(doc) if not is_columnar(doc) else json.loads(json.dumps(doc))
+    buffers: list[np.ndarray] = []
+    specs: list[dict[str, Any]] = []
+
+    def add(arr: np.ndarray) -> int:
+        buffers.append(np.ascontiguousarray(arr.astype(arr.dtype.newbyteorder("<"), copy=False)))
+        specs.append({"count": int(arr.size), "dtype": arr.dtype.str[1:]})
+        return len(buffers) - 1
+
+    def pack_block(block: dict[str, Any]) -> None:
+        for name, col in block["columns"].items():
+            inner = col["values"] if isinstance(col, dict) and "values" in col else col
+            if isinstance(inner, list):
+                arr, meta = _numeric_buffer(inner)
+                packed = {"buf": add(arr), **meta}
+                block["columns"][name] = {**col, "values": packed} if inner is not col else packed
+            elif isinstance(col, dict) and "codes" in col:
+                codes = np.asarray(col["codes"], dtype=np.uint8 if len(col["dict"]) <= 256 else np.uint16)
+                col["codes"] = {"buf": add(codes)}
+
+    for k, v in header.items():
+        if _is_block(v):
+            pack_block(v)
+        elif isinstance(v, dict):
+            for b in v.values():
+                if _is_block(b):
+                    pack_block(b)
+
+    # 헤더 길이가 offset에 영향 → offset은 버퍼 영역 기준 상대값
+    offset = 0
+    for spec, arr in zip(specs, buffers):
+        spec["offset"] = offset
+        offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+    header["buffers"] = specs
+    head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    prefix = BINARY_MAGIC + struct.pack("<II", COLUMNAR_VERSION, len(head)) + head
+    prefix += b"\0" * (-len(prefix) % _ALIGN)
+    body = bytearray(offset)
+    for spec, arr in zip(specs, buffers):
+        raw = arr.tobytes()
+        body[spec["offset"]:spec["offset"] + len(raw)] = raw
+    return prefix + bytes(body)
+
+
+def _unpack_numeric(arr: np.ndarray, meta: dict[str, Any]) -> list[Any]:
+    if meta.get("bool"):
+        return [bool(x) for x in arr]
+    if meta.get("int"):
+        return [int(x) for x in arr]
+    d = meta.get("decimals")
+    vals = np.round(arr.astype(np.float64), d) if d is not None else arr.astype(np.float64)
+    if meta.get("nulls"):
+        return [None if np.isnan(x) else float(x) for x in vals]
+    return [float(x) for x in vals]
+
+
+def decode_binary(data: bytes, as_arrays: bool = False) -> dict[str, Any]:
+    """
+    .evb 바이트 → columnar 문서.
+    as_arrays=True면 숫자 열을 numpy 배열(복사 없는 view, f4는 float32)로 둠 → 분석용 빠른 경로.
+    """
+    if data[:4] != BINARY_MAGIC:
+        raise ValueError("OEVB 컨테이너가 아닙니다")
+    version, head_len = struct.unpack_from("<II", data, 4)
+    if version > COLUMNAR_VERSION:
+        raise ValueError(f"지원하지 않는 OEVB 버전: {version}")
+    start = 12 + head_len
+    header = json.loads(bytes(data[12:start]).decode("utf-8"))
+    base = start + (-start % _ALIGN)
+    specs = header.pop("buffers")
+    arrays = [
+        np.frombuffer(data, dtype=np.dtype("<" + s["dtype"]), count=s["count"], offset=base + s["offset"])
+        for s in specs
+    ]
+
+    def unpack(ref: dict[str, Any]) -> Any:
+        arr = arrays[ref["buf"]]
+        return arr if as_arrays else _unpack_numeric(arr, ref)
+
+    def unpack_block(block: dict[str, Any]) -> None:
+        for name, col in block["columns"].items():
+            if isinstance(col, dict) and "buf" in col:
+                block["columns"][name] = unpack(col)
+            elif isinstance(col, dict) and isinstance(col.get("values"), dict):
+                block["columns"][name] = {**col, "values": unpack(col["values"])}
+            elif isinstance(col, dict) and isinstance(col.get("codes"), dict):
+                codes = arrays[col["codes"]["buf"]]
+                col["codes"] = codes if as_arrays else codes.tolist()
+
+    for v in header.values():
+        if _is_block(v):
+            unpack_block(v)
+        elif isinstance(v, dict):
+            for b in v.values():
+                if _is_block(b):
+                    unpack_block(b)
+    return header
+
+
+# ---------------------------------------------------------------------------
+# 파일 I/O
+# ---------------------------------------------------------------------------
+
+
+def write_event_doc(doc: dict[str, Any], path: Path | str, fmt: str = "columnar") -> Path:
+    """
+    행 형식 문서 → 파일. fmt: "rows" (기존 indent=2 JSON) | "columnar" (compact JSON) | "binary" (.evb).
+    binary는 path 확장자를 .evb로 바꿔 기록. Returns: 실제 기록 경로.
+    """
+    path = Path(path)
+    if fmt == "binary":
+        path = path.with_suffix(BINARY_SUFFIX)
+        data = encode_binary(doc)
+    elif fmt == "columnar":
+        data = json.dumps(to_columnar(doc), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    elif fmt == "rows":
+        data = json.dumps(doc, ensure_ascii=False, indent=2).encode("utf-8")
+    else:
+        raise ValueError(f"알 수 없는 이벤트 출력 형식: {fmt} (가능: rows, columnar, binary)")
+    # 임시 파일 → rename: 기존 파일이 web/public·artifact 저장소 객체와 하드링크여도 그쪽 내용은 바뀌지 않음
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+
+def read_event_doc(path: Path | str) -> dict[str, Any]:
+    """행·columnar JSON·.evb 어느 형식이든 → 행 형식 문서 (기존 json.load 결과와 같은 구조)."""
+    path = Path(path)
+    data = path.read_bytes()
+    if data[:4] == BINARY_MAGIC:
+        return from_columnar(decode_binary(data))
+    return from_columnar(json.loads(data.decode("utf-8")))
+
+
+def read_event_columns(path: Path | str, key: str = "events") -> dict[str, Any]:
+    """
+    파일의 이벤트 목록 하나 → {필드: 배열} (alias 포함). 숫자 열은 numpy 배열, 그 외는 list.
+    key: "events" 또는 "bands/low" 처럼 중첩 경로. 행 형식 파일도 열로 변환해 반환.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    doc = decode_binary(data, as_arrays=True) if data[:4] == BINARY_MAGIC else json.loads(data.decode("utf-8"))
+    node: Any = doc
+    for part in key.split("/"):
+        node = node[part]
+    block = node if _is_block(node) else rows_to_block(node)
+    n = int(block["n"])
+    out: dict[str, Any] = {}
+    for k in block["keys"]:
+        col = block["columns"][block["aliases"].get(k, k)]
+        values = _column_values(col, n)
+        if isinstance(values, np.ndarray):
+            out[k] = values
+        elif all(_is_numeric(v) for v in values):
+            out[k] = np.asarray([np.nan if v is None else v for v in values])
+        else:
+            out[k] = list(values)
+    return out
@@ -80,6 +80,26 @@ SECTION_CHANGE_THRESHOLD = 0.5  # or median + 3*MAD
 MIN_SECTION_SEC = 4.0
 SECTION_DEBOUNCE_WINDOWS = 2
 SECTION_MERGE_NEAR_SEC = 1.0
+# 계층 섹션: coarse → fine 윈도우 스케일(초). min_section/merge_near는 SECTION_WINDOW_SEC 대비 비율로 스케일
+SECTION_HIERARCHY_WINDOW_SECS = (8.0, 4.0, 2.0)
+
+# madmom onset (CNN/RNN activation, OnsetPeakPickingProcessor)
+MADMOM_FPS = 100
+CNN_ONSET_THRESHOLD = 0.35
+RNN_ONSET_THRESHOLD = 0.4
+PEAK_PICK_PRE_MAX_SEC = 0.02
+PEAK_PICK_POST_MAX_SEC = 0.02
+PEAK_PICK_COMBINE_SEC = 0.03
+# CNN 추론 런타임: "madmom" (레이어별 float64/float32 혼합, 기준) | "numpy" (cnn_runtime float32 im2col)
+CNN_RUNTIME = "madmom"
+CNN_RUNTIME_CHUNK_FRAMES = 1024  # numpy 런타임 청크 길이 (프레임, 100fps 기준 약 10초)
+CNN_BATCH_FRAMES = 16384  # 트랙 간 배치 추론 1회 분량 (프레임, 100fps 기준 약 164초)
+# Onset detector backend (detectors.py): "cnn" | "rnn" | "spectral_flux" | "librosa"
+# 대역별 기본 backend. 희소한 low(킥)는 "spectral_flux"로 바꾸면 CNN 대비 수 배 빠름
+BAND_ONSET_BACKENDS = {"low": "cnn", "mid": "cnn", "high": "cnn"}
+SPECTRAL_FLUX_ONSET_THRESHOLD = 0.1  # max 정규화 superflux ODF 기준
+# threshold 스윕 기본 격자 (peak_sweep, 대역별 threshold 보정용)
+PEAK_SWEEP_THRESHOLDS = tuple(round(0.05 * i, 2) for i in range(1, 19))  # 0.05 ~ 0.9
 
 # Export
 DEFAULT_POINT_COLOR = "#5a9fd4"
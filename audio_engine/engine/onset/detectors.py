@@ -0,0 +1,230 @@
+"""
+Onset 검출 backend 공통 인터페이스.
+OnsetDetector.detect(audio_path) → OnsetDetection(times, strengths, activation, fps, duration, sr).
+backend: "cnn" (madmom CNN), "rnn" (madmom RNN), "spectral_flux" (madmom superflux ODF), "librosa" (onset_strength).
+activation은 모두 0~1 스케일 (CNN/RNN은 sigmoid 출력, spectral_flux/librosa는 max 정규화) → strength floor 공유 가능.
+각 인스턴스는 처리한 오디오 길이·소요 시간을 누적 (stats) → 대역별 backend 선택 근거.
+"""
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+import numpy as np
+
+from audio_engine.engine.io import audio_info, load_audio
+from audio_engine.engine.onset.constants import (
+    CNN_ONSET_THRESHOLD,
+    CNN_RUNTIME,
+    DEFAULT_DELTA,
+    DEFAULT_HOP_LENGTH,
+    DEFAULT_WAIT,
+    MADMOM_FPS,
+    RNN_ONSET_THRESHOLD,
+    SPECTRAL_FLUX_ONSET_THRESHOLD,
+)
+
+
+class OnsetDetection(NamedTuple):
+    """단일 오디오 onset 검출 결과. times(초)와 strengths는 같은 길이, activation은 fps 프레임 단위."""
+    times: np.ndarray
+    strengths: np.ndarray
+    activation: np.ndarray
+    fps: float
+    duration: float
+    sr: int
+
+
+@dataclass
+class DetectorStats:
+    """backend별 누적 처리량. realtime_factor = 처리한 오디오 초 / 소요 초 (클수록 빠름)."""
+    calls: int = 0
+    audio_sec: float = 0.0
+    wall_sec: float = 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_sec / self.wall_sec if self.wall_sec > 0 else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "audio_sec": round(self.audio_sec, 4),
+            "wall_sec": round(self.wall_sec, 4),
+            "realtime_factor": round(self.realtime_factor, 2),
+        }
+
+
+class OnsetDetector(Protocol):
+    name: str
+    stats: DetectorStats
+
+    def detect(self, audio_path: Path | str) -> OnsetDetection:
+        ...
+
+
+def sample_activation(activation: np.ndarray, times: np.ndarray, fps: float) -> np.ndarray:
+    """activation을 onset 시각(초)의 프레임에서 샘플링."""
+    if len(times) == 0 or len(activation) == 0:
+        return np.array([])
+    indices = np.clip(np.round(np.asarray(times) * fps).astype(int), 0, len(activation) - 1)
+    return np.asarray(activation, dtype=float)[indices]
+
+
+class _TimedDetector(ABC):
+    """detect() 호출마다 stats 누적. 하위 클래스는 _detect만 구현 (없으면 인스턴스 생성 시 TypeError)."""
+    name = ""
+
+    def __init__(self) -> None:
+        self.stats = DetectorStats()
+
+    def detect(self, audio_path: Path | str) -> OnsetDetection:
+        start = time.perf_counter()
+        result = self._detect(Path(audio_path))
+        self.stats.calls += 1
+        self.stats.audio_sec += result.duration
+        self.stats.wall_sec += time.perf_counter() - start
+        return result
+
+    @abstractmethod
+    def _detect(self, audio_path: Path) -> OnsetDetection:
+        ...
+
+
+def _peak_pick(activation: np.ndarray, threshold: float, fps: float = MADMOM_FPS) -> np.ndarray:
+    from audio_engine.engine.onset.madmom_processors import get_peak_picking_processor
+
+    return np.asarray(get_peak_picking_processor(threshold, fps=fps)(activation)).flatten()
+
+
+class CnnOnsetDetector(_TimedDetector):
+    """
+    madmom CNNOnsetProcessor + OnsetPeakPickingProcessor. cache_dir 지정 시 activation_cache 사용.
+    cnn_runtime="numpy"면 네트워크를 cnn_runtime(float32)으로 실행.
+    """
+    name = "cnn"
+
+    def __init__(
+        self,
+        threshold: float = CNN_ONSET_THRESHOLD,
+        cache_dir: Path | str | None = None,
+        cnn_runtime: str = CNN_RUNTIME,
+    ) -> None:
+        super().__init__()
+        self.threshold = threshold
+        self.cache_dir = cache_dir
+        self.cnn_runtime = cnn_runtime
+
+    def _detect(self, audio_path: Path) -> OnsetDetection:
+        from audio_engine.engine.onset.cnn_band_onsets import _cnn_activation
+
+        activation, duration, sr = _cnn_activation(audio_path, self.cache_dir, self.cnn_runtime)
+        times = _peak_pick(activation, self.threshold)
+        return OnsetDetection(times, sample_activation(activation, times, MADMOM_FPS), activation, MADMOM_FPS, duration, sr)
+
+
+class RnnOnsetDetector(_TimedDetector):
+    """madmom RNNOnsetProcessor + OnsetPeakPickingProcessor."""
+    name = "rnn"
+
+    def __init__(self, threshold: float = RNN_ONSET_THRESHOLD) -> None:
+        super().__init__()
+        self.threshold = threshold
+
+    def _detect(self, audio_path: Path) -> OnsetDetection:
+        from audio_engine.engine.onset.madmom_processors import get_rnn_onset_processor, load_signal
+
+        activation = np.asarray(get_rnn_onset_processor()(load_signal(audio_path)))
+        times = _peak_pick(activation, self.threshold)
+        duration, sr = audio_info(audio_path)
+        return OnsetDetection(times, sample_activation(activation, times, MADMOM_FPS), activation, MADMOM_FPS, duration, sr)
+
+
+class SpectralFluxOnsetDetector(_TimedDetector):
+    """
+    madmom superflux ODF(max 정규화) + peak picking. 신경망 없음 → CNN 대비 수 배 빠름.
+    킥처럼 희소하고 트랜지언트가 뚜렷한 대역용.
+    """
+    name = "spectral_flux"
+
+    def __init__(self, threshold: float = SPECTRAL_FLUX_ONSET_THRESHOLD) -> None:
+        super().__init__()
+        self.threshold = threshold
+
+    def _detect(self, audio_path: Path) -> OnsetDetection:
+        from audio_engine.engine.onset.madmom_processors import get_superflux_processor, load_signal
+
+        odf = np.asarray(get_superflux_processor()(load_signal(audio_path)), dtype=np.float32)
+        peak = float(odf.max()) if len(odf) else 0.0
+        activation = odf / peak if peak > 0 else odf
+        times = _peak_pick(activation, self.threshold)
+        duration, sr = audio_info(audio_path)
+        return OnsetDetection(times, sample_activation(activation, times, MADMOM_FPS), activation, MADMOM_FPS, duration, sr)
+
+
+class LibrosaOnsetDetector(_TimedDetector):
+    """librosa onset_strength + onset_detect (pipeline.detect_onsets). activation은 min-max 정규화 envelope."""
+    name = "librosa"
+
+    def __init__(
+        self,
+        sr: int = 22050,
+        hop_length: int = DEFAULT_HOP_LENGTH,
+        delta: float = DEFAULT_DELTA,
+        wait: int = DEFAULT_WAIT,
+    ) -> None:
+        super().__init__()
+        self.sr = sr
+        self.hop_length = hop_length
+        self.delta = delta
+        self.wait = wait
+
+    def _detect(self, audio_path: Path) -> OnsetDetection:
+        from audio_engine.engine.onset.pipeline import detect_onsets
+
+        y, sr = load_audio(audio_path, sr=self.sr, mono=True)
+        _, times, onset_env, _ = detect_onsets(y, sr, hop_length=self.hop_length, delta=self.delta, wait=self.wait)
+        env_min = float(onset_env.min()) if len(onset_env) else 0.0
+        span = float(onset_env.max()) - env_min if len(onset_env) else 0.0
+        activation = (onset_env - env_min) / span if span > 0 else onset_env - env_min
+        fps = sr / self.hop_length
+        return OnsetDetection(times, sample_activation(activation, times, fps), activation, fps, len(y) / sr, sr)
+
+
+ONSET_DETECTORS: dict[str, type] = {
+    CnnOnsetDetector.name: CnnOnsetDetector,
+    RnnOnsetDetector.name: RnnOnsetDetector,
+    SpectralFluxOnsetDetector.name: SpectralFluxOnsetDetector,
+    LibrosaOnsetDetector.name: LibrosaOnsetDetector,
+}
+
+_DETECTORS: dict[tuple, OnsetDetector] = {}
+
+
+def get_onset_detector(name: str, **kwargs: Any) -> OnsetDetector:
+    """
+    backend 이름·설정별 detector 1개 (프로세스 전역 재사용 → stats 누적).
+    워커 프로세스에서 실행한 detect의 stats는 해당 워커에만 누적됨.
+    """
+    if name not in ONSET_DETECTORS:
+        raise ValueError(f"알 수 없는 onset backend: {name} (가능: {', '.join(ONSET_DETECTORS)})")
+    key = (name, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+    detector = _DETECTORS.get(key)
+    if detector is None:
+        detector = ONSET_DETECTORS[name](**kwargs)
+        _DETECTORS[key] = detector
+    return detector
+
+
+def detector_throughput() -> dict[str, dict[str, float]]:
+    """지금까지 생성된 detector별 처리량 (backend 이름 기준 합산)."""
+    totals: dict[str, DetectorStats] = {}
+    for (name, _), detector in _DETECTORS.items():
+        total = totals.setdefault(name, DetectorStats())
+        total.calls += detector.stats.calls
+        total.audio_sec += detector.stats.audio_sec
+        total.wall_sec += detector.stats.wall_sec
+    return {name: stats.as_dict() for name, stats in totals.items()}
@@ -10,9 +10,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import librosa
 import numpy as np
 
+from audio_engine.engine.io import load_audio, stem_file
 from audio_engine.engine.onset.pipeline import build_context
 from audio_engine.engine.onset.types import OnsetContext
 from audio_engine.engine.onset.utils import robust_norm
@@ -28,7 +28,7 @@ def _band_onset_energies(audio_path: Path) -> tuple[np.ndarray, np.ndarray, floa
     duration = ctx.duration
     n_events = ctx.n_events
     sr = ctx.sr
-    y, _ = librosa.load(audio_path, sr=sr, mono=True)
+    y, _ = load_audio(audio_path, sr=sr, mono=True)
 
     energy_arr: list[float] = []
     for i in range(n_events):
@@ -76,9 +76,9 @@ def compute_drum_band_energy(
     """
     stems_base_dir = Path(stems_base_dir)
     folder = stems_base_dir / stem_folder_name
-    drum_low_path = folder / "drum_low.wav"
-    drum_mid_path = folder / "drum_mid.wav"
-    drum_high_path = folder / "drum_high.wav"
+    drum_low_path = stem_file(folder, "drum_low")
+    drum_mid_path = stem_file(folder, "drum_mid")
+    drum_high_path = stem_file(folder, "drum_high")
 
     for p in (drum_low_path, drum_mid_path, drum_high_path):
         if not p.exists():
@@ -0,0 +1,155 @@
+"""
+L5 I/O Adapters: 웹 타임라인용 이벤트 LOD 피라미드 (줌 레벨별 타일).
+
+긴 트랙은 band onset이 수만 개 → 뷰어가 전부 받아 전부 그리면 첫 화면이 느림.
+레벨 l은 트랙을 2**l개 시간 타일로 나누고, 타일마다 최대 max_per_tile개만 남김 (레이어 우선순위
+P0 > P1 > P2, 같은 레이어는 strength 큰 순). 마지막 레벨은 항상 전체 이벤트 (complete).
+같은 순위 기준이므로 상위 레벨 타일의 이벤트는 하위 레벨 타일에도 그대로 있음.
+
+디렉터리 구조 ({이름}.lod/):
+    index.json         — {format, format_version, source, duration_sec, n_events, max_per_tile,
+                          layer_priority, tile_path, levels: [{level, tile_sec, n_tiles, complete, counts}]}
+    {level}/{tile}.json — columnar compact JSON {level, tile, t0, t1, events} (빈 타일은 파일 없음)
+뷰어(web eventPyramid.ts)는 index로 줌에 맞는 레벨을 고르고 보이는 구간 타일만 요청.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from audio_engine.engine.onset.columnar import to_columnar
+
+PYRAMID_FORMAT = "event_pyramid"
+PYRAMID_VERSION = 1
+PYRAMID_SUFFIX = ".lod"
+INDEX_NAME = "index.json"
+TILE_PATH = "{level}/{tile}.json"
+# 낮을수록 먼저 남김. 알 수 없는 레이어는 P2 취급
+LAYER_PRIORITY = {"P0": 0, "P1": 1, "P2": 2}
+DEFAULT_MAX_PER_TILE = 256
+# 타일이 이보다 짧아지면 더 쪼개지 않고 그 레벨에 전체 이벤트를 넣음
+DEFAULT_MIN_TILE_SEC = 0.5
+
+
+def _event_time(ev: dict) -> float:
+    return float(ev.get("t", ev.get("time", 0.0)))
+
+
+def _event_layer(ev: dict) -> str:
+    """layer 필드 우선. 없으면 roles의 주 역할 (export.build_layered_doc와 같은 규칙)."""
+    layer = ev.get("layer")
+    if layer in LAYER_PRIORITY:
+        return layer
+    roles = ev.get("roles") or {}
+    return "P2" if roles.get("P2") else "P1" if roles.get("P1") else "P0" if roles else "P2"
+
+
+def _rank_key(ev: dict) -> tuple:
+    return (LAYER_PRIORITY[_event_layer(ev)], -float(ev.get("strength", 0.0)), _event_time(ev))
+
+
+def build_event_pyramid(
+    events: list[dict],
+    duration_sec: float,
+    source: str = "unknown",
+    max_per_tile: int = DEFAULT_MAX_PER_TILE,
+    min_tile_sec: float = DEFAULT_MIN_TILE_SEC,
+) -> tuple[dict, dict[tuple[int, int], list[dict]]]:
+    """
+    이벤트 목록 → (index, {(level, tile): 이벤트 목록}).
+    레벨 0 = 트랙 전체 타일 1개. 모든 타일이 max_per_tile 이하가 되거나 타일이 min_tile_sec보다
+    짧아지는 레벨에서 멈추고, 그 레벨은 전체 이벤트를 담음. 타일 안 이벤트는 시간순.
+    """
+    duration = max(float(duration_sec), max((_event_time(e) for e in events), default=0.0), 1e-6)
+    ranked = sorted(events, key=_rank_key)
+    levels: list[dict] = []
+    tiles: dict[tuple[int, int], list[dict]] = {}
+    level = 0
+    while True:
+        n_tiles = 2 ** level
+        tile_sec = duration / n_tiles
+        buckets: list[list[dict]] = [[] for _ in range(n_tiles)]
+        for ev in ranked:
+            buckets[min(int(_event_time(ev) / tile_sec), n_tiles - 1)].append(ev)
+        complete = all(len(b) <= max_per_tile for b in buckets) or tile_sec / 2 < min_tile_sec
+        counts = []
+        for i, bucket in enumerate(buckets):
+            kept = bucket if complete else bucket[:max_per_tile]
+            counts.append(len(kept))
+            if kept:
+                tiles[(level, i)] = sorted(kept, key=_event_time)
+        levels.append({
+            "level": level,
+            "tile_sec": round(tile_sec, 6),
+            "n_tiles": n_tiles,
+            "complete": complete,
+            "counts": counts,
+        })
+        if complete:
+            break
+        level += 1
+
+    index = {
+        "format": PYRAMID_FORMAT,
+        "format_version": PYRAMID_VERSION,
+        "source": source,
+        "duration_sec": round(duration, 4),
+        "n_events": len(events),
+        "max_per_tile": max_per_tile,
+        "layer_priority": sorted(LAYER_PRIORITY, key=LAYER_PRIORITY.get),
+        "tile_path": TILE_PATH,
+        "levels": levels,
+    }
+    return index, tiles
+
+
+def write_event_pyramid(
+    events: list[dict],
+    path: Path | str,
+    duration_sec: float,
+    source: str = "unknown",
+    project_root: Optional[Path | str] = None,
+    max_per_tile: int = DEFAULT_MAX_PER_TILE,
+    min_tile_sec: float = DEFAULT_MIN_TILE_SEC,
+) -> Path:
+    """
+    build_event_pyramid → {path}.lod/ (index.json + 타일). 기존 디렉터리는 지우고 새로 씀 (남은 타일 방지).
+    project_root가 있으면 web/public/{이름}.lod/ 로 복사. Returns: index.json 경로.
+    """
+    from audio_engine.engine.onset.export import _copy_dir_to_web_public, _replace_dir
+
+    path = Path(path)
+    if path.suffix != PYRAMID_SUFFIX:
+        path = path.with_suffix(PYRAMID_SUFFIX)
+    index, tiles = build_event_pyramid(events, duration_sec, source, max_per_tile, min_tile_sec)
+    _replace_dir(path)
+    for (level, tile), rows in tiles.items():
+        level_info = index["levels"][level]
+        t0 = level_info["tile_sec"] * tile
+        doc = {
+            "level": level,
+            "tile": tile,
+            "t0": round(t0, 4),
+            "t1": round(t0 + level_info["tile_sec"], 4),
+            "events": rows,
+        }
+        tile_path = path / TILE_PATH.format(level=level, tile=tile)
+        tile_path.parent.mkdir(exist_ok=True)
+        with open(tile_path, "w", encoding="utf-8") as f:
+            json.dump(to_columnar(doc), f, ensure_ascii=False, separators=(",", ":"))
+    index_path = path / INDEX_NAME
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    if project_root is not None:
+        _copy_dir_to_web_public(path, Path(project_root))
+    return index_path
+
+
+def read_event_pyramid_index(path: Path | str) -> dict[str, Any]:
+    """{이름}.lod 디렉터리 또는 index.json 경로 → index."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / INDEX_NAME
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -1,16 +1,19 @@
 """
 L5 I/O Adapters: JSON·경로·웹 복사 (도메인 결과 ↔ 파일시스템).
-스키마별 JSON 쓰기, web/public 복사. L1 타입, L2 Context, L3 결과, L4 role_composition 사용.
+스키마별 JSON 쓰기 (fmt: rows | columnar | binary), web/public 복사. L1 타입, L2 Context, L3 결과, L4 role_composition 사용.
 """
 from __future__ import annotations
 
 import json
+import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import numpy as np
 
+from audio_engine.engine.io import link_file
+from audio_engine.engine.onset.columnar import write_event_doc
 from audio_engine.engine.onset.types import OnsetContext
 from audio_engine.engine.onset.constants import (
     DEFAULT_HOP_LENGTH,
@@ -26,24 +29,101 @@ def _ensure_dir(path: Path) -> None:
 
 
 def _copy_to_web_public(json_path: Path, project_root: Optional[Path]) -> None:
+    """web/public/{이름}에 게시. 복사 대신 io.link_file (하드링크 → 심볼릭 링크 → 복사, rename으로 교체)."""
     if project_root is None:
         return
     web_public = project_root / "web" / "public"
     if web_public.is_dir():
-        shutil.copy(json_path, web_public / json_path.name)
+        link_file(json_path, web_public / json_path.name)
 
 
-def write_energy_json(
+def _replace_dir(path: Path) -> None:
+    """타일 디렉터리 출력용: 기존 디렉터리를 지우고 새로 만듦 (이전 실행의 남은 타일 방지)."""
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+
+def _copy_dir_to_web_public(dir_path: Path, project_root: Optional[Path]) -> None:
+    """디렉터리 출력(.lod, .spec)을 web/public/{이름}/ 으로 통째로 교체 게시 (파일은 link_file)."""
+    if project_root is None:
+        return
+    web_public = project_root / "web" / "public"
+    if web_public.is_dir():
+        dest = web_public / dir_path.name
+        if dest.exists():
+            shutil.rmtree(dest)
+        for src in dir_path.rglob("*"):
+            if src.is_file():
+                link_file(src, dest / src.relative_to(dir_path))
+
+
+def _write_output(out: dict, path: Path, project_root: Optional[Path | str], fmt: str) -> Path:
+    """
+    fmt: "rows" (기존 이벤트별 dict, indent=2) | "columnar" (필드별 배열, compact JSON) | "binary" (.evb).
+    columnar·binary는 columnar.py 참고. 읽기는 columnar.read_event_doc / web parseEvents가 형식 무관 처리.
+    """
+    path = write_event_doc(out, path, fmt)
+    if project_root is not None:
+        _copy_to_web_public(path, Path(project_root))
+    return path
+
+
+def _dump_indented(value: Any, indent: str) -> str:
+    """json.dump(indent=2) 안에서 indent 깊이에 놓인 값과 같은 텍스트."""
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + indent)
+
+
+def _write_rows_stream(path: Path, head: dict, rows: Iterable[dict]) -> None:
+    """
+    {**head, "events": list(rows)}를 json.dump(ensure_ascii=False, indent=2)한 것과 바이트 단위로 같은 파일.
+    이벤트는 하나씩 직렬화 → 이벤트 dict 목록·전체 문자열을 메모리에 두지 않음 (긴 트랙·이벤트 수십만 개).
+    임시 파일에 쓰고 rename → 중단돼도 기존 파일이 반쯤 쓰인 채 남지 않음.
+    """
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("{")
+            for key, value in head.items():
+                f.write(f"\n  {json.dumps(key, ensure_ascii=False)}: {_dump_indented(value, '  ')},")
+            f.write('\n  "events": [')
+            sep = "\n    "
+            for row in rows:
+                f.write(sep + _dump_indented(row, "    "))
+                sep = ",\n    "
+            f.write("]\n}" if sep == "\n    " else "\n  ]\n}")
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _write_events(
+    head: dict,
+    rows: Iterator[dict],
+    path: Path,
+    project_root: Optional[Path | str],
+    fmt: str,
+) -> Path:
+    """
+    (헤더, 이벤트 생성기) → 파일. rows는 _write_rows_stream으로 스트리밍 (결과 파일은 _write_output과 동일).
+    columnar·binary는 열 단위 인코딩이라 문서 전체가 필요 → 모아서 _write_output.
+    """
+    _ensure_dir(path)
+    if fmt != "rows":
+        return _write_output({**head, "events": list(rows)}, path, project_root, fmt)
+    _write_rows_stream(path, head, rows)
+    if project_root is not None:
+        _copy_to_web_public(path, Path(project_root))
+    return path
+
+
+def _energy_parts(
     ctx: OnsetContext,
     scores: np.ndarray,
     extras: dict,
-    path: Path | str,
     source: str = "unknown",
-    project_root: Optional[Path | str] = None,
-) -> Path:
-    """context + energy (scores, extras) → onset_events_energy.json 형식."""
-    path = Path(path)
-    _ensure_dir(path)
+) -> tuple[dict, Iterator[dict]]:
+    """context + energy (scores, extras) → onset_events_energy.json 형식의 (헤더, 이벤트 생성기)."""
     rms = extras["rms_per_event"]
     E_norm_low = extras["E_norm_low"]
     E_norm_mid = extras["E_norm_mid"]
@@ -53,7 +133,7 @@ def write_energy_json(
     right_sec_arr = extras["right_sec_arr"]
     overlap_prev = extras["overlap_prev"]
 
-    out = {
+    head = {
         "source": source,
         "sr": int(ctx.sr),
         "duration_sec": round(float(ctx.duration), 4),
@@ -62,54 +142,73 @@ def write_energy_json(
         "hop_length": DEFAULT_HOP_LENGTH,
         "bpm": round(float(ctx.bpm), 2),
         "total_events": ctx.n_events,
-        "events": [],
     }
-    for i in range(ctx.n_events):
-        t = round(float(ctx.onset_times[i]), 4)
-        esc = float(scores[i])
-        out["events"].append({
-            "t": t,
-            "time": t,
-            "strength": round(esc, 4),
-            "texture": round(float(E_norm_high[i]), 4),
-            "color": DEFAULT_POINT_COLOR,
-            "rms": round(float(rms[i]), 6),
-            "e_norm": round(esc, 4),
-            "band_low": round(float(E_norm_low[i]), 4),
-            "band_mid": round(float(E_norm_mid[i]), 4),
-            "band_high": round(float(E_norm_high[i]), 4),
-            "index": i,
-            "frame": int(ctx.onset_frames[i]),
-            "onset_strength": round(float(ctx.strengths[i]), 4),
-            "log_rms": round(float(log_rms[i]), 4),
-            "energy_score": round(esc, 4),
-            "E_norm_low": round(float(E_norm_low[i]), 4),
-            "E_norm_mid": round(float(E_norm_mid[i]), 4),
-            "E_norm_high": round(float(E_norm_high[i]), 4),
-            "left_sec": round(float(left_sec_arr[i]), 4),
-            "right_sec": round(float(right_sec_arr[i]), 4),
-            "overlap_prev": bool(overlap_prev[i]),
-        })
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
 
+    def rows() -> Iterator[dict]:
+        for i in range(ctx.n_events):
+            t = round(float(ctx.onset_times[i]), 4)
+            esc = float(scores[i])
+            yield {
+                "t": t,
+                "time": t,
+                "strength": round(esc, 4),
+                "texture": round(float(E_norm_high[i]), 4),
+                "color": DEFAULT_POINT_COLOR,
+                "rms": round(float(rms[i]), 6),
+                "e_norm": round(esc, 4),
+                "band_low": round(float(E_norm_low[i]), 4),
+                "band_mid": round(float(E_norm_mid[i]), 4),
+                "band_high": round(float(E_norm_high[i]), 4),
+                "index": i,
+                "frame": int(ctx.onset_frames[i]),
+                "onset_strength": round(float(ctx.strengths[i]), 4),
+                "log_rms": round(float(log_rms[i]), 4),
+                "energy_score": round(esc, 4),
+                "E_norm_low": round(float(E_norm_low[i]), 4),
+                "E_norm_mid": round(float(E_norm_mid[i]), 4),
+                "E_norm_high": round(float(E_norm_high[i]), 4),
+                "left_sec": round(float(left_sec_arr[i]), 4),
+                "right_sec": round(float(right_sec_arr[i]), 4),
+                "overlap_prev": bool(overlap_prev[i]),
+            }
 
-def write_clarity_json(
+    return head, rows()
+
+
+def build_energy_doc(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> dict:
+    """context + energy (scores, extras) → onset_events_energy.json 형식."""
+    head, rows = _energy_parts(ctx, scores, extras, source)
+    return {**head, "events": list(rows)}
+
+
+def write_energy_json(
     ctx: OnsetContext,
     scores: np.ndarray,
     extras: dict,
     path: Path | str,
     source: str = "unknown",
     project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
 ) -> Path:
-    """context + clarity (scores, extras) → onset_events_clarity.json 형식."""
-    path = Path(path)
-    _ensure_dir(path)
+    """build_energy_doc → onset_events_energy.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _energy_parts(ctx, scores, extras, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
+
+
+def _clarity_parts(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> tuple[dict, Iterator[dict]]:
+    """context + clarity (scores, extras) → onset_events_clarity.json 형식의 (헤더, 이벤트 생성기)."""
     attack_times_ms = extras["attack_times_ms"]
-    out = {
+    head = {
         "metadata": {
             "source": source,
             "sr": ctx.sr,
@@ -117,40 +216,59 @@ def write_clarity_json(
             "bpm": round(float(ctx.bpm), 2),
             "total_events": ctx.n_events,
         },
-        "events": [],
     }
-    for i in range(ctx.n_events):
-        out["events"].append({
-            "index": i,
-            "time": round(float(ctx.onset_times[i]), 4),
-            "frame": int(ctx.onset_frames[i]),
-            "strength": round(float(ctx.strengths[i]), 4),
-            "attack_time_ms": round(float(attack_times_ms[i]), 2),
-            "clarity_score": round(float(scores[i]), 4),
-        })
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
 
+    def rows() -> Iterator[dict]:
+        for i in range(ctx.n_events):
+            yield {
+                "index": i,
+                "time": round(float(ctx.onset_times[i]), 4),
+                "frame": int(ctx.onset_frames[i]),
+                "strength": round(float(ctx.strengths[i]), 4),
+                "attack_time_ms": round(float(attack_times_ms[i]), 2),
+                "clarity_score": round(float(scores[i]), 4),
+            }
 
-def write_temporal_json(
+    return head, rows()
+
+
+def build_clarity_doc(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> dict:
+    """context + clarity (scores, extras) → onset_events_clarity.json 형식."""
+    head, rows = _clarity_parts(ctx, scores, extras, source)
+    return {**head, "events": list(rows)}
+
+
+def write_clarity_json(
     ctx: OnsetContext,
     scores: np.ndarray,
     extras: dict,
     path: Path | str,
     source: str = "unknown",
     project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
 ) -> Path:
-    """context + temporal (scores, extras) → onset_events_temporal.json 형식."""
-    path = Path(path)
-    _ensure_dir(path)
+    """build_clarity_doc → onset_events_clarity.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _clarity_parts(ctx, scores, extras, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
+
+
+def _temporal_parts(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> tuple[dict, Iterator[dict]]:
+    """context + temporal (scores, extras) → onset_events_temporal.json 형식의 (헤더, 이벤트 생성기)."""
     grid_align_score = extras["grid_align_score"]
     repetition_score = extras["repetition_score"]
     ioi_prev = extras["ioi_prev"]
     ioi_next = extras["ioi_next"]
-    out = {
+    head = {
         "metadata": {
             "source": source,
             "sr": int(ctx.sr),
@@ -160,45 +278,64 @@ def write_temporal_json(
             "bpm_dynamic_used": getattr(ctx, "bpm_dynamic_used", False),
             "total_events": ctx.n_events,
         },
-        "events": [],
     }
-    for i in range(ctx.n_events):
-        ev = {
-            "index": i,
-            "time": round(float(ctx.onset_times[i]), 4),
-            "frame": int(ctx.onset_frames[i]),
-            "strength": round(float(ctx.strengths[i]), 4),
-            "grid_align_score": round(float(grid_align_score[i]), 4),
-            "repetition_score": round(float(repetition_score[i]), 4),
-            "temporal_score": round(float(scores[i]), 4),
-        }
-        if np.isfinite(ioi_prev[i]):
-            ev["ioi_prev"] = round(float(ioi_prev[i]), 4)
-        if np.isfinite(ioi_next[i]):
-            ev["ioi_next"] = round(float(ioi_next[i]), 4)
-        out["events"].append(ev)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
 
+    def rows() -> Iterator[dict]:
+        for i in range(ctx.n_events):
+            ev = {
+                "index": i,
+                "time": round(float(ctx.onset_times[i]), 4),
+                "frame": int(ctx.onset_frames[i]),
+                "strength": round(float(ctx.strengths[i]), 4),
+                "grid_align_score": round(float(grid_align_score[i]), 4),
+                "repetition_score": round(float(repetition_score[i]), 4),
+                "temporal_score": round(float(scores[i]), 4),
+            }
+            if np.isfinite(ioi_prev[i]):
+                ev["ioi_prev"] = round(float(ioi_prev[i]), 4)
+            if np.isfinite(ioi_next[i]):
+                ev["ioi_next"] = round(float(ioi_next[i]), 4)
+            yield ev
 
-def write_spectral_json(
+    return head, rows()
+
+
+def build_temporal_doc(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> dict:
+    """context + temporal (scores, extras) → onset_events_temporal.json 형식."""
+    head, rows = _temporal_parts(ctx, scores, extras, source)
+    return {**head, "events": list(rows)}
+
+
+def write_temporal_json(
     ctx: OnsetContext,
     scores: np.ndarray,
     extras: dict,
     path: Path | str,
     source: str = "unknown",
     project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
 ) -> Path:
-    """context + spectral (scores, extras) → onset_events_spectral.json 형식."""
-    path = Path(path)
-    _ensure_dir(path)
+    """build_temporal_doc → onset_events_temporal.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _temporal_parts(ctx, scores, extras, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
+
+
+def _spectral_parts(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> tuple[dict, Iterator[dict]]:
+    """context + spectral (scores, extras) → onset_events_spectral.json 형식의 (헤더, 이벤트 생성기)."""
     centroids = extras["centroids"]
     bandwidths = extras["bandwidths"]
     flatnesses = extras["flatnesses"]
-    out = {
+    head = {
         "metadata": {
             "source": source,
             "sr": int(ctx.sr),
@@ -208,43 +345,62 @@ def write_spectral_json(
             "bpm": round(float(ctx.bpm), 2),
             "total_events": ctx.n_events,
         },
-        "events": [],
     }
-    for i in range(ctx.n_events):
-        ev = {
-            "index": i,
-            "time": round(float(ctx.onset_times[i]), 4),
-            "frame": int(ctx.onset_frames[i]),
-            "strength": round(float(ctx.strengths[i]), 4),
-            "spectral_centroid_hz": round(float(centroids[i]), 2) if np.isfinite(centroids[i]) else None,
-            "spectral_bandwidth_hz": round(float(bandwidths[i]), 2) if np.isfinite(bandwidths[i]) else None,
-            "spectral_flatness": round(float(flatnesses[i]), 4) if np.isfinite(flatnesses[i]) else None,
-            "focus_score": round(float(scores[i]), 4),
-        }
-        out["events"].append(ev)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
 
+    def rows() -> Iterator[dict]:
+        for i in range(ctx.n_events):
+            ev = {
+                "index": i,
+                "time": round(float(ctx.onset_times[i]), 4),
+                "frame": int(ctx.onset_frames[i]),
+                "strength": round(float(ctx.strengths[i]), 4),
+                "spectral_centroid_hz": round(float(centroids[i]), 2) if np.isfinite(centroids[i]) else None,
+                "spectral_bandwidth_hz": round(float(bandwidths[i]), 2) if np.isfinite(bandwidths[i]) else None,
+                "spectral_flatness": round(float(flatnesses[i]), 4) if np.isfinite(flatnesses[i]) else None,
+                "focus_score": round(float(scores[i]), 4),
+            }
+            yield ev
 
-def write_context_json(
+    return head, rows()
+
+
+def build_spectral_doc(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> dict:
+    """context + spectral (scores, extras) → onset_events_spectral.json 형식."""
+    head, rows = _spectral_parts(ctx, scores, extras, source)
+    return {**head, "events": list(rows)}
+
+
+def write_spectral_json(
     ctx: OnsetContext,
     scores: np.ndarray,
     extras: dict,
     path: Path | str,
     source: str = "unknown",
     project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
 ) -> Path:
-    """context + context_dependency (scores, extras) → onset_events_context.json 형식."""
-    path = Path(path)
-    _ensure_dir(path)
+    """build_spectral_doc → onset_events_spectral.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _spectral_parts(ctx, scores, extras, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
+
+
+def _context_parts(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> tuple[dict, Iterator[dict]]:
+    """context + context_dependency (scores, extras) → onset_events_context.json 형식의 (헤더, 이벤트 생성기)."""
     snr_db = extras["snr_db"]
     masking_low = extras["masking_low"]
     masking_mid = extras["masking_mid"]
     masking_high = extras["masking_high"]
-    out = {
+    head = {
         "metadata": {
             "source": source,
             "sr": int(ctx.sr),
@@ -256,25 +412,48 @@ def write_context_json(
             "bg_win_sec": BG_WIN_SEC,
             "total_events": ctx.n_events,
         },
-        "events": [],
     }
-    for i in range(ctx.n_events):
-        out["events"].append({
-            "index": i,
-            "time": round(float(ctx.onset_times[i]), 4),
-            "frame": int(ctx.onset_frames[i]),
-            "strength": round(float(ctx.strengths[i]), 4),
-            "snr_db": round(float(snr_db[i]), 2),
-            "masking_low": round(float(masking_low[i]), 4),
-            "masking_mid": round(float(masking_mid[i]), 4),
-            "masking_high": round(float(masking_high[i]), 4),
-            "dependency_score": round(float(scores[i]), 4),
-        })
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
+
+    def rows() -> Iterator[dict]:
+        for i in range(ctx.n_events):
+            yield {
+                "index": i,
+                "time": round(float(ctx.onset_times[i]), 4),
+                "frame": int(ctx.onset_frames[i]),
+                "strength": round(float(ctx.strengths[i]), 4),
+                "snr_db": round(float(snr_db[i]), 2),
+                "masking_low": round(float(masking_low[i]), 4),
+                "masking_mid": round(float(masking_mid[i]), 4),
+                "masking_high": round(float(masking_high[i]), 4),
+                "dependency_score": round(float(scores[i]), 4),
+            }
+
+    return head, rows()
+
+
+def build_context_doc(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    source: str = "unknown",
+) -> dict:
+    """context + context_dependency (scores, extras) → onset_events_context.json 형식."""
+    head, rows = _context_parts(ctx, scores, extras, source)
+    return {**head, "events": list(rows)}
+
+
+def write_context_json(
+    ctx: OnsetContext,
+    scores: np.ndarray,
+    extras: dict,
+    path: Path | str,
+    source: str = "unknown",
+    project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
+) -> Path:
+    """build_context_doc → onset_events_context.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _context_parts(ctx, scores, extras, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
 
 
 # 역할별 시각화용 색상 (P0=메인, P1=패턴, P2=뉘앙스)
@@ -297,20 +476,13 @@ def _streams_to_json_serializable(streams: list[dict]) -> list[dict]:
     return out
 
 
-def write_layered_json(
+def _layered_parts(
     ctx: OnsetContext,
     metrics: dict[str, np.ndarray],
     role_composition: list[dict],
-    path: Path | str,
     source: str = "unknown",
-    project_root: Optional[Path | str] = None,
-) -> Path:
-    """
-    band 기반 역할 구성 + 5개 지표를 한 JSON으로 저장.
-    events[] 각 항목: time, t, roles: { P0: band[], P1: band[], P2: band[] }, layer(시각화용 주 역할), color.
-    """
-    path = Path(path)
-    _ensure_dir(path)
+) -> tuple[dict, Iterator[dict]]:
+    """band 기반 역할 구성 + 5개 지표 → onset_events_layered.json 형식의 (헤더, 이벤트 생성기)."""
     n_events = ctx.n_events
     n_comp = len(role_composition)
     # 카운트는 실제 내보내는 이벤트 수 기준. P0=이벤트 수, P1/P2=역할이 하나라도 있는 이벤트 수
@@ -328,58 +500,86 @@ def write_layered_json(
     F = metrics["focus"]
     D = metrics["dependency"]
 
-    out = {
+    head = {
         "source": source,
         "sr": int(ctx.sr),
         "duration_sec": round(float(ctx.duration), 4),
         "total_events": ctx.n_events,
         "layer_counts": role_band_counts,
-        "events": [],
     }
-    for i in range(n_events):
-        comp = role_composition[i] if i < n_comp else {"P0": ["mid"], "P1": [], "P2": []}
-        p0_bands = comp["P0"] if isinstance(comp["P0"], list) else [comp["P0"]]
-        p1_list = list(comp.get("P1") or [])
-        p2_list = list(comp.get("P2") or [])
-        roles = {"P0": sorted(p0_bands), "P1": sorted(p1_list), "P2": p2_list}
-        primary = "P2" if p2_list else "P1" if p1_list else "P0"
-        out["events"].append({
-            "time": round(float(ctx.onset_times[i]), 4),
-            "t": round(float(ctx.onset_times[i]), 4),
-            "roles": roles,
-            "layer": primary,
-            "strength": round(float(ctx.strengths[i]), 4),
-            "color": LAYER_COLORS.get(primary, DEFAULT_POINT_COLOR),
-            "energy_score": round(float(E[i]), 4),
-            "clarity_score": round(float(C[i]), 4),
-            "temporal_score": round(float(T[i]), 4),
-            "focus_score": round(float(F[i]), 4),
-            "dependency_score": round(float(D[i]), 4),
-        })
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
 
+    def rows() -> Iterator[dict]:
+        for i in range(n_events):
+            comp = role_composition[i] if i < n_comp else {"P0": ["mid"], "P1": [], "P2": []}
+            p0_bands = comp["P0"] if isinstance(comp["P0"], list) else [comp["P0"]]
+            p1_list = list(comp.get("P1") or [])
+            p2_list = list(comp.get("P2") or [])
+            roles = {"P0": sorted(p0_bands), "P1": sorted(p1_list), "P2": p2_list}
+            primary = "P2" if p2_list else "P1" if p1_list else "P0"
+            yield {
+                "time": round(float(ctx.onset_times[i]), 4),
+                "t": round(float(ctx.onset_times[i]), 4),
+                "roles": roles,
+                "layer": primary,
+                "strength": round(float(ctx.strengths[i]), 4),
+                "color": LAYER_COLORS.get(primary, DEFAULT_POINT_COLOR),
+                "energy_score": round(float(E[i]), 4),
+                "clarity_score": round(float(C[i]), 4),
+                "temporal_score": round(float(T[i]), 4),
+                "focus_score": round(float(F[i]), 4),
+                "dependency_score": round(float(D[i]), 4),
+            }
 
-def write_streams_sections_json(
+    return head, rows()
+
+
+def build_layered_doc(
+    ctx: OnsetContext,
+    metrics: dict[str, np.ndarray],
+    role_composition: list[dict],
+    source: str = "unknown",
+) -> dict:
+    """
+    band 기반 역할 구성 + 5개 지표를 한 문서로.
+    events[] 각 항목: time, t, roles: { P0: band[], P1: band[], P2: band[] }, layer(시각화용 주 역할), color.
+    """
+    head, rows = _layered_parts(ctx, metrics, role_composition, source)
+    return {**head, "events": list(rows)}
+
+
+def write_layered_json(
+    ctx: OnsetContext,
+    metrics: dict[str, np.ndarray],
+    role_composition: list[dict],
     path: Path | str,
+    source: str = "unknown",
+    project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
+) -> Path:
+    """build_layered_doc → onset_events_layered.json. rows는 이벤트를 하나씩 스트리밍 기록."""
+    head, rows = _layered_parts(ctx, metrics, role_composition, source)
+    return _write_events(head, rows, Path(path), project_root, fmt)
+
+
+def build_streams_sections_doc(
     source: str,
     sr: int,
     duration_sec: float,
     streams: list[dict],
     sections: list[dict],
     keypoints: list[dict],
-    project_root: Optional[Path | str] = None,
     events: Optional[list[dict]] = None,
-) -> Path:
+    section_tree: Optional[list[dict]] = None,
+    event_pyramid: Optional[str] = None,
+    waveform_peaks: Optional[str] = None,
+) -> dict:
     """
-    스트림·섹션·키포인트·(선택) events 저장 (07 전용).
+    스트림·섹션·키포인트·(선택) events 문서 (07·11).
     events: 정밀도 기반 P0/P1/P2 역할(roles) 포함 시 레이어 표시용.
+    section_tree: (선택) segment_sections_hierarchical 결과. 뷰어가 줌 레벨별 섹션 선택.
+    event_pyramid: (선택) event_pyramid.write_event_pyramid index.json의 web 경로. 뷰어가 보이는 타일만 로드.
+    waveform_peaks: (선택) waveform_peaks.write_waveform_peaks .peaks의 web 경로. 뷰어가 오디오 디코드 없이 파형 표시.
     """
-    path = Path(path)
-    _ensure_dir(path)
     out = {
         "source": source,
         "sr": int(sr),
@@ -388,19 +588,47 @@ def write_streams_sections_json(
         "sections": sections,
         "keypoints": keypoints,
     }
+    if section_tree is not None:
+        out["section_tree"] = section_tree
+    if event_pyramid is not None:
+        out["event_pyramid"] = event_pyramid
+    if waveform_peaks is not None:
+        out["waveform_peaks"] = waveform_peaks
     if events is not None:
         out["events"] = events
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
+    return out
+
+
+def write_streams_sections_json(
+    path: Path | str,
+    source: str,
+    sr: int,
+    duration_sec: float,
+    streams: list[dict],
+    sections: list[dict],
+    keypoints: list[dict],
+    project_root: Optional[Path | str] = None,
+    events: Optional[list[dict]] = None,
+    section_tree: Optional[list[dict]] = None,
+    fmt: str = "rows",
+    event_pyramid: Optional[str] = None,
+    waveform_peaks: Optional[str] = None,
+) -> Path:
+    """build_streams_sections_doc → streams_sections.json."""
+    path = Path(path)
+    _ensure_dir(path)
+    doc = build_streams_sections_doc(
+        source, sr, duration_sec, streams, sections, keypoints,
+        events=events, section_tree=section_tree, event_pyramid=event_pyramid, waveform_peaks=waveform_peaks,
+    )
+    return _write_output(doc, path, project_root, fmt)
 
 
 def write_drum_band_energy_json(
     result: dict,
     path: Path | str,
     project_root: Optional[Path | str] = None,
+    fmt: str = "rows",
 ) -> Path:
     """
     compute_drum_band_energy() 반환값을 drum_band_energy.json 형식으로 저장.
@@ -408,8 +636,4 @@ def write_drum_band_energy_json(
     """
     path = Path(path)
     _ensure_dir(path)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-    if project_root is not None:
-        _copy_to_web_public(path, Path(project_root))
-    return path
+    return _write_output(result, path, project_root, fmt)
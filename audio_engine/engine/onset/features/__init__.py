@@ -1,11 +1,33 @@
 """
 L3 Features: 이벤트별 1차원 점수 계산 (OnsetContext → 점수 배열).
+첫 속성 접근 시 해당 feature 모듈만 import (PEP 562).
 """
-from audio_engine.engine.onset.features.energy import compute_energy
-from audio_engine.engine.onset.features.clarity import compute_clarity
-from audio_engine.engine.onset.features.temporal import compute_temporal
-from audio_engine.engine.onset.features.spectral import compute_spectral
-from audio_engine.engine.onset.features.context import compute_context_dependency
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY_ATTRS: dict[str, str] = {
+    "compute_energy": "energy",
+    "compute_clarity": "clarity",
+    "compute_temporal": "temporal",
+    "compute_spectral": "spectral",
+    "compute_context_dependency": "context",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "compute_energy",
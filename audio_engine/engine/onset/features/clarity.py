@@ -4,7 +4,6 @@ L3 Features: 이벤트별 어택 명확도 (attack time → clarity_score).
 from __future__ import annotations
 
 import numpy as np
-from scipy.ndimage import uniform_filter1d, median_filter
 
 from audio_engine.engine.onset.types import OnsetContext
 from audio_engine.engine.onset.constants import (
@@ -21,6 +20,8 @@ def _get_attack_time(
     max_ms: float = CLARITY_ATTACK_MAX_MS,
 ) -> float:
     """10% → 90% attack time (ms)."""
+    from scipy.ndimage import uniform_filter1d
+
     env = np.abs(y_segment).astype(np.float64)
     smooth_size = min(11, max(3, len(env) // 30))
     if smooth_size >= 3 and smooth_size % 2 == 0:
@@ -75,6 +76,8 @@ def compute_clarity(ctx: OnsetContext) -> tuple[np.ndarray, dict]:
     scores: clarity_score 0~1.
     extras: attack_times_ms.
     """
+    from scipy.ndimage import median_filter
+
     y = ctx.y
     sr = ctx.sr
     onset_times = ctx.onset_times
@@ -3,7 +3,6 @@ L3 Features: 이벤트별 스펙트럼 포커스 (centroid/bandwidth/flatness 
 """
 from __future__ import annotations
 
-import librosa
 import numpy as np
 
 from audio_engine.engine.onset.types import OnsetContext
@@ -17,6 +16,8 @@ def compute_spectral(ctx: OnsetContext) -> tuple[np.ndarray, dict]:
     scores: focus_score 0~1 (포커스 높을수록 또렷한 타격).
     extras: centroids, bandwidths, flatnesses (원값).
     """
+    import librosa
+
     y = ctx.y
     sr = ctx.sr
     duration = ctx.duration
@@ -3,7 +3,6 @@ L3 Features: 이벤트별 박자/반복 점수 (grid align, IOI → temporal_sco
 """
 from __future__ import annotations
 
-import librosa
 import numpy as np
 
 from audio_engine.engine.onset.types import OnsetContext
@@ -21,6 +20,8 @@ from audio_engine.engine.onset.utils import robust_norm
 
 def _build_grid_if_needed(ctx: OnsetContext):
     """ctx에 grid 없으면 로컬 템포·비트·그리드 생성."""
+    import librosa
+
     if ctx.grid_times is not None and ctx.grid_levels is not None:
         return ctx.grid_times, ctx.grid_levels, ctx.bpm
     y, sr = ctx.y, ctx.sr
@@ -5,51 +5,25 @@ madmom RNNOnsetProcessor + OnsetPeakPickingProcessor로 onset 검출 → 해당
 """
 from __future__ import annotations
 
-import collections
 from pathlib import Path
 from typing import Any
 
-import librosa
 import numpy as np
 
+from audio_engine.engine.io import load_audio, stem_file
+from audio_engine.engine.onset.constants import RNN_ONSET_THRESHOLD
+from audio_engine.engine.onset.detectors import get_onset_detector
 from audio_engine.engine.onset.utils import robust_norm
 
-# Python 3.10+ 호환: madmom이 collections.MutableSequence를 사용하므로 패치
-if not hasattr(collections, "MutableSequence"):
-    import collections.abc
-
-    collections.MutableSequence = collections.abc.MutableSequence  # type: ignore
-
-# NumPy 2.0+ 호환: madmom이 deprecated np.float, np.int 등 사용
-for _attr, _val in [("float", np.float64), ("int", np.int64), ("bool", np.bool_), ("complex", np.complex128)]:
-    if not hasattr(np, _attr):
-        setattr(np, _attr, _val)
-
 
 def _madmom_band_onset_energies(audio_path: Path) -> tuple[np.ndarray, np.ndarray, float, int]:
     """
     단일 대역 파일에서 madmom RNN onset 검출 후, 각 onset 구간의 RMS(에너지) 반환.
     Returns: (onset_times, energy_norm_0_1, duration, sr)
     """
-    from madmom.features.onsets import RNNOnsetProcessor, OnsetPeakPickingProcessor
-
-    fps = 100
-    proc_onset = RNNOnsetProcessor()
-    proc_peak = OnsetPeakPickingProcessor(
-        threshold=0.4,
-        smooth=0.0,
-        pre_avg=0.0,
-        post_avg=0.0,
-        pre_max=0.02,
-        post_max=0.02,
-        combine=0.03,
-        fps=fps,
-    )
-    activations = proc_onset(str(audio_path))
-    onset_times = proc_peak(activations)
-    onset_times = np.asarray(onset_times).flatten()
+    onset_times = get_onset_detector("rnn", threshold=RNN_ONSET_THRESHOLD).detect(audio_path).times
 
-    y, sr = librosa.load(audio_path, sr=22050, mono=True)
+    y, sr = load_audio(audio_path, sr=22050, mono=True)
     duration = len(y) / sr
     n_events = len(onset_times)
 
@@ -99,9 +73,9 @@ def compute_madmom_drum_band_keypoints(
     """
     stems_base_dir = Path(stems_base_dir)
     folder = stems_base_dir / stem_folder_name
-    drum_low_path = folder / "drum_low.wav"
-    drum_mid_path = folder / "drum_mid.wav"
-    drum_high_path = folder / "drum_high.wav"
+    drum_low_path = stem_file(folder, "drum_low")
+    drum_mid_path = stem_file(folder, "drum_mid")
+    drum_high_path = stem_file(folder, "drum_high")
 
     for p in (drum_low_path, drum_mid_path, drum_high_path):
         if not p.exists():
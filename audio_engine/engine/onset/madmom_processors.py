@@ -0,0 +1,231 @@
+"""
+madmom 프로세서 레지스트리: 설정(kwargs)별로 프로세스 전역에서 1회 생성 후 재사용.
+CNN/RNN 모델 로드, LogarithmicFilterbank 등 필터뱅크 생성 비용을 대역·트랙마다 반복하지 않음.
+대역 병렬 처리용 워커 프로세스 풀도 여기서 관리 (워커 시작 시 프로세서를 미리 로드).
+"""
+from __future__ import annotations
+
+import atexit
+import collections
+import collections.abc
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from audio_engine.engine.onset.constants import (
+    MADMOM_FPS,
+    PEAK_PICK_COMBINE_SEC,
+    PEAK_PICK_POST_MAX_SEC,
+    PEAK_PICK_PRE_MAX_SEC,
+)
+
+_PROCESSORS: dict[tuple, Any] = {}
+_LOCK = threading.Lock()
+_EXECUTORS: dict[tuple[int, bool], ProcessPoolExecutor] = {}
+
+
+def ensure_madmom_compat() -> None:
+    """madmom import 전 호환 패치 (Python 3.10+ collections, NumPy 2.0+ np.float 등)."""
+    if not hasattr(collections, "MutableSequence"):
+        collections.MutableSequence = collections.abc.MutableSequence  # type: ignore
+    for _attr, _val in [("float", np.float64), ("int", np.int64), ("bool", np.bool_), ("complex", np.complex128)]:
+        if not hasattr(np, _attr):
+            setattr(np, _attr, _val)
+
+
+def load_signal(audio_path: Path | str, num_channels: int = 1) -> Any:
+    """
+    stem 파일 → madmom Signal (정수 PCM 그대로). 프로세서에 경로 대신 전달.
+    WAV는 madmom 자체 reader, 그 외(FLAC 등)는 soundfile로 int16 디코드 (madmom은 ffmpeg 필요).
+    """
+    ensure_madmom_compat()
+    from madmom.audio.signal import Signal
+
+    path = Path(audio_path)
+    if path.suffix.lower() == ".wav":
+        return Signal(str(path), num_channels=num_channels)
+    import soundfile as sf
+
+    data, sr = sf.read(str(path), dtype="int16")
+    return Signal(data, sample_rate=sr, num_channels=num_channels)
+
+
+def _get_or_create(kind: str, kwargs: dict[str, Any], factory: Callable[[], Any]) -> Any:
+    key = (kind, tuple(sorted(kwargs.items())))
+    proc = _PROCESSORS.get(key)
+    if proc is not None:
+        return proc
+    with _LOCK:
+        proc = _PROCESSORS.get(key)
+        if proc is None:
+            ensure_madmom_compat()
+            proc = factory()
+            _PROCESSORS[key] = proc
+    return proc
+
+
+def get_cnn_onset_processor() -> Any:
+    """madmom CNNOnsetProcessor (모델 로드 1회)."""
+    def factory():
+        from madmom.features.onsets import CNNOnsetProcessor
+
+        return CNNOnsetProcessor()
+
+    return _get_or_create("cnn_onset", {}, factory)
+
+
+def get_rnn_onset_processor() -> Any:
+    """madmom RNNOnsetProcessor (모델 로드 1회)."""
+    def factory():
+        from madmom.features.onsets import RNNOnsetProcessor
+
+        return RNNOnsetProcessor()
+
+    return _get_or_create("rnn_onset", {}, factory)
+
+
+def get_peak_picking_processor(
+    threshold: float,
+    *,
+    fps: int = MADMOM_FPS,
+    smooth: float = 0.0,
+    pre_avg: float = 0.0,
+    post_avg: float = 0.0,
+    pre_max: float = PEAK_PICK_PRE_MAX_SEC,
+    post_max: float = PEAK_PICK_POST_MAX_SEC,
+    combine: float = PEAK_PICK_COMBINE_SEC,
+) -> Any:
+    """madmom OnsetPeakPickingProcessor (threshold·윈도우 설정별 1개)."""
+    kwargs = dict(
+        threshold=threshold,
+        smooth=smooth,
+        pre_avg=pre_avg,
+        post_avg=post_avg,
+        pre_max=pre_max,
+        post_max=post_max,
+        combine=combine,
+        fps=fps,
+    )
+
+    def factory():
+        from madmom.features.onsets import OnsetPeakPickingProcessor
+
+        return OnsetPeakPickingProcessor(**kwargs)
+
+    return _get_or_create("peak_picking", kwargs, factory)
+
+
+def get_spectral_onset_processor(onset_method: str, **kwargs: Any) -> Any:
+    """
+    madmom SpectralOnsetProcessor (onset_method·kwargs별 1개).
+    filterbank 인자는 클래스(예: LogarithmicFilterbank)로 넘김. 필터뱅크는 첫 호출 후 프로세서 내부에 캐시됨.
+    """
+    key_kwargs = dict(kwargs, onset_method=onset_method)
+
+    def factory():
+        from madmom.features.onsets import SpectralOnsetProcessor
+
+        return SpectralOnsetProcessor(onset_method=onset_method, **kwargs)
+
+    return _get_or_create("spectral_onset", key_kwargs, factory)
+
+
+def get_superflux_processor() -> Any:
+    """low/mid strength용 superflux ODF (LogarithmicFilterbank 24 bands)."""
+    ensure_madmom_compat()
+    from madmom.audio.filters import LogarithmicFilterbank
+
+    return get_spectral_onset_processor(
+        "superflux",
+        filterbank=LogarithmicFilterbank,
+        num_bands=24,
+    )
+
+
+def get_complex_flux_processor() -> Any:
+    """high strength용 complex_flux ODF."""
+    return get_spectral_onset_processor("complex_flux")
+
+
+def warm_processors(cnn_threshold: float | None = None) -> None:
+    """CNN·ODF 프로세서를 미리 생성 (워커 프로세스 initializer 등)."""
+    get_cnn_onset_processor()
+    get_superflux_processor()
+    get_complex_flux_processor()
+    if cnn_threshold is not None:
+        get_peak_picking_processor(cnn_threshold)
+
+
+def clear_processor_cache() -> None:
+    """레지스트리 비우기 (테스트·메모리 회수용)."""
+    with _LOCK:
+        _PROCESSORS.clear()
+
+
+def _init_warm_worker(warm_librosa: bool = False) -> None:
+    """워커 프로세스 initializer: madmom 프로세서 로드 (+ librosa JIT 워밍업)."""
+    warm_processors()
+    if warm_librosa:
+        from audio_engine.engine.onset.warmup import warmup
+
+        warmup(librosa=True)
+
+
+def get_warm_executor(max_workers: int, *, warm_librosa: bool = False) -> ProcessPoolExecutor:
+    """
+    max_workers개 워커 프로세스 풀 (설정별 프로세스 전역 1개씩 재사용).
+    각 워커는 시작 시 warm_processors()로 CNN·ODF 프로세서를 로드해 두므로 첫 작업부터 추론만 수행.
+    warm_librosa: librosa backend를 쓰는 경우 워커 시작 시 Numba 캐시 활성화 + librosa 경로 워밍업.
+    """
+    key = (max_workers, warm_librosa)
+    with _LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_warm_worker,
+                initargs=(warm_librosa,),
+            )
+            _EXECUTORS[key] = executor
+    return executor
+
+
+def discard_warm_executor(executor: ProcessPoolExecutor) -> None:
+    """깨진 풀(BrokenProcessPool)을 레지스트리에서 빼고 종료 → 다음 get_warm_executor가 새 풀 생성."""
+    with _LOCK:
+        for key in [k for k, v in _EXECUTORS.items() if v is executor]:
+            del _EXECUTORS[key]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_on_warm_executor(
+    jobs: dict[str, tuple[Callable[..., Any], tuple]],
+    max_workers: int,
+    *,
+    warm_librosa: bool = False,
+) -> dict[str, Any]:
+    """
+    {이름: (함수, 인자)} 작업을 get_warm_executor 풀에서 실행 → {이름: 결과}.
+    워커가 비정상 종료되면(BrokenProcessPool) 그 풀을 버리고 예외를 그대로 전달 (다음 호출은 새 풀).
+    """
+    executor = get_warm_executor(max_workers, warm_librosa=warm_librosa)
+    try:
+        futures = {name: executor.submit(fn, *args) for name, (fn, args) in jobs.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+    except BrokenProcessPool:
+        discard_warm_executor(executor)
+        raise
+
+
+@atexit.register
+def shutdown_warm_executors() -> None:
+    """get_warm_executor로 만든 워커 풀 종료."""
+    with _LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
@@ -0,0 +1,148 @@
+"""
+NumPy 다중 threshold peak picking (madmom OnsetPeakPickingProcessor 오프라인 동작 재현).
+smooth/pre_avg/post_avg = 0 설정 기준. threshold > 0 이면
+  peak(t) = {i : act[i] >= t, act[i] == maximum_filter1d(act)[i]}
+이므로 이동 최대값은 1회만 계산하고 threshold 벡터 전체를 한 번에 평가.
+combine은 madmom combine_events(..., 'left')와 동일 (앞 onset 기준 delta 이내 제거).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from audio_engine.engine.io import stem_file
+from audio_engine.engine.onset.constants import (
+    MADMOM_FPS,
+    PEAK_PICK_COMBINE_SEC,
+    PEAK_PICK_POST_MAX_SEC,
+    PEAK_PICK_PRE_MAX_SEC,
+    PEAK_SWEEP_THRESHOLDS,
+)
+
+
+def _local_max_frames(
+    activation: np.ndarray,
+    fps: float,
+    pre_max: float,
+    post_max: float,
+) -> np.ndarray:
+    """threshold와 무관한 국소 최대 프레임 인덱스 (madmom peak_picking의 이동 최대 조건)."""
+    pre = int(np.round(pre_max * fps))
+    post = int(np.round(post_max * fps))
+    size = pre + post + 1
+    if size > 1:
+        from scipy.ndimage import maximum_filter1d
+
+        origin = int(np.floor((pre - post) / 2))
+        mov_max = maximum_filter1d(activation, size, mode="constant", origin=origin)
+        is_peak = activation == mov_max
+    else:
+        is_peak = np.ones(len(activation), dtype=bool)
+    return np.flatnonzero(is_peak & (activation != 0))
+
+
+def _combine_left(times: np.ndarray, delta: float) -> np.ndarray:
+    """madmom combine_events(times, delta, 'left') 동일 결과."""
+    if len(times) <= 1 or not delta:
+        return times
+    delta += 1e-12
+    if np.all(np.diff(times) > delta):
+        return times
+    kept = [times[0]]
+    left = kept[0]
+    for t in times[1:].tolist():
+        if t - left > delta:
+            kept.append(t)
+            left = t
+    return np.array(kept, dtype=np.float64)
+
+
+def peak_pick_sweep(
+    activation: np.ndarray,
+    thresholds: Sequence[float] | np.ndarray = PEAK_SWEEP_THRESHOLDS,
+    *,
+    fps: float = MADMOM_FPS,
+    pre_max: float = PEAK_PICK_PRE_MAX_SEC,
+    post_max: float = PEAK_PICK_POST_MAX_SEC,
+    combine: float = PEAK_PICK_COMBINE_SEC,
+) -> list[np.ndarray]:
+    """
+    activation 1개에 대해 threshold별 onset 시각(초) 목록.
+    get_peak_picking_processor(t, fps=fps, pre_max=..., post_max=..., combine=...)(activation)과 동일 결과.
+    Returns: thresholds 순서대로 onset_times 배열 리스트.
+    """
+    thresholds = np.asarray(thresholds, dtype=float).ravel()
+    if np.any(thresholds <= 0):
+        raise ValueError("thresholds는 모두 0보다 커야 합니다.")
+    activation = np.asarray(activation).ravel()
+    peaks = _local_max_frames(activation, fps, pre_max, post_max)
+    peak_vals = activation[peaks]
+    peak_times = peaks.astype(np.float64) / fps
+    # (n_thresholds, n_peaks) 마스크 한 번에 계산 후 threshold별 combine.
+    # madmom과 같이 activation dtype(float32)으로 비교 (경계값 0.7 등에서 float64 비교와 결과가 다름)
+    cmp_thresholds = thresholds.astype(activation.dtype) if activation.dtype.kind == "f" else thresholds
+    above = peak_vals[None, :] >= cmp_thresholds[:, None]
+    return [_combine_left(peak_times[mask], combine) for mask in above]
+
+
+def peak_count_sweep(
+    activation: np.ndarray,
+    thresholds: Sequence[float] | np.ndarray = PEAK_SWEEP_THRESHOLDS,
+    **kwargs: Any,
+) -> np.ndarray:
+    """threshold별 onset 개수. kwargs는 peak_pick_sweep과 동일. Returns: int 배열 (len(thresholds),)."""
+    return np.array([len(t) for t in peak_pick_sweep(activation, thresholds, **kwargs)], dtype=int)
+
+
+def sweep_cnn_band_thresholds(
+    stem_folder_names: Sequence[str],
+    stems_base_dir: Path | str,
+    thresholds: Sequence[float] | np.ndarray = PEAK_SWEEP_THRESHOLDS,
+    *,
+    cache_dir: Path | str | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    여러 stem 폴더의 drum_low/mid/high CNN activation에 대해 threshold 스윕 (대역별 threshold 보정용).
+    cache_dir 지정 시 activation_cache 재사용 → 두 번째부터 추론 없이 스윕만 실행.
+
+    Returns:
+        {
+            "thresholds": [float, ...],
+            "duration_sec": float,          # 전체 합
+            "bands": {"low": [int, ...], "mid": [...], "high": [...]},  # threshold별 onset 수 합
+            "per_track": {stem_folder_name: {"duration_sec": float, "bands": {...}}},
+        }
+    """
+    from audio_engine.engine.onset.cnn_band_onsets import _cnn_activation
+
+    stems_base_dir = Path(stems_base_dir)
+    thresholds = np.asarray(thresholds, dtype=float).ravel()
+    totals = {band: np.zeros(len(thresholds), dtype=int) for band in ("low", "mid", "high")}
+    per_track: dict[str, Any] = {}
+    total_duration = 0.0
+
+    for name in stem_folder_names:
+        folder = stems_base_dir / name
+        track_bands: dict[str, list[int]] = {}
+        track_duration = 0.0
+        for band in ("low", "mid", "high"):
+            path = stem_file(folder, f"drum_{band}")
+            if not path.exists():
+                raise FileNotFoundError(f"필요한 파일이 없습니다: {path} (폴더: {name})")
+            activation, duration, _ = _cnn_activation(path, cache_dir)
+            counts = peak_count_sweep(activation, thresholds, **kwargs)
+            totals[band] += counts
+            track_bands[band] = counts.tolist()
+            track_duration = max(track_duration, duration)
+        per_track[name] = {"duration_sec": track_duration, "bands": track_bands}
+        total_duration += track_duration
+
+    return {
+        "thresholds": thresholds.tolist(),
+        "duration_sec": total_duration,
+        "bands": {band: counts.tolist() for band, counts in totals.items()},
+        "per_track": per_track,
+    }
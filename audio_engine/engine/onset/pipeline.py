@@ -7,10 +7,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Union
 
-import librosa
 import numpy as np
-from scipy.signal import butter, filtfilt
 
+from audio_engine.engine.io import load_audio, stem_file
 from audio_engine.engine.onset.types import OnsetContext
 from audio_engine.engine.onset.constants import (
     DEFAULT_HOP_LENGTH,
@@ -37,6 +36,8 @@ def detect_onsets(
     Onset 검출. (onset_frames, onset_times, onset_env, strengths) 반환.
     LEGACY: 01~05 스크립트용. 신규는 CNN(10,11) 사용.
     """
+    import librosa
+
     onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length)
     onset_frames = librosa.onset.onset_detect(
         onset_envelope=onset_env,
@@ -68,6 +69,8 @@ def refine_onset_times(
     (onset_frames_refined, onset_times_refined) 반환.
     LEGACY: detect_onsets와 함께 사용. 신규는 CNN(10,11) 사용.
     """
+    import librosa
+
     n = len(onset_frames)
     onset_frames_refined = []
     onset_times_refined = []
@@ -108,6 +111,8 @@ def _build_temporal_aux(
     bpm: float,
 ):
     """Temporal용 beats_dynamic, grid_times, grid_levels 생성."""
+    import librosa
+
     tempo_dynamic = librosa.feature.tempo(
         y=y, sr=sr, aggregate=None, std_bpm=TEMPO_STD_BPM
     )
@@ -178,6 +183,8 @@ def _build_variable_grid_with_levels(
 
 
 def _bandpass(y: np.ndarray, sr: int, f_lo: float, f_hi: float, order: int = 2) -> np.ndarray:
+    from scipy.signal import butter, filtfilt
+
     nyq = sr / 2.0
     low = max(f_lo / nyq, 0.001)
     high = min(f_hi / nyq, 0.999)
@@ -256,10 +263,12 @@ def build_context_with_band_evidence(
     merge로 이벤트를 생성하지 않음. 이벤트 수 = anchor 수.
     LEGACY: 07 스크립트용. 신규는 11_cnn_streams_layers 사용.
     """
+    import librosa
+
     path = Path(audio_path)
     if not path.exists():
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {audio_path}")
-    y, sr = librosa.load(path)
+    y, sr = load_audio(path)
     duration = len(y) / sr
 
     # Anchor: 전대역 onset 1회
@@ -274,13 +283,13 @@ def build_context_with_band_evidence(
 
     # 대역별 onset: drum_low/mid/high 파일이 있으면 사용, 없으면 전대역을 bandpass로 분할
     band_dir = path.parent
-    drum_low_p = band_dir / "drum_low.wav"
-    drum_mid_p = band_dir / "drum_mid.wav"
-    drum_high_p = band_dir / "drum_high.wav"
-    if path.name == "drums.wav" and drum_low_p.exists() and drum_mid_p.exists() and drum_high_p.exists():
-        y_low, _ = librosa.load(drum_low_p, sr=sr, mono=True)
-        y_mid, _ = librosa.load(drum_mid_p, sr=sr, mono=True)
-        y_high, _ = librosa.load(drum_high_p, sr=sr, mono=True)
+    drum_low_p = stem_file(band_dir, "drum_low")
+    drum_mid_p = stem_file(band_dir, "drum_mid")
+    drum_high_p = stem_file(band_dir, "drum_high")
+    if path.stem == "drums" and drum_low_p.exists() and drum_mid_p.exists() and drum_high_p.exists():
+        y_low, _ = load_audio(drum_low_p, sr=sr, mono=True)
+        y_mid, _ = load_audio(drum_mid_p, sr=sr, mono=True)
+        y_high, _ = load_audio(drum_high_p, sr=sr, mono=True)
     else:
         y_low, y_mid, y_high = filter_y_into_bands(y, sr, BAND_HZ)
     band_times_list = []
@@ -364,10 +373,12 @@ def build_context(
     include_temporal=True이면 beats_dynamic, grid_times, grid_levels 등 채움 (temporal 모듈용).
     LEGACY: 01~05, 06 스크립트용. 신규 파이프라인은 CNN(10,11) 사용.
     """
+    import librosa
+
     path = Path(audio_path)
     if not path.exists():
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {audio_path}")
-    y, sr = librosa.load(path)
+    y, sr = load_audio(path)
     duration = len(y) / sr
 
     onset_frames, onset_times, onset_env, strengths = detect_onsets(
@@ -1,6 +1,7 @@
 """
 섹션(파트) 구분: 윈도우별 스트림 상태 벡터 V_k를 만들고, 벡터 변화점에서 파트 경계 탐지.
 V_k에 band_presence_mask / dominant_band 포함으로 드럼 브레이크·하이햇 드롭·킥 온오프 구분.
+계층 모드: hop 단위로 binning한 스트림×시간 행렬 1개에서 여러 윈도우 스케일의 V_k를 누적합으로 계산.
 """
 from __future__ import annotations
 
@@ -13,6 +14,7 @@ from audio_engine.engine.onset.constants import (
     SECTION_ACTIVE_THRESHOLD,
     SECTION_CHANGE_THRESHOLD,
     SECTION_DEBOUNCE_WINDOWS,
+    SECTION_HIERARCHY_WINDOW_SECS,
     SECTION_HOP_SEC,
     SECTION_MERGE_NEAR_SEC,
     SECTION_WINDOW_SEC,
@@ -116,47 +118,24 @@ def _vec_to_array(v: dict) -> np.ndarray:
     ], dtype=float)
 
 
-def segment_sections(
-    streams: list[dict[str, Any]],
+def _section_boundaries(
+    arrs: list[np.ndarray] | np.ndarray,
+    window_starts: list[float],
+    hop_sec: float,
     duration_sec: float,
-    *,
-    window_sec: float = SECTION_WINDOW_SEC,
-    hop_sec: float = SECTION_HOP_SEC,
-    active_threshold: int = SECTION_ACTIVE_THRESHOLD,
-    change_threshold: float | None = None,
-    min_section_sec: float = MIN_SECTION_SEC,
-    debounce_windows: int = SECTION_DEBOUNCE_WINDOWS,
-    merge_near_sec: float = SECTION_MERGE_NEAR_SEC,
-) -> list[dict[str, Any]]:
+    change_threshold: float | None,
+    min_section_sec: float,
+    merge_near_sec: float,
+    centre_window_sec: float | None = None,
+) -> list[float] | None:
     """
-    스트림 목록과 길이로부터 윈도우별 V_k 계산 → dist(V_k, V_{k-1}) → 경계 후보 → debounce·병합 → sections.
+    윈도우 벡터 열 → dist(V_k, V_{k-1}) → 경계 후보 → debounce·병합 → [0, ..., duration_sec].
+    기본(segment_sections): 연속 후보의 두 번째부터 각 윈도우 시작이 경계.
+    centre_window_sec 지정(계층 모드): 변화점 1개는 윈도우가 지나가는 동안 연속 후보(run, 최대 window/hop개)로
+    나타남 → run 1개 = 경계 1개, 시각 = 비교한 두 윈도우 중심의 중점(윈도우 시작 + (window - hop)/2)을 dist 가중 평균
+    (윈도우 시작을 쓰면 coarse 스케일에서 ~window - hop 이름).
+    경계 후보가 없으면 None.
     """
-    if duration_sec <= 0 or not streams:
-        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": [], "summary": {}}]
-
-    k = 0
-    vecs: list[dict] = []
-    window_starts: list[float] = []
-    while True:
-        w_start = k * hop_sec
-        w_end = min(w_start + window_sec, duration_sec)
-        if w_start >= duration_sec:
-            break
-        vec = _vector_from_streams_in_window(streams, w_start, w_end, active_threshold)
-        vecs.append(vec)
-        window_starts.append(w_start)
-        k += 1
-        if w_end >= duration_sec:
-            break
-
-    if len(vecs) < 2:
-        active_ids = [s["id"] for s in streams]
-        summary = vecs[0] if vecs else {}
-        if isinstance(summary, dict):
-            summary = {k: v for k, v in summary.items() if k in ("density_low", "density_mid", "density_high", "dominant_band", "n_streams_low", "n_streams_mid", "n_streams_high")}
-        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": active_ids, "summary": summary or {}}]
-
-    arrs = [_vec_to_array(v) for v in vecs]
     dists = []
     for i in range(1, len(arrs)):
         d = float(np.linalg.norm(arrs[i] - arrs[i - 1], ord=1))
@@ -169,23 +148,31 @@ def segment_sections(
         thr = med + 3 * mad
     thr = max(thr, SECTION_CHANGE_THRESHOLD)
 
-    boundary_candidates = []
+    runs: list[list[int]] = []
     for i in range(len(dists)):
         if dists[i] > thr:
-            boundary_candidates.append((i + 1, window_starts[i + 1] if i + 1 < len(window_starts) else window_starts[-1] + hop_sec))
+            if runs and runs[-1][-1] == i - 1:
+                runs[-1].append(i)
+            else:
+                runs.append([i])
 
-    if not boundary_candidates:
-        active_ids = [s["id"] for s in streams]
-        s0 = vecs[0]
-        summary = {k: s0[k] for k in ("density_low", "density_mid", "density_high", "dominant_band") if k in s0}
-        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": active_ids, "summary": summary}]
+    if not runs:
+        return None
 
-    candidate_indices = set(idx for idx, _ in boundary_candidates)
+    # debounce: 연속 2개 이상 비교에서 바뀐 경우만 경계
     debounced = []
-    for i in range(1, len(dists) + 1):
-        if i in candidate_indices and (i - 1) in candidate_indices:
-            t = next(t for idx, t in boundary_candidates if idx == i)
-            debounced.append(t)
+    for run in runs:
+        if len(run) < 2:
+            continue
+        if centre_window_sec is None:
+            debounced.extend(
+                window_starts[i + 1] if i + 1 < len(window_starts) else window_starts[-1] + hop_sec for i in run[1:]
+            )
+            continue
+        times = np.array([window_starts[i + 1] for i in run]) + (centre_window_sec - hop_sec) / 2
+        t = float(np.average(times, weights=dists[run]))
+        if 0.0 < t < duration_sec:
+            debounced.append(round(t / hop_sec) * hop_sec)
     boundary_times = sorted(set(debounced))
     boundary_times = [0.0] + boundary_times + [duration_sec]
     merged = []
@@ -213,6 +200,63 @@ def segment_sections(
         boundary_times.insert(0, 0.0)
     if boundary_times[-1] != duration_sec:
         boundary_times.append(duration_sec)
+    return boundary_times
+
+
+def _summary_from_vec(vec: dict) -> dict:
+    return {k: vec[k] for k in ("density_low", "density_mid", "density_high", "dominant_band", "n_streams_low", "n_streams_mid", "n_streams_high") if k in vec}
+
+
+def segment_sections(
+    streams: list[dict[str, Any]],
+    duration_sec: float,
+    *,
+    window_sec: float = SECTION_WINDOW_SEC,
+    hop_sec: float = SECTION_HOP_SEC,
+    active_threshold: int = SECTION_ACTIVE_THRESHOLD,
+    change_threshold: float | None = None,
+    min_section_sec: float = MIN_SECTION_SEC,
+    debounce_windows: int = SECTION_DEBOUNCE_WINDOWS,
+    merge_near_sec: float = SECTION_MERGE_NEAR_SEC,
+) -> list[dict[str, Any]]:
+    """
+    스트림 목록과 길이로부터 윈도우별 V_k 계산 → dist(V_k, V_{k-1}) → 경계 후보 → debounce·병합 → sections.
+    """
+    if duration_sec <= 0 or not streams:
+        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": [], "summary": {}}]
+
+    k = 0
+    vecs: list[dict] = []
+    window_starts: list[float] = []
+    while True:
+        w_start = k * hop_sec
+        w_end = min(w_start + window_sec, duration_sec)
+        if w_start >= duration_sec:
+            break
+        vec = _vector_from_streams_in_window(streams, w_start, w_end, active_threshold)
+        vecs.append(vec)
+        window_starts.append(w_start)
+        k += 1
+        if w_end >= duration_sec:
+            break
+
+    if len(vecs) < 2:
+        active_ids = [s["id"] for s in streams]
+        summary = vecs[0] if vecs else {}
+        if isinstance(summary, dict):
+            summary = {k: v for k, v in summary.items() if k in ("density_low", "density_mid", "density_high", "dominant_band", "n_streams_low", "n_streams_mid", "n_streams_high")}
+        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": active_ids, "summary": summary or {}}]
+
+    arrs = [_vec_to_array(v) for v in vecs]
+    boundary_times = _section_boundaries(
+        arrs, window_starts, hop_sec, duration_sec,
+        change_threshold, min_section_sec, merge_near_sec,
+    )
+    if boundary_times is None:
+        active_ids = [s["id"] for s in streams]
+        s0 = vecs[0]
+        summary = {k: s0[k] for k in ("density_low", "density_mid", "density_high", "dominant_band") if k in s0}
+        return [{"id": 0, "start": 0.0, "end": duration_sec, "active_stream_ids": active_ids, "summary": summary}]
 
     sections_out = []
     for idx in range(len(boundary_times) - 1):
@@ -222,7 +266,7 @@ def segment_sections(
         vec_idx = min(int(mid / hop_sec), len(vecs) - 1)
         vec = vecs[vec_idx]
         active_in_range = [s["id"] for s in streams if s.get("start", 0) < end and s.get("end", 0) > start]
-        summary = {k: vec[k] for k in ("density_low", "density_mid", "density_high", "dominant_band", "n_streams_low", "n_streams_mid", "n_streams_high") if k in vec}
+        summary = _summary_from_vec(vec)
         sections_out.append({
             "id": idx,
             "start": round(start, 4),
@@ -231,3 +275,221 @@ def segment_sections(
             "summary": summary,
         })
     return sections_out
+
+
+def _bin_streams(
+    streams: list[dict[str, Any]],
+    duration_sec: float,
+    bin_sec: float,
+) -> dict[str, np.ndarray]:
+    """
+    스트림 이벤트를 bin_sec 단위로 binning한 상태 행렬.
+    counts[i, b] = 스트림 i의 bin b 이벤트 수. cumsum은 윈도우 합 계산용 (앞에 0 열 포함).
+    """
+    n_bins = max(1, int(np.ceil(duration_sec / bin_sec)))
+    n_streams = len(streams)
+    counts = np.zeros((n_streams, n_bins), dtype=np.int64)
+    band_onehot = np.zeros((3, n_streams), dtype=np.int64)
+    totals = np.zeros(n_streams, dtype=np.int64)
+    accents = np.zeros(n_streams, dtype=np.int64)
+    for i, s in enumerate(streams):
+        ev = np.asarray(s.get("events") or [], dtype=float)
+        totals[i] = len(ev)
+        accents[i] = len(s.get("accents") or [])
+        band = s.get("band", "")
+        if band in ("low", "mid", "high"):
+            band_onehot[("low", "mid", "high").index(band), i] = 1
+        ev = ev[(ev >= 0) & (ev <= duration_sec)]
+        if len(ev):
+            idx = np.minimum((ev / bin_sec).astype(np.int64), n_bins - 1)
+            counts[i] = np.bincount(idx, minlength=n_bins)
+    cumsum = np.zeros((n_streams, n_bins + 1), dtype=np.int64)
+    np.cumsum(counts, axis=1, out=cumsum[:, 1:])
+    return {
+        "cumsum": cumsum,
+        "band_onehot": band_onehot,
+        "totals": totals,
+        "accents": accents,
+    }
+
+
+def _window_vectors_from_bins(
+    binned: dict[str, np.ndarray],
+    duration_sec: float,
+    window_sec: float,
+    hop_sec: float,
+    active_threshold: int,
+) -> tuple[list[dict], list[float]]:
+    """
+    binning 행렬에서 window_sec 윈도우(hop_sec 간격)별 V_k 계산.
+    _vector_from_streams_in_window와 같은 필드. 윈도우 경계는 bin 단위로 반올림.
+    """
+    cumsum = binned["cumsum"]
+    n_bins = cumsum.shape[1] - 1
+    window_bins = max(1, int(round(window_sec / hop_sec)))
+
+    window_starts: list[float] = []
+    window_ends: list[float] = []
+    k = 0
+    while True:
+        w_start = k * hop_sec
+        w_end = min(w_start + window_sec, duration_sec)
+        if w_start >= duration_sec:
+            break
+        window_starts.append(w_start)
+        window_ends.append(w_end)
+        k += 1
+        if w_end >= duration_sec:
+            break
+
+    b_start = np.minimum(np.arange(len(window_starts)), n_bins)
+    b_end = np.minimum(b_start + window_bins, n_bins)
+    in_window = cumsum[:, b_end] - cumsum[:, b_start]
+    active = (in_window >= active_threshold) & (in_window > 0)
+
+    onehot = binned["band_onehot"]
+    n_streams_band = onehot @ active
+    events_band = onehot @ (in_window * active)
+    totals_band = onehot @ (binned["totals"][:, None] * active)
+    accents_band = onehot @ (binned["accents"][:, None] * active)
+    window_len = np.array(window_ends) - np.array(window_starts)
+    window_len[window_len <= 0] = 1.0
+    density = events_band / window_len[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        accent_ratio = np.where(totals_band > 0, accents_band / np.maximum(totals_band, 1), 0.0)
+    present = (n_streams_band > 0) | (events_band >= active_threshold)
+    dominant = np.argmax(density, axis=0)
+
+    vecs: list[dict] = []
+    for j in range(len(window_starts)):
+        vecs.append({
+            "n_streams_low": int(n_streams_band[0, j]),
+            "n_streams_mid": int(n_streams_band[1, j]),
+            "n_streams_high": int(n_streams_band[2, j]),
+            "density_low": float(density[0, j]),
+            "density_mid": float(density[1, j]),
+            "density_high": float(density[2, j]),
+            "band_presence_mask": [int(x) for x in present[:, j]],
+            "dominant_band_idx": int(dominant[j]),
+            "dominant_band": ["low", "mid", "high"][int(dominant[j])],
+            "accent_ratio_low": float(accent_ratio[0, j]),
+            "accent_ratio_mid": float(accent_ratio[1, j]),
+            "accent_ratio_high": float(accent_ratio[2, j]),
+        })
+    return vecs, window_starts
+
+
+def segment_sections_hierarchical(
+    streams: list[dict[str, Any]],
+    duration_sec: float,
+    *,
+    window_secs: tuple[float, ...] = SECTION_HIERARCHY_WINDOW_SECS,
+    hop_sec: float = SECTION_HOP_SEC,
+    active_threshold: int = SECTION_ACTIVE_THRESHOLD,
+    change_threshold: float | None = None,
+    min_section_sec: float = MIN_SECTION_SEC,
+    merge_near_sec: float = SECTION_MERGE_NEAR_SEC,
+) -> list[dict[str, Any]]:
+    """
+    여러 윈도우 스케일(coarse → fine)의 섹션을 중첩 트리로 반환.
+    스트림 이벤트는 hop_sec 단위로 한 번만 binning하고, 스케일별 V_k는 누적합 차이로 계산.
+    min_section_sec·merge_near_sec는 window / SECTION_WINDOW_SEC 비율로 스케일.
+    coarse 스케일 경계는 가까운(윈도우 절반 이내) fine 스케일 경계 위치로 맞춤 → 레벨 간 같은 변화점은 같은 시각.
+    하위 레벨 경계 = 상위 레벨 경계 ∪ 해당 스케일 경계 (이미 채택된 경계와 merge_near 이내인 경계는 제외).
+
+    Returns:
+        최상위 섹션 목록. 각 노드: id, level, window_sec, start, end, active_stream_ids, summary,
+        parent_id(최상위는 None), children(다음 레벨 노드 목록; 최하위는 []).
+    """
+    scales = sorted((float(w) for w in window_secs), reverse=True)
+    if duration_sec <= 0 or not streams or not scales:
+        return [{
+            "id": 0,
+            "level": 0,
+            "window_sec": scales[0] if scales else SECTION_WINDOW_SEC,
+            "start": 0.0,
+            "end": duration_sec,
+            "active_stream_ids": [s["id"] for s in streams],
+            "summary": {},
+            "parent_id": None,
+            "children": [],
+        }]
+
+    binned = _bin_streams(streams, duration_sec, hop_sec)
+    scale_vecs: list[list[dict]] = []
+    scale_found: list[list[float]] = []
+    for window_sec in scales:
+        scale = window_sec / SECTION_WINDOW_SEC
+        vecs, window_starts = _window_vectors_from_bins(
+            binned, duration_sec, window_sec, hop_sec, active_threshold
+        )
+        found = None
+        if len(vecs) >= 2:
+            arrs = [_vec_to_array(v) for v in vecs]
+            found = _section_boundaries(
+                arrs, window_starts, hop_sec, duration_sec,
+                change_threshold, min_section_sec * scale, merge_near_sec * scale,
+                centre_window_sec=window_sec,
+            )
+        scale_vecs.append(vecs)
+        scale_found.append([t for t in found or [] if 0.0 < t < duration_sec])
+
+    # fine → coarse: coarse 경계는 윈도우 절반 이내의 다음 fine 경계로 맞춤 (같은 변화점을 fine 위치로 표시)
+    for level in range(len(scales) - 2, -1, -1):
+        finer = scale_found[level + 1]
+        snapped = []
+        for t in scale_found[level]:
+            near = min(finer, key=lambda b: abs(b - t), default=None)
+            snapped.append(near if near is not None and abs(near - t) <= scales[level] / 2 else t)
+        scale_found[level] = sorted(set(snapped))
+
+    parent_bounds = [0.0, duration_sec]
+    levels: list[list[dict[str, Any]]] = []
+    for level, window_sec in enumerate(scales):
+        level_merge_near = merge_near_sec * window_sec / SECTION_WINDOW_SEC
+        vecs = scale_vecs[level]
+        bounds = list(parent_bounds)
+        for t in scale_found[level]:
+            if all(abs(t - b) >= level_merge_near for b in bounds):
+                bounds.append(t)
+        bounds = sorted(set(bounds))
+
+        nodes: list[dict[str, Any]] = []
+        parent_nodes = levels[-1] if levels else []
+        for idx in range(len(bounds) - 1):
+            start = bounds[idx]
+            end = bounds[idx + 1]
+            mid = (start + end) / 2
+            vec = vecs[min(int(mid / hop_sec), len(vecs) - 1)] if vecs else {}
+            parent = next((p for p in parent_nodes if p["start"] <= round(mid, 4) <= p["end"]), None)
+            node = {
+                "id": idx,
+                "level": level,
+                "window_sec": window_sec,
+                "start": round(start, 4),
+                "end": round(end, 4),
+                "active_stream_ids": [s["id"] for s in streams if s.get("start", 0) < end and s.get("end", 0) > start],
+                "summary": _summary_from_vec(vec),
+                "parent_id": parent["id"] if parent is not None else None,
+                "children": [],
+            }
+            if parent is not None:
+                parent["children"].append(node)
+            nodes.append(node)
+        levels.append(nodes)
+        parent_bounds = bounds
+    return levels[0]
+
+
+def sections_at_level(tree: list[dict[str, Any]], level: int) -> list[dict[str, Any]]:
+    """segment_sections_hierarchical 트리에서 한 레벨의 섹션만 평탄화해 반환 (children 제외)."""
+    out: list[dict[str, Any]] = []
+    stack = list(reversed(tree))
+    while stack:
+        node = stack.pop()
+        if node.get("level") == level:
+            out.append({k: v for k, v in node.items() if k != "children"})
+            continue
+        stack.extend(reversed(node.get("children") or []))
+    out.sort(key=lambda n: n["start"])
+    return out
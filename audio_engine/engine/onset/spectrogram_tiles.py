@@ -0,0 +1,204 @@
+"""
+L5 I/O Adapters: 대역 시각화용 스펙트로그램 타일 ({이름}.spec/).
+
+브라우저에서 전체 트랙 스펙트로그램을 계산하면 느림 → 분석 쪽 STFT 크기(magnitude)를
+log-magnitude(dB) → uint8로 양자화해 시간×주파수 PNG 타일로 저장. 뷰어는 보이는 타일만 <img>로 로드.
+
+주파수: f_min~f_max 로그 간격 n_freq행 (행마다 해당 구간 STFT bin의 최댓값, 빈 구간은 가장 가까운 bin).
+        이미지 위쪽 = 높은 주파수.
+시간: 레벨 0 = STFT 프레임 1개/열. 레벨 k = frames_per_column[k] 프레임을 max로 묶음. 타일 = tile_width 열.
+값: dB = 20·log10(S / S.max()), [-top_db, 0] → 0~255 (8-bit grayscale PNG).
+
+디렉터리 구조:
+    manifest.json       — {format, format_version, source, sr, n_fft, hop_length, duration_sec, n_freq,
+                           freq_scale, f_min, f_max, top_db, tile_width, tile_path,
+                           levels: [{level, frames_per_column, column_sec, n_columns, n_tiles}]}
+    {level}/{tile}.png  — 폭 tile_width (마지막 타일은 남은 열 수), 높이 n_freq
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from audio_engine.engine.onset.constants import DEFAULT_HOP_LENGTH, DEFAULT_N_FFT
+
+SPEC_FORMAT = "spectrogram_tiles"
+SPEC_VERSION = 1
+SPEC_SUFFIX = ".spec"
+MANIFEST_NAME = "manifest.json"
+TILE_PATH = "{level}/{tile}.png"
+DEFAULT_N_FREQ = 128
+DEFAULT_F_MIN = 20.0
+DEFAULT_F_MAX = 16000.0
+DEFAULT_TOP_DB = 80.0
+DEFAULT_TILE_WIDTH = 512
+# hop 256 @ 22050 Hz 기준 열당 약 12 / 46 / 186 / 743 ms
+DEFAULT_FRAMES_PER_COLUMN = (1, 4, 16, 64)
+
+
+def stft_magnitude(
+    y: np.ndarray,
+    n_fft: int = DEFAULT_N_FFT,
+    hop_length: int = DEFAULT_HOP_LENGTH,
+) -> np.ndarray:
+    """
+    mono 신호 → |STFT| (1 + n_fft/2, 프레임). librosa.stft(center=True, hann)와 같은 프레임 배치.
+    이미 계산한 분석 STFT가 있으면 그 크기를 build_spectrogram_tiles에 바로 넘기면 됨.
+    """
+    y = np.asarray(y, dtype=np.float32)
+    if y.ndim > 1:
+        y = y.mean(axis=0)
+    y = np.pad(y, n_fft // 2, mode="constant")
+    if len(y) < n_fft:
+        y = np.pad(y, (0, n_fft - len(y)))
+    frames = np.lib.stride_tricks.sliding_window_view(y, n_fft)[::hop_length]
+    window = np.hanning(n_fft + 1)[:-1].astype(np.float32)
+    return np.abs(np.fft.rfft(frames * window, axis=1)).T.astype(np.float32)
+
+
+def _log_freq_rows(S: np.ndarray, sr: int, n_fft: int, n_freq: int, f_min: float, f_max: float) -> np.ndarray:
+    """(bins, 프레임) → (n_freq, 프레임). 행 i = [edge_i, edge_i+1) 구간 bin 최댓값 (낮은 주파수가 0행)."""
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)[: S.shape[0]]
+    edges = np.geomspace(f_min, f_max, n_freq + 1)
+    lo = np.clip(np.searchsorted(freqs, edges[:-1]), 0, len(freqs) - 1)
+    hi = np.clip(np.searchsorted(freqs, edges[-1]), lo[-1] + 1, len(freqs))
+    # reduceat: lo[i] ~ lo[i+1] 구간 최댓값. 같은 lo가 이어지면 그 bin 하나 (빈 구간 → 가장 가까운 위쪽 bin)
+    return np.maximum.reduceat(S[:hi], lo, axis=0)
+
+
+def _png_gray(img: np.ndarray) -> bytes:
+    """uint8 (높이, 폭) → 8-bit grayscale PNG 바이트."""
+    h, w = img.shape
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    raw = np.hstack([np.zeros((h, 1), dtype=np.uint8), img]).tobytes()  # 행마다 필터 0
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_spectrogram_tiles(
+    S: np.ndarray,
+    sr: int,
+    hop_length: int = DEFAULT_HOP_LENGTH,
+    n_fft: int = DEFAULT_N_FFT,
+    source: str = "unknown",
+    n_freq: int = DEFAULT_N_FREQ,
+    f_min: float = DEFAULT_F_MIN,
+    f_max: float = DEFAULT_F_MAX,
+    top_db: float = DEFAULT_TOP_DB,
+    tile_width: int = DEFAULT_TILE_WIDTH,
+    frames_per_column: Sequence[int] = DEFAULT_FRAMES_PER_COLUMN,
+) -> tuple[dict[str, Any], dict[tuple[int, int], np.ndarray]]:
+    """
+    |STFT| (bins, 프레임) → (manifest, {(level, tile): uint8 이미지 (n_freq, 열)}).
+    frames_per_column: 오름차순, 각 값이 앞 값의 정수배. 한 타일에 다 들어가는 레벨 다음은 만들지 않음.
+    """
+    fpc = [int(f) for f in frames_per_column]
+    if not fpc or fpc[0] < 1 or any(b % a or b <= a for a, b in zip(fpc, fpc[1:])):
+        raise ValueError(f"frames_per_column은 오름차순 정수배여야 합니다: {fpc}")
+    f_max = min(float(f_max), sr / 2.0)
+    S = np.asarray(S, dtype=np.float32)
+    n_frames = S.shape[1]
+    rows = _log_freq_rows(S, sr, n_fft, n_freq, f_min, f_max)
+    ref = float(rows.max()) or 1.0
+    db = 20.0 * np.log10(np.maximum(rows, ref * 10 ** (-top_db / 20.0)) / ref)
+    q = np.round((db + top_db) / top_db * 255.0).astype(np.uint8)[::-1]  # 위쪽 = 높은 주파수
+
+    levels: list[dict] = []
+    tiles: dict[tuple[int, int], np.ndarray] = {}
+    cols = q
+    prev = 1
+    for level, f in enumerate(fpc):
+        factor = f // prev
+        if factor > 1:
+            n = -(-cols.shape[1] // factor)
+            pad = n * factor - cols.shape[1]
+            if pad:
+                cols = np.pad(cols, ((0, 0), (0, pad)), mode="edge")
+            cols = cols.reshape(cols.shape[0], n, factor).max(axis=2)
+        prev = f
+        n_columns = cols.shape[1]
+        n_tiles = -(-n_columns // tile_width)
+        for i in range(n_tiles):
+            tiles[(level, i)] = np.ascontiguousarray(cols[:, i * tile_width:(i + 1) * tile_width])
+        levels.append({
+            "level": level,
+            "frames_per_column": f,
+            "column_sec": round(f * hop_length / float(sr), 6),
+            "n_columns": n_columns,
+            "n_tiles": n_tiles,
+        })
+        if n_tiles <= 1:
+            break
+
+    manifest = {
+        "format": SPEC_FORMAT,
+        "format_version": SPEC_VERSION,
+        "source": source,
+        "sr": int(sr),
+        "n_fft": int(n_fft),
+        "hop_length": int(hop_length),
+        "duration_sec": round(n_frames * hop_length / float(sr), 4),
+        "n_freq": n_freq,
+        "freq_scale": "log",
+        "f_min": float(f_min),
+        "f_max": f_max,
+        "top_db": float(top_db),
+        "tile_width": tile_width,
+        "tile_path": TILE_PATH,
+        "levels": levels,
+    }
+    return manifest, tiles
+
+
+def write_spectrogram_tiles(
+    S: np.ndarray,
+    sr: int,
+    path: Path | str,
+    hop_length: int = DEFAULT_HOP_LENGTH,
+    n_fft: int = DEFAULT_N_FFT,
+    source: str = "unknown",
+    project_root: Optional[Path | str] = None,
+    **kwargs: Any,
+) -> Path:
+    """
+    build_spectrogram_tiles → {path}.spec/ (manifest.json + PNG 타일). 기존 디렉터리는 새로 씀.
+    project_root가 있으면 web/public/{이름}.spec/ 로 복사. kwargs는 build_spectrogram_tiles 옵션. Returns: manifest 경로.
+    """
+    from audio_engine.engine.onset.export import _copy_dir_to_web_public, _replace_dir
+
+    path = Path(path)
+    if path.suffix != SPEC_SUFFIX:
+        path = path.with_suffix(SPEC_SUFFIX)
+    manifest, tiles = build_spectrogram_tiles(S, sr, hop_length, n_fft, source, **kwargs)
+    _replace_dir(path)
+    for (level, tile), img in tiles.items():
+        tile_path = path / TILE_PATH.format(level=level, tile=tile)
+        tile_path.parent.mkdir(exist_ok=True)
+        tile_path.write_bytes(_png_gray(img))
+    manifest_path = path / MANIFEST_NAME
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+    if project_root is not None:
+        _copy_dir_to_web_public(path, Path(project_root))
+    return manifest_path
+
+
+def read_spectrogram_manifest(path: Path | str) -> dict[str, Any]:
+    """{이름}.spec 디렉터리 또는 manifest.json 경로 → manifest."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_NAME
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
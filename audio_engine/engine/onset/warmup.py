@@ -0,0 +1,172 @@
+"""
+librosa(Numba JIT) cold-start 워밍업 + 영구 컴파일 캐시.
+librosa의 @jit(cache=True) 함수(beat_track DP, peak_pick, localmax 등)는 프로세스마다 첫 호출에서 컴파일됨.
+NUMBA_CACHE_DIR를 쓰기 가능한 경로로 지정하면 컴파일 결과가 디스크에 남아 다음 프로세스는 로드만 수행.
+warmup_librosa()는 파이프라인이 쓰는 librosa 경로를 짧은 합성 신호로 1회씩 호출 → 첫 트랙 지연 = 정상 상태 지연.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from audio_engine.engine.onset.constants import DEFAULT_HOP_LENGTH, DEFAULT_N_FFT, TEMPO_STD_BPM
+
+_NUMBA_CACHE_ENV = "NUMBA_CACHE_DIR"
+# 첫 enable_numba_cache 호출 시점 기록: 그때 이미 import된 모듈, 환경 변수가 미리 있었는지
+_CACHE_STATE: dict[str, Any] = {}
+
+
+def default_numba_cache_dir() -> Path:
+    """$XDG_CACHE_HOME(기본 ~/.cache)/audio_engine/numba."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "audio_engine" / "numba"
+
+
+def enable_numba_cache(cache_dir: Path | str | None = None) -> Path:
+    """
+    Numba 영구 캐시 경로 설정. NUMBA_CACHE_DIR가 이미 있으면 그대로 사용.
+    numba·librosa import 전에 호출해야 librosa 함수에 적용됨 (onset 패키지는 librosa를 지연 import).
+    환경 변수로 설정하므로 이후 생성되는 워커 프로세스에도 상속.
+    numba·librosa가 이미 import된 뒤라면 기록만 남김 (numba_cache_status()["effective"] = False).
+    """
+    if not _CACHE_STATE:
+        _CACHE_STATE["imported_before"] = [m for m in ("numba", "librosa") if m in sys.modules]
+        _CACHE_STATE["env_preset"] = bool(os.environ.get(_NUMBA_CACHE_ENV))
+    if os.environ.get(_NUMBA_CACHE_ENV):
+        path = Path(os.environ[_NUMBA_CACHE_ENV])
+    else:
+        path = Path(cache_dir) if cache_dir is not None else default_numba_cache_dir()
+        os.environ[_NUMBA_CACHE_ENV] = str(path)
+    path.mkdir(parents=True, exist_ok=True)
+    if "numba" in sys.modules:
+        import numba
+
+        numba.config.CACHE_DIR = str(path)
+    return path
+
+
+def numba_cache_status() -> dict[str, Any]:
+    """
+    현재 캐시 경로와 항목 수.
+    effective=False: 프로세스 시작 시 NUMBA_CACHE_DIR가 없었고 enable_numba_cache 전에 numba·librosa가
+    import됨 → 이미 데코레이트된 librosa 함수에는 site-packages 기본 위치가 쓰임 (imported_before에 모듈 이름).
+    """
+    cache_dir = os.environ.get(_NUMBA_CACHE_ENV)
+    n_entries = 0
+    if cache_dir and Path(cache_dir).is_dir():
+        n_entries = sum(1 for _ in Path(cache_dir).rglob("*.nbi"))
+    imported_before = _CACHE_STATE.get("imported_before", [])
+    effective = bool(cache_dir) and (_CACHE_STATE.get("env_preset", True) or not imported_before)
+    return {
+        "cache_dir": cache_dir,
+        "effective": effective,
+        "imported_before": imported_before,
+        "n_index_files": n_entries,
+    }
+
+
+def _click_track(sr: int, duration_sec: float, bpm: float = 120.0) -> np.ndarray:
+    """워밍업용 합성 신호: 일정 간격 감쇠 노이즈 클릭 (beat_track·onset_detect가 실제 경로를 타도록)."""
+    rng = np.random.default_rng(0)
+    y = np.zeros(int(sr * duration_sec), dtype=np.float32)
+    click_len = int(0.03 * sr)
+    click = (rng.standard_normal(click_len) * np.exp(-np.linspace(0, 8, click_len))).astype(np.float32)
+    step = int(sr * 60.0 / bpm)
+    for start in range(0, len(y) - click_len, step):
+        y[start:start + click_len] += click
+    return y
+
+
+def warmup_librosa(
+    sr: int = 22050,
+    hop_length: int = DEFAULT_HOP_LENGTH,
+    duration_sec: float = 4.0,
+) -> dict[str, float]:
+    """
+    pipeline / features / detectors가 쓰는 librosa 경로를 1회씩 호출.
+    Returns: {경로 이름: 소요 초}. 캐시가 있으면 각 항목이 정상 상태 수준으로 짧음.
+    """
+    import librosa
+    from scipy.signal import butter, filtfilt
+
+    y = _click_track(sr, duration_sec)
+    timings: dict[str, float] = {}
+
+    def timed(name: str, fn):
+        start = time.perf_counter()
+        out = fn()
+        timings[name] = round(time.perf_counter() - start, 4)
+        return out
+
+    timed("resample", lambda: librosa.resample(y, orig_sr=sr, target_sr=sr // 2))
+    onset_env = timed("onset_strength", lambda: librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length))
+    frames = timed(
+        "onset_detect",
+        lambda: librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr, hop_length=hop_length, backtrack=False),
+    )
+    times = timed("frames_to_time", lambda: librosa.frames_to_time(frames, sr=sr, hop_length=hop_length))
+    timed("time_to_frames", lambda: librosa.time_to_frames(times, sr=sr, hop_length=hop_length))
+    timed("tempo", lambda: librosa.feature.tempo(y=y, sr=sr, aggregate=None, std_bpm=TEMPO_STD_BPM))
+    timed("beat_track", lambda: librosa.beat.beat_track(y=y, sr=sr, hop_length=hop_length))
+    timed("beat_track_envelope", lambda: librosa.beat.beat_track(onset_envelope=onset_env, sr=sr, hop_length=hop_length, bpm=120.0))
+    S = timed("stft", lambda: np.abs(librosa.stft(y[:DEFAULT_N_FFT * 4], n_fft=DEFAULT_N_FFT, hop_length=DEFAULT_N_FFT // 2)))
+
+    def spectral():
+        cent = librosa.feature.spectral_centroid(S=S, sr=sr)
+        librosa.feature.spectral_bandwidth(S=S, sr=sr, centroid=cent)
+        librosa.feature.spectral_flatness(S=S)
+
+    timed("spectral_features", spectral)
+
+    def bandpass():
+        b, a = butter(2, [0.01, 0.2], btype="band")
+        filtfilt(b, a, y)
+
+    timed("bandpass", bandpass)
+    return timings
+
+
+def warmup(
+    cache_dir: Path | str | None = None,
+    *,
+    librosa: bool = True,
+    madmom: bool = False,
+) -> dict[str, Any]:
+    """
+    프로세스 시작 시 1회 호출하는 워밍업 진입점 (스크립트·배치 워커 initializer).
+    librosa: Numba 캐시 활성화 후 librosa 경로 워밍업. madmom: CNN·ODF 프로세서 미리 로드.
+    Returns: {"numba_cache": numba_cache_status(), "timings": {...}, "total_sec": float}
+    """
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    if librosa:
+        enable_numba_cache(cache_dir)
+        timings.update(warmup_librosa())
+    if madmom:
+        from audio_engine.engine.onset.madmom_processors import warm_processors
+
+        t0 = time.perf_counter()
+        warm_processors()
+        timings["madmom_processors"] = round(time.perf_counter() - t0, 4)
+    return {
+        "numba_cache": numba_cache_status(),
+        "timings": timings,
+        "total_sec": round(time.perf_counter() - start, 4),
+    }
+
+
+def warm_process(*, librosa: bool = True, madmom: bool = False) -> dict[str, Any] | None:
+    """
+    CLI 시작·배치 풀 initializer용: Numba 캐시 활성화(항상) 후 warmup.
+    librosa·madmom이 없는 환경(bandsplit backend만 쓰는 경우 등)은 None (initializer가 풀을 깨지 않도록).
+    """
+    enable_numba_cache()
+    try:
+        return warmup(librosa=librosa, madmom=madmom)
+    except ImportError:
+        return None
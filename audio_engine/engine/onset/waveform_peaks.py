@@ -0,0 +1,161 @@
+"""
+L5 I/O Adapters: 웹 파형용 min/max 피크 피라미드 (.peaks).
+
+웹(WaveSurfer)은 파형을 그리기 전에 오디오 전체를 브라우저에서 디코드 → 긴 트랙은 첫 화면이 늦음.
+분석 쪽에서 이미 디코드한 신호(OnsetContext.y, stem 배열)로 픽셀당 샘플 수(samples_per_pixel)별
+(min, max) 쌍을 미리 계산해 두면, 뷰어는 피크로 바로 그리고 오디오는 재생용으로만 스트리밍.
+
+레벨: samples_per_pixel 오름차순 (세밀 → 거침). 각 레벨은 바로 앞 레벨의 정수배 → 앞 레벨을 묶어 계산.
+값: 전체 절대 최댓값(scale)으로 정규화 후 int8(bits=8) 또는 int16(bits=16) 양자화. 원래 진폭 = q / qmax * scale.
+
+파일 구조 (.peaks):
+    b"OWPK" | uint32 버전 | uint32 헤더 길이 | 헤더 JSON | 8바이트 정렬 | 레벨 데이터...
+    헤더 = {sr, duration_sec, n_samples, bits, scale, levels: [{samples_per_pixel, length, offset, nbytes}]}
+    레벨 데이터 = [min0, max0, min1, max1, ...] 리틀 엔디언, offset은 데이터 영역 시작 기준 (8바이트 정렬).
+웹(waveformPeaks.ts)은 헤더 + 필요한 레벨 1개만 HTTP Range로 받음.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+PEAKS_MAGIC = b"OWPK"
+PEAKS_VERSION = 1
+PEAKS_SUFFIX = ".peaks"
+# 22050 Hz 기준 약 689 / 172 / 43 / 11 / 2.7 px/s (웹 줌 범위 10~500 px/s)
+DEFAULT_SAMPLES_PER_PIXEL = (32, 128, 512, 2048, 8192)
+_DTYPES = {8: np.int8, 16: np.int16}
+
+_ALIGN = 8
+
+
+def _reduce_pairs(mins: np.ndarray, maxs: np.ndarray, factor: int) -> tuple[np.ndarray, np.ndarray]:
+    """(min, max) 열을 factor개씩 묶어 min·max. 마지막 묶음이 모자라면 끝 값 반복 (결과 불변)."""
+    n = -(-len(mins) // factor)
+    pad = n * factor - len(mins)
+    if pad:
+        mins = np.pad(mins, (0, pad), mode="edge")
+        maxs = np.pad(maxs, (0, pad), mode="edge")
+    return mins.reshape(n, factor).min(axis=1), maxs.reshape(n, factor).max(axis=1)
+
+
+def build_peak_pyramid(
+    y: np.ndarray,
+    sr: int,
+    samples_per_pixel: Sequence[int] = DEFAULT_SAMPLES_PER_PIXEL,
+    bits: int = 8,
+) -> dict[str, Any]:
+    """
+    신호 → {sr, duration_sec, n_samples, bits, scale, levels: [{samples_per_pixel, min, max}]} (min·max는 양자화 배열).
+    y: mono (n,) 또는 (channels, n) → 채널 평균. samples_per_pixel은 오름차순, 각 값이 앞 값의 정수배.
+    """
+    if bits not in _DTYPES:
+        raise ValueError(f"지원하지 않는 bits: {bits} (가능: {', '.join(map(str, _DTYPES))})")
+    spp = [int(s) for s in samples_per_pixel]
+    if not spp or spp[0] < 1 or any(b % a for a, b in zip(spp, spp[1:])) or any(b <= a for a, b in zip(spp, spp[1:])):
+        raise ValueError(f"samples_per_pixel은 오름차순 정수배여야 합니다: {spp}")
+    y = np.asarray(y, dtype=np.float32)
+    if y.ndim > 1:
+        y = y.mean(axis=0)
+    if y.size == 0:
+        y = np.zeros(1, dtype=np.float32)
+    qmax = np.iinfo(_DTYPES[bits]).max
+    scale = float(np.max(np.abs(y))) or 1.0
+
+    mins, maxs = _reduce_pairs(y, y, spp[0])
+    prev = spp[0]
+    levels = []
+    for s in spp:
+        if s != prev:
+            mins, maxs = _reduce_pairs(mins, maxs, s // prev)
+            prev = s
+        levels.append({
+            "samples_per_pixel": s,
+            "min": np.round(mins / scale * qmax).astype(_DTYPES[bits]),
+            "max": np.round(maxs / scale * qmax).astype(_DTYPES[bits]),
+        })
+    return {
+        "sr": int(sr),
+        "duration_sec": round(len(y) / float(sr), 4),
+        "n_samples": int(len(y)),
+        "bits": bits,
+        "scale": scale,
+        "levels": levels,
+    }
+
+
+def encode_peaks(pyramid: dict[str, Any]) -> bytes:
+    """build_peak_pyramid 결과 → .peaks 바이트."""
+    header = {k: v for k, v in pyramid.items() if k != "levels"}
+    header["levels"] = []
+    chunks: list[bytes] = []
+    offset = 0
+    for level in pyramid["levels"]:
+        pairs = np.empty(2 * len(level["min"]), dtype=level["min"].dtype.newbyteorder("<"))
+        pairs[0::2] = level["min"]
+        pairs[1::2] = level["max"]
+        raw = pairs.tobytes()
+        header["levels"].append({
+            "samples_per_pixel": level["samples_per_pixel"],
+            "length": len(level["min"]),
+            "offset": offset,
+            "nbytes": len(raw),
+        })
+        raw += b"\0" * (-len(raw) % _ALIGN)
+        chunks.append(raw)
+        offset += len(raw)
+    head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    prefix = PEAKS_MAGIC + struct.pack("<II", PEAKS_VERSION, len(head)) + head
+    prefix += b"\0" * (-len(prefix) % _ALIGN)
+    return prefix + b"".join(chunks)
+
+
+def decode_peaks(data: bytes) -> dict[str, Any]:
+    """.peaks 바이트 → build_peak_pyramid와 같은 구조 (min·max 양자화 배열)."""
+    if data[:4] != PEAKS_MAGIC:
+        raise ValueError("OWPK 피크 파일이 아닙니다")
+    version, head_len = struct.unpack_from("<II", data, 4)
+    if version > PEAKS_VERSION:
+        raise ValueError(f"지원하지 않는 피크 파일 버전: {version}")
+    start = 12 + head_len
+    header = json.loads(data[12:start].decode("utf-8"))
+    base = start + (-start % _ALIGN)
+    dtype = np.dtype(_DTYPES[header["bits"]]).newbyteorder("<")
+    levels = []
+    for entry in header["levels"]:
+        pairs = np.frombuffer(data, dtype=dtype, count=2 * entry["length"], offset=base + entry["offset"])
+        levels.append({"samples_per_pixel": entry["samples_per_pixel"], "min": pairs[0::2], "max": pairs[1::2]})
+    return {**header, "levels": levels}
+
+
+def write_waveform_peaks(
+    y: np.ndarray,
+    sr: int,
+    path: Path | str,
+    project_root: Optional[Path | str] = None,
+    samples_per_pixel: Sequence[int] = DEFAULT_SAMPLES_PER_PIXEL,
+    bits: int = 8,
+) -> Path:
+    """build_peak_pyramid → {path}.peaks (임시 파일 → rename). project_root가 있으면 web/public에 복사. Returns: 실제 기록 경로."""
+    from audio_engine.engine.onset.export import _copy_to_web_public, _ensure_dir
+
+    path = Path(path).with_suffix(PEAKS_SUFFIX)
+    _ensure_dir(path)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        tmp.write_bytes(encode_peaks(build_peak_pyramid(y, sr, samples_per_pixel, bits)))
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    if project_root is not None:
+        _copy_to_web_public(path, Path(project_root))
+    return path
+
+
+def read_waveform_peaks(path: Path | str) -> dict[str, Any]:
+    return decode_peaks(Path(path).read_bytes())
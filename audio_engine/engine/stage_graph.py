@@ -0,0 +1,195 @@
+"""
+파이프라인 단계 DAG + 단계 캐시.
+
+단계(Stage)는 이름·의존 단계·입력 파일·파라미터·실행 함수로 정의. run_stages는 위상 정렬 순서로 실행하되,
+단계 키 = SHA-256(단계 이름·버전 + 파라미터 + 입력 파일 content hash + 의존 단계 출력 hash)가
+지난 기록과 같고 기록된 출력이 그대로 있으면 실행하지 않음 ("cached").
+의존 단계가 다시 실행돼도 출력 내용이 같으면 하위 단계 키도 같음 → 하위 단계 생략.
+
+기록: state_dir / {track} / {stage}.json = {version, stage, key, outputs: {이름: {path, hash}}, wall_sec}
+출력 파일·디렉터리 hash는 io.file_content_hash (디렉터리는 하위 파일 상대 경로 + hash 목록의 hash).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from audio_engine.engine.io import file_content_hash
+
+STAGE_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    run(ctx, upstream) → {출력 이름: 경로}. upstream = {의존 단계 이름: 그 단계 출력}.
+    inputs(ctx) → {입력 이름: 파일 경로} (의존 단계 출력은 자동으로 키에 포함).
+    params(ctx) → 결과에 영향을 주는 설정·상수 (JSON 직렬화 가능). 값이 바뀌면 다시 실행.
+    version: 단계 코드가 결과를 바꾸도록 수정되면 올림.
+    """
+    name: str
+    run: Callable[[Any, dict[str, dict[str, Path]]], dict[str, Path]]
+    deps: tuple[str, ...] = ()
+    inputs: Callable[[Any], dict[str, Path]] = lambda ctx: {}
+    params: Callable[[Any], dict[str, Any]] = lambda ctx: {}
+    version: int = 1
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # "ran" | "cached" | "skipped"
+    key: str = ""
+    wall_sec: float = 0.0
+    outputs: dict[str, Path] = field(default_factory=dict)
+
+
+def path_hash(path: Path | str) -> str:
+    """파일 → content hash. 디렉터리 → 하위 파일 (상대 경로, hash) 목록의 hash. 임시 파일 제외."""
+    path = Path(path)
+    if not path.is_dir():
+        return file_content_hash(path)
+    h = hashlib.sha256()
+    for p in sorted(path.rglob("*")):
+        if p.is_file() and ".tmp" not in p.name:
+            h.update(f"{p.relative_to(path).as_posix()}\0{file_content_hash(p)}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def topo_order(stages: Iterable[Stage], targets: Iterable[str] | None = None) -> list[Stage]:
+    """
+    의존 순서 (같은 깊이는 정의 순서). targets가 있으면 그 단계와 조상만.
+    알 수 없는 의존·순환은 ValueError.
+    """
+    by_name = {s.name: s for s in stages}
+    order: list[Stage] = []
+    state: dict[str, str] = {}
+
+    def visit(name: str, chain: tuple[str, ...]) -> None:
+        if name not in by_name:
+            raise ValueError(f"알 수 없는 단계: {name}" + (f" ({chain[-1]}의 의존)" if chain else ""))
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"단계 의존 순환: {' → '.join(chain + (name,))}")
+        state[name] = "visiting"
+        for dep in by_name[name].deps:
+            visit(dep, chain + (name,))
+        state[name] = "done"
+        order.append(by_name[name])
+
+    for name in targets if targets is not None else by_name:
+        visit(name, ())
+    return order
+
+
+def stage_key(stage: Stage, ctx: Any, upstream: dict[str, dict[str, str]]) -> str:
+    """단계 이름·버전 + 파라미터 + 입력 파일 hash + 의존 단계 출력 hash → 16진 SHA-256."""
+    payload = {
+        "v": STAGE_STATE_VERSION,
+        "stage": stage.name,
+        "version": stage.version,
+        "params": stage.params(ctx),
+        "inputs": {name: path_hash(p) for name, p in sorted(stage.inputs(ctx).items())},
+        "upstream": {dep: upstream[dep] for dep in stage.deps},
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _state_path(state_dir: Path, track: str, stage: str) -> Path:
+    return state_dir / track / f"{stage}.json"
+
+
+def load_stage_record(state_dir: Path | str, track: str, stage: str) -> dict[str, Any] | None:
+    try:
+        with open(_state_path(Path(state_dir), track, stage), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_stage_record(state_dir: Path, track: str, record: dict[str, Any]) -> None:
+    path = _state_path(state_dir, track, record["stage"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _record_valid(record: dict[str, Any] | None, key: str) -> bool:
+    """키가 같고 기록된 출력이 모두 있고 내용이 같으면 True."""
+    if not record or record.get("key") != key or record.get("version") != STAGE_STATE_VERSION:
+        return False
+    for out in record.get("outputs", {}).values():
+        p = Path(out["path"])
+        if not p.exists() or path_hash(p) != out["hash"]:
+            return False
+    return True
+
+
+def run_stages(
+    stages: Iterable[Stage],
+    ctx: Any,
+    track: str,
+    state_dir: Path | str,
+    targets: Iterable[str] | None = None,
+    force: Iterable[str] = (),
+    dry_run: bool = False,
+    on_stage: Callable[[StageResult], None] | None = None,
+) -> list[StageResult]:
+    """
+    targets(기본 전체)와 그 조상 단계를 의존 순서로 실행. 키가 같고 출력이 그대로면 "cached".
+    force: 키와 무관하게 다시 실행할 단계 이름. dry_run: 실행하지 않고 상태만 ("ran" 대신 "skipped" = 실행 예정).
+    dry_run에서 실행 예정 단계의 하위 단계는 입력을 알 수 없으므로 "skipped".
+    on_stage: 단계가 끝날 때마다 호출 (진행 표시용).
+    """
+    state_dir = Path(state_dir)
+    force = set(force)
+    results: list[StageResult] = []
+    upstream_hashes: dict[str, dict[str, str]] = {}
+    upstream_outputs: dict[str, dict[str, Path]] = {}
+    pending: set[str] = set()
+    for stage in topo_order(stages, targets):
+        if dry_run and any(dep in pending for dep in stage.deps):
+            pending.add(stage.name)
+            result = StageResult(stage.name, "skipped")
+        else:
+            key = stage_key(stage, ctx, upstream_hashes)
+            record = load_stage_record(state_dir, track, stage.name)
+            if stage.name not in force and _record_valid(record, key):
+                outputs = {name: Path(out["path"]) for name, out in record["outputs"].items()}
+                hashes = {name: out["hash"] for name, out in record["outputs"].items()}
+                result = StageResult(stage.name, "cached", key, 0.0, outputs)
+            elif dry_run:
+                pending.add(stage.name)
+                result = StageResult(stage.name, "skipped", key)
+            else:
+                start = time.perf_counter()
+                outputs = {name: Path(p) for name, p in stage.run(ctx, upstream_outputs).items()}
+                wall = time.perf_counter() - start
+                hashes = {name: path_hash(p) for name, p in outputs.items()}
+                _save_stage_record(state_dir, track, {
+                    "version": STAGE_STATE_VERSION,
+                    "stage": stage.name,
+                    "key": key,
+                    "outputs": {name: {"path": str(outputs[name]), "hash": hashes[name]} for name in outputs},
+                    "wall_sec": round(wall, 3),
+                })
+                result = StageResult(stage.name, "ran", key, wall, outputs)
+            if result.status != "skipped":
+                upstream_hashes[stage.name] = hashes
+                upstream_outputs[stage.name] = result.outputs
+        results.append(result)
+        if on_stage is not None:
+            on_stage(result)
+    return results
@@ -0,0 +1,112 @@
+"""
+Stem 분리 결과 content-addressed 캐시.
+키 = 입력 오디오 content hash (SHA-256) + 분리 설정 식별자 (backend·모델·파라미터 해시).
+파일명이 달라도 같은 오디오면 같은 항목 → 재업로드·재실행 시 분리 생략.
+
+항목 구조 (항목 단위 manifest.json이 마지막에 기록 → manifest가 있으면 완성된 항목):
+    cache_dir / hash[:2] / {content_hash}-{params_hash} / {stem}.{wav|flac}, manifest.json
+항목은 임시 폴더에 쓴 뒤 rename으로 게시 (동시 실행 시 먼저 끝난 쪽 채택).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+STEM_CACHE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def params_hash(identity: dict[str, Any]) -> str:
+    """분리 설정 식별자(dict) → 16자리 hex. 키 순서와 무관."""
+    payload = json.dumps({"v": STEM_CACHE_VERSION, **identity}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def entry_dir(cache_dir: Path | str, content_hash: str, identity: dict[str, Any]) -> Path:
+    return Path(cache_dir) / content_hash[:2] / f"{content_hash}-{params_hash(identity)}"
+
+
+def load_entry(cache_dir: Path | str, content_hash: str, identity: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    캐시 조회. 항목이 없거나 불완전(stem 파일 누락)하면 None.
+    Returns: manifest dict + "stems": {stem 이름: 캐시 내 wav 절대 경로}
+    """
+    path = entry_dir(cache_dir, content_hash, identity)
+    try:
+        with open(path / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    stems = {name: path / filename for name, filename in manifest.get("stems", {}).items()}
+    if not stems or not all(p.exists() for p in stems.values()):
+        return None
+    return {**manifest, "stems": {name: str(p) for name, p in stems.items()}}
+
+
+def store_entry(
+    cache_dir: Path | str,
+    content_hash: str,
+    identity: dict[str, Any],
+    write_stems: Callable[[Path], dict[str, str]],
+    *,
+    source_name: str = "",
+    extra: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    write_stems(tmp_dir) → {stem 이름: 파일명} 으로 임시 폴더에 stem을 쓰게 한 뒤 항목으로 게시.
+    같은 항목이 이미 (다른 프로세스에 의해) 생겼으면 임시 폴더를 버리고 기존 항목 사용.
+    Returns: load_entry()와 같은 형식.
+    """
+    path = entry_dir(cache_dir, content_hash, identity)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
+    tmp.mkdir()
+    try:
+        stems = write_stems(tmp)
+        for filename in stems.values():
+            # 게시 후 다른 경로에서 하드링크로 공유되므로 읽기 전용
+            os.chmod(tmp / filename, 0o444)
+        manifest = {
+            "version": STEM_CACHE_VERSION,
+            "content_hash": content_hash,
+            "params_hash": params_hash(identity),
+            "identity": identity,
+            "source_name": source_name,
+            "stems": stems,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            **(extra or {}),
+        }
+        with open(tmp / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # 이미 완성된 항목이 있음 (동시 실행) → 그쪽 채택, 불완전한 항목이면 교체
+            if load_entry(cache_dir, content_hash, identity) is None:
+                shutil.rmtree(path, ignore_errors=True)
+                os.rename(tmp, path)
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+    entry = load_entry(cache_dir, content_hash, identity)
+    if entry is None:
+        raise RuntimeError(f"stem 캐시 항목 기록 실패: {path}")
+    return entry
+
+
+def list_entries(cache_dir: Path | str) -> list[dict[str, Any]]:
+    """캐시 안의 완성된 항목 manifest 목록 (정리·점검용)."""
+    entries = []
+    for manifest_path in sorted(Path(cache_dir).glob(f"*/*/{MANIFEST_NAME}")):
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            continue
+        entries.append({**manifest, "path": str(manifest_path.parent)})
+    return entries
@@ -1,25 +1,460 @@
 """
-Stem 분리 (Demucs/Spleeter wrapper)
+Stem 분리 (Demucs wrapper)
+
+SeparationWorker가 분리 backend(모델)를 프로세스 안에 1회 로드해 두고 트랙 큐를 순서대로 처리.
+입력은 메모리로 디코드 (MP3 → 임시 WAV 변환 없음), stem은 Demucs CLI와 같은 폴더 구조로 바로 기록:
+    out_dir / backend.name / track_name / {stem}.wav  (stem_format="flac"이면 .flac)
+backend:
+    "demucs"    : Demucs 사전학습 모델 (demucs·torch 필요)
+    "bandsplit" : 모델 없는 대역 분할 stand-in (scipy만 사용). demucs·torch 없이 단계 DAG·배치를 돌릴 때 (분리 품질 없음)
 """
-import shutil
-import subprocess
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+import numpy as np
+
+from audio_engine.engine.io import (
+    DEFAULT_STEM_FORMAT,
+    drop_stem_variants,
+    file_content_hash,
+    link_file,
+    load_audio,
+    write_audio,
+)
+from audio_engine.engine.stem_cache import load_entry, store_entry
+
+DEMUCS_SOURCES = ("drums", "bass", "other", "vocals")
+# 출력 파일 순서 (기존 separate() 반환 순서)
+STEM_NAMES = ("vocals", "drums", "bass", "other")
+
+
+class SeparationBackend(Protocol):
+    """분리 모델 인터페이스. load()는 1회만 무거운 작업(가중치 로드 등)을 수행."""
+    name: str
+    sources: tuple[str, ...]
+    samplerate: int
+    audio_channels: int
+
+    def load(self) -> None:
+        ...
+
+    def identity(self) -> dict[str, Any]:
+        """stem 캐시 키에 들어가는 설정 (같으면 같은 출력). load() 없이 계산 가능해야 함."""
+        ...
+
+    def separate(self, wav: np.ndarray) -> dict[str, np.ndarray]:
+        """wav: (channels, samples) float32, samplerate·audio_channels 맞춤 → {source: (channels, samples)}."""
+        ...
+
+
+class DemucsBackend:
+    """Demucs 사전학습 모델 in-process 실행 (CLI와 같은 정규화·apply_model 설정)."""
+
+    def __init__(
+        self,
+        model_name: str = "htdemucs",
+        device: str | None = None,
+        shifts: int = 1,
+        split: bool = True,
+        overlap: float = 0.25,
+    ) -> None:
+        self.name = model_name
+        self.device = device
+        self.shifts = shifts
+        self.split = split
+        self.overlap = overlap
+        self.sources = DEMUCS_SOURCES
+        self.samplerate = 44100
+        self.audio_channels = 2
+        self._model: Any = None
+
+    def load(self) -> None:
+        if self._model is not None:
+            return
+        import torch
+        from demucs.pretrained import get_model
+
+        if self.device is None:
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        model = get_model(self.name)
+        model.to(self.device)
+        model.eval()
+        self._model = model
+        self.sources = tuple(model.sources)
+        self.samplerate = int(model.samplerate)
+        self.audio_channels = int(model.audio_channels)
+
+    def identity(self) -> dict[str, Any]:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            demucs_version = version("demucs")
+        except PackageNotFoundError:
+            demucs_version = "unknown"
+        return {
+            "backend": "demucs",
+            "model": self.name,
+            "demucs": demucs_version,
+            "shifts": self.shifts,
+            "split": self.split,
+            "overlap": self.overlap,
+        }
+
+    def separate(self, wav: np.ndarray) -> dict[str, np.ndarray]:
+        import torch
+        from demucs.apply import apply_model
+
+        self.load()
+        x = torch.from_numpy(np.ascontiguousarray(wav, dtype=np.float32))
+        # demucs.separate와 같은 정규화: mono 기준 평균·표준편차
+        ref = x.mean(0)
+        mean, std = ref.mean(), ref.std()
+        x = (x - mean) / (std + 1e-8)
+        with torch.no_grad():
+            out = apply_model(
+                self._model,
+                x[None],
+                device=self.device,
+                shifts=self.shifts,
+                split=self.split,
+                overlap=self.overlap,
+                progress=False,
+                num_workers=0,
+            )[0]
+        out = out * (std + 1e-8) + mean
+        return {name: out[i].cpu().numpy() for i, name in enumerate(self.sources)}
+
+
+class BandSplitBackend:
+    """
+    모델 없는 stand-in: bass = 150Hz 이하, drums = 4kHz 이상, vocals = 나머지의 mid(L+R) 성분, other = 잔차.
+    네 stem의 합 = 입력 (Demucs와 같은 성질). 음악적으로 의미 있는 분리는 아님.
+    """
+    name = "bandsplit"
+
+    def __init__(self, samplerate: int = 44100, audio_channels: int = 2) -> None:
+        self.sources = DEMUCS_SOURCES
+        self.samplerate = samplerate
+        self.audio_channels = audio_channels
+        self._sos: dict[str, np.ndarray] | None = None
+
+    def load(self) -> None:
+        if self._sos is not None:
+            return
+        from scipy.signal import butter
+
+        self._sos = {
+            "bass": butter(4, 150, btype="lowpass", fs=self.samplerate, output="sos"),
+            "drums": butter(4, 4000, btype="highpass", fs=self.samplerate, output="sos"),
+        }
+
+    def identity(self) -> dict[str, Any]:
+        return {"backend": self.name, "samplerate": self.samplerate, "audio_channels": self.audio_channels}
+
+    def separate(self, wav: np.ndarray) -> dict[str, np.ndarray]:
+        from scipy.signal import sosfiltfilt
+
+        self.load()
+        wav = np.asarray(wav, dtype=np.float32)
+        bass = sosfiltfilt(self._sos["bass"], wav, axis=-1).astype(np.float32)
+        drums = sosfiltfilt(self._sos["drums"], wav, axis=-1).astype(np.float32)
+        rest = wav - bass - drums
+        vocals = np.broadcast_to(rest.mean(axis=0, keepdims=True), rest.shape).astype(np.float32)
+        other = rest - vocals
+        return {"drums": drums, "bass": bass, "other": other, "vocals": vocals}
+
+
+SEPARATION_BACKENDS: dict[str, Callable[..., SeparationBackend]] = {
+    "demucs": DemucsBackend,
+    BandSplitBackend.name: BandSplitBackend,
+}
+
+
+@dataclass
+class SeparationStats:
+    """워커 누적 처리량. realtime_factor = 처리한 오디오 초 / 소요 초 (클수록 빠름)."""
+    tracks: int = 0
+    audio_sec: float = 0.0
+    wall_sec: float = 0.0
+    load_sec: float = 0.0
+    cache_hits: int = 0
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_sec / self.wall_sec if self.wall_sec > 0 else 0.0
 
-import librosa
-import soundfile as sf
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "tracks": self.tracks,
+            "audio_sec": round(self.audio_sec, 4),
+            "wall_sec": round(self.wall_sec, 4),
+            "load_sec": round(self.load_sec, 4),
+            "cache_hits": self.cache_hits,
+            "realtime_factor": round(self.realtime_factor, 2),
+        }
 
 
-def _ensure_wav(audio_path: Path, out_dir: Path) -> Path:
-    """MP3 등 비-WAV 파일을 WAV로 변환해 반환. (Demucs/torchaudio torchcodec 이슈 회피)"""
-    if audio_path.suffix.lower() == ".wav":
-        return audio_path
-    y, sr = librosa.load(str(audio_path), sr=None, mono=False)
-    if y.ndim == 1:
-        y = y.reshape(1, -1)
-    # Demucs가 트랙 폴더명으로 입력 파일 stem 사용 → 원본과 동일한 이름으로 저장
-    wav_path = out_dir / (audio_path.stem + "_input.wav")
-    sf.write(str(wav_path), y.T, sr)
-    return wav_path
+def _load_audio(audio_path: Path, samplerate: int, audio_channels: int) -> np.ndarray:
+    """오디오 → (audio_channels, samples) float32 @ samplerate (io.load_audio, 채널 유지)."""
+    y, _ = load_audio(audio_path, sr=samplerate, mono=False)
+    wav = np.atleast_2d(y).astype(np.float32, copy=False)
+    if wav.shape[0] == audio_channels:
+        return wav
+    if audio_channels == 1:
+        return wav.mean(axis=0, keepdims=True)
+    if wav.shape[0] == 1:
+        return np.repeat(wav, audio_channels, axis=0)
+    return wav[:audio_channels]
+
+
+def _write_stem(path: Path, wav: np.ndarray, samplerate: int, stem_format: str = DEFAULT_STEM_FORMAT) -> Path:
+    """
+    Demucs CLI 기본 저장과 동일: clip='rescale' 후 16-bit PCM (WAV 또는 FLAC).
+    io.write_audio가 임시 파일 → rename: 기존 path가 캐시 stem 하드링크여도 캐시 내용은 바뀌지 않음.
+    """
+    peak = float(np.abs(wav).max()) if wav.size else 0.0
+    wav = wav / max(1.01 * peak, 1.0)
+    return write_audio(path, wav.T, samplerate, stem_format)
+
+
+class SeparationWorker:
+    """
+    backend를 1회 로드해 두고 트랙을 순서대로 분리하는 장기 실행 워커.
+    run()은 다음 트랙 디코드를 백그라운드 스레드에서 미리 수행 (분리와 디코드 겹침).
+    cache_dir 지정 시 stem_cache 사용: 같은 오디오 내용·설정이면 분리 없이 캐시 stem을 out_dir에 링크.
+    """
+
+    def __init__(
+        self,
+        backend: SeparationBackend,
+        out_dir: Path | str | None = None,
+        stem_format: str = DEFAULT_STEM_FORMAT,
+    ) -> None:
+        self.backend = backend
+        self.out_dir = Path(out_dir).resolve() if out_dir is not None else None
+        self.stem_format = stem_format
+        self.stats = SeparationStats()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        start = time.perf_counter()
+        self.backend.load()
+        self.stats.load_sec += time.perf_counter() - start
+        self._loaded = True
+
+    def _track_dir(self, audio_path: Path, out_dir: Path | str | None, track_name: str | None = None) -> Path:
+        """out_dir / backend 이름 / track_name (기본: 입력 파일명)."""
+        base = Path(out_dir).resolve() if out_dir is not None else self.out_dir
+        if base is None:
+            base = audio_path.parent / "stems"
+        return base / self.backend.name / (track_name or audio_path.stem)
+
+    def _decode(self, audio_path: Path) -> np.ndarray:
+        self._ensure_loaded()
+        return _load_audio(audio_path, self.backend.samplerate, self.backend.audio_channels)
+
+    def _identity(self, two_stems: str | None) -> dict[str, Any]:
+        return {**self.backend.identity(), "two_stems": two_stems, "format": self.stem_format}
+
+    def _cached(
+        self,
+        audio_path: Path,
+        out_dir: Path | str | None,
+        two_stems: str | None,
+        cache_dir: Path | str | None,
+        content_hash: str | None = None,
+        track_name: str | None = None,
+    ) -> tuple[dict[str, str] | None, str | None]:
+        """캐시 hit이면 (out_dir에 게시한 stem 경로, content_hash), miss면 (None, content_hash)."""
+        if cache_dir is None:
+            return None, None
+        content_hash = content_hash or file_content_hash(audio_path)
+        entry = load_entry(cache_dir, content_hash, self._identity(two_stems))
+        if entry is None:
+            return None, content_hash
+        self.stats.cache_hits += 1
+        return self._publish(entry["stems"], audio_path, out_dir, track_name), content_hash
+
+    def _publish(
+        self,
+        cached: dict[str, str],
+        audio_path: Path,
+        out_dir: Path | str | None,
+        track_name: str | None = None,
+    ) -> dict[str, str]:
+        track_dir = self._track_dir(audio_path, out_dir, track_name)
+        result = {}
+        for name, src in cached.items():
+            dst = track_dir / Path(src).name
+            link_file(src, dst)
+            drop_stem_variants(dst)
+            result[name] = str(dst)
+        return result
+
+    def _separate_decoded(
+        self,
+        audio_path: Path,
+        wav: np.ndarray,
+        out_dir: Path | str | None,
+        two_stems: str | None,
+        cache_dir: Path | str | None = None,
+        content_hash: str | None = None,
+        track_name: str | None = None,
+    ) -> dict[str, str]:
+        start = time.perf_counter()
+        with self._lock:
+            sources = self.backend.separate(wav)
+        if two_stems:
+            if two_stems not in sources:
+                raise ValueError(f"알 수 없는 stem: {two_stems} (가능: {', '.join(sources)})")
+            rest = sum(v for k, v in sources.items() if k != two_stems)
+            sources = {two_stems: sources[two_stems], f"no_{two_stems}": rest}
+            names = list(sources)
+        else:
+            names = [n for n in STEM_NAMES if n in sources] + [n for n in sources if n not in STEM_NAMES]
+
+        def write_stems(folder: Path) -> dict[str, str]:
+            folder.mkdir(parents=True, exist_ok=True)
+            return {
+                name: _write_stem(folder / name, sources[name], self.backend.samplerate, self.stem_format).name
+                for name in names
+            }
+
+        if cache_dir is not None:
+            entry = store_entry(
+                cache_dir,
+                content_hash or file_content_hash(audio_path),
+                self._identity(two_stems),
+                write_stems,
+                source_name=audio_path.name,
+                extra={"samplerate": self.backend.samplerate, "duration_sec": wav.shape[-1] / float(self.backend.samplerate)},
+            )
+            result = self._publish(entry["stems"], audio_path, out_dir, track_name)
+        else:
+            track_dir = self._track_dir(audio_path, out_dir, track_name)
+            result = {name: str(track_dir / filename) for name, filename in write_stems(track_dir).items()}
+
+        self.stats.tracks += 1
+        self.stats.audio_sec += wav.shape[-1] / float(self.backend.samplerate)
+        self.stats.wall_sec += time.perf_counter() - start
+        return result
+
+    def separate(
+        self,
+        audio_path: Path | str,
+        out_dir: Path | str | None = None,
+        two_stems: str | None = None,
+        cache_dir: Path | str | None = None,
+        track_name: str | None = None,
+    ) -> dict[str, str]:
+        """
+        트랙 1개 분리 → {stem 이름: wav 경로}. cache_dir hit이면 분리·디코드 없이 링크만.
+        track_name: stem 폴더 이름 (기본: 입력 파일명). 파일명이 같은 다른 트랙과 폴더를 나눌 때.
+        """
+        audio_path = Path(audio_path).resolve()
+        if not audio_path.exists():
+            raise FileNotFoundError(f"오디오 파일 없음: {audio_path}")
+        start = time.perf_counter()
+        cached, content_hash = self._cached(audio_path, out_dir, two_stems, cache_dir, track_name=track_name)
+        if cached is not None:
+            return cached
+        wav = self._decode(audio_path)
+        decode_sec = time.perf_counter() - start
+        result = self._separate_decoded(audio_path, wav, out_dir, two_stems, cache_dir, content_hash, track_name)
+        self.stats.wall_sec += decode_sec
+        return result
+
+    def run(
+        self,
+        audio_paths: Iterable[Path | str],
+        out_dir: Path | str | None = None,
+        two_stems: str | None = None,
+        cache_dir: Path | str | None = None,
+    ) -> Iterator[tuple[str, dict[str, str]]]:
+        """
+        트랙 큐를 순서대로 분리. 현재 트랙을 분리하는 동안 다음 트랙을 디코드.
+        cache_dir hit 트랙은 디코드하지 않음. 큐 안의 중복 내용은 첫 트랙 분리 후 hit이므로 미리 디코드하지 않음.
+        Yields: (입력 경로, {stem 이름: wav 경로})
+        """
+        paths = [Path(p).resolve() for p in audio_paths]
+        for p in paths:
+            if not p.exists():
+                raise FileNotFoundError(f"오디오 파일 없음: {p}")
+        if not paths:
+            return
+        hashes: dict[int, str] = {}
+
+        def content_hash_of(i: int) -> str:
+            if i not in hashes:
+                hashes[i] = file_content_hash(paths[i])
+            return hashes[i]
+
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            decoded: dict[int, Any] = {}
+            # 분리 예정(디코드 예약·진행) 트랙의 content hash: 뒤따르는 같은 내용 트랙은 저장 후 hit
+            to_store: set[str] = set()
+
+            def prefetch(i: int) -> None:
+                # 캐시 hit·중복 트랙은 건너뛰고 다음 miss 트랙 디코드를 예약
+                while i < len(paths) and i not in decoded:
+                    if cache_dir is None:
+                        decoded[i] = decoder.submit(self._decode, paths[i])
+                        return
+                    content_hash = content_hash_of(i)
+                    if content_hash not in to_store and load_entry(cache_dir, content_hash, self._identity(two_stems)) is None:
+                        to_store.add(content_hash)
+                        decoded[i] = decoder.submit(self._decode, paths[i])
+                        return
+                    i += 1
+
+            prefetch(0)
+            for i, path in enumerate(paths):
+                cached, content_hash = self._cached(
+                    path, out_dir, two_stems, cache_dir, content_hash_of(i) if cache_dir is not None else None
+                )
+                if cached is not None:
+                    decoded.pop(i, None)
+                    yield str(path), cached
+                    continue
+                # 디코드를 기다린 시간만 처리 시간에 포함 (분리와 겹친 디코드는 제외)
+                start = time.perf_counter()
+                if content_hash is not None:
+                    to_store.add(content_hash)
+                future = decoded.pop(i, None) or decoder.submit(self._decode, path)
+                wav = future.result()
+                self.stats.wall_sec += time.perf_counter() - start
+                prefetch(i + 1)
+                yield str(path), self._separate_decoded(path, wav, out_dir, two_stems, cache_dir, content_hash)
+
+
+_WORKERS: dict[tuple, SeparationWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_separation_worker(
+    backend: str = "demucs",
+    stem_format: str = DEFAULT_STEM_FORMAT,
+    **backend_kwargs: Any,
+) -> SeparationWorker:
+    """backend 이름·설정·저장 형식별 워커 1개 (프로세스 전역 재사용 → 모델 로드 1회)."""
+    if backend not in SEPARATION_BACKENDS:
+        raise ValueError(f"알 수 없는 분리 backend: {backend} (가능: {', '.join(SEPARATION_BACKENDS)})")
+    key = (backend, stem_format, tuple(sorted((k, str(v)) for k, v in backend_kwargs.items())))
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is None:
+            worker = SeparationWorker(SEPARATION_BACKENDS[backend](**backend_kwargs), stem_format=stem_format)
+            _WORKERS[key] = worker
+    return worker
 
 
 def separate(
@@ -27,67 +462,30 @@ def separate(
     out_dir: str | None = None,
     model_name: str = "htdemucs",
     two_stems: str | None = None,
+    backend: str = "demucs",
+    cache_dir: str | None = None,
+    stem_format: str = DEFAULT_STEM_FORMAT,
+    track_name: str | None = None,
 ) -> dict[str, str]:
     """
-    Demucs로 오디오를 stem별로 분리합니다.
+    Demucs로 오디오를 stem별로 분리합니다. 같은 프로세스에서 반복 호출하면 모델을 다시 로드하지 않음.
+    cache_dir 지정 시 같은 오디오 내용(파일명 무관)·설정의 이전 결과를 재사용 (분리 생략, 출력 폴더에 링크).
 
     Args:
         audio_path: 입력 오디오 파일 경로 (wav, mp3 등)
         out_dir: 출력 디렉터리. None이면 입력 파일과 같은 디렉터리/stems
-        model_name: Demucs 모델 이름 (htdemucs, htdemucs_ft 등)
+        model_name: Demucs 모델 이름 (htdemucs, htdemucs_ft 등). backend="demucs"일 때만 사용
         two_stems: "vocals" 등으로 지정 시 보컬/나머지 2개만 생성
+        backend: "demucs" | "bandsplit" (모델 없는 stand-in)
+        cache_dir: stem 캐시 폴더 (stem_cache). None이면 매번 분리
+        stem_format: "wav" | "flac" (둘 다 16-bit PCM; flac은 무손실 압축, 엔진 reader는 형식 무관)
+        track_name: stem 폴더 이름. None이면 입력 파일명(확장자 제외)
 
     Returns:
-        stem 이름 -> wav 파일 경로 딕셔너리 (vocals, drums, bass, other)
+        stem 이름 -> stem 파일 경로 (WAV 또는 FLAC) 딕셔너리 (vocals, drums, bass, other)
+        출력 구조: out_dir / model_name(backend 이름) / track_name / {stem}.{wav|flac}
     """
-    audio_path = Path(audio_path).resolve()
-    if not audio_path.exists():
-        raise FileNotFoundError(f"오디오 파일 없음: {audio_path}")
-
-    if out_dir is None:
-        out_dir = audio_path.parent / "stems"
-    out_dir = Path(out_dir).resolve()
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    track_name = audio_path.stem
-    # MP3 등은 WAV로 변환 후 Demucs에 전달 (torchcodec 미설치 시 오류 방지)
-    input_path = _ensure_wav(audio_path, out_dir)
-    
-    try:
-        # Demucs는 입력 파일 stem으로 출력 서브폴더 이름 결정 → stem.wav로 넘기면 폴더명이 track_name과 일치
-        temp_wav = out_dir / (track_name + ".wav")
-        if input_path != audio_path:
-            shutil.copy2(input_path, temp_wav)
-            demucs_input = temp_wav
-        else:
-            demucs_input = input_path
-        cmd = [
-            "demucs",
-            "-n", model_name,
-            "-o", str(out_dir),
-            str(demucs_input),
-        ]
-        if two_stems:
-            cmd.extend(["--two-stems", two_stems])
-
-        subprocess.run(cmd, check=True)
-    finally:
-        # 변환된 임시 WAV 삭제
-        if input_path != audio_path.resolve() and input_path.exists():
-            input_path.unlink(missing_ok=True)
-        temp_wav = out_dir / (track_name + ".wav")
-        if temp_wav.exists():
-            temp_wav.unlink(missing_ok=True)
-
-    # Demucs 출력 구조: out_dir / model_name / track_name / {vocals,drums,bass,other}.wav
-    stem_dir = out_dir / model_name / track_name
-    stems = ["vocals", "drums", "bass", "other"]
-    if two_stems == "vocals":
-        stems = ["vocals", "no_vocals"]
-
-    result = {}
-    for name in stems:
-        wav_path = stem_dir / f"{name}.wav"
-        if wav_path.exists():
-            result[name] = str(wav_path)
-    return result
+    kwargs = {"model_name": model_name} if backend == "demucs" else {}
+    return get_separation_worker(backend, stem_format, **kwargs).separate(
+        audio_path, out_dir=out_dir, two_stems=two_stems, cache_dir=cache_dir, track_name=track_name
+    )
@@ -0,0 +1,149 @@
+"""
+web/public 게시용 미리 압축(.gz/.br)·content hash 파일명.
+
+JSON 출력은 트랙 길이에 비례해 커지고 dev 서버·정적 호스트가 압축 없이 보냄
+→ 게시할 때 {이름}.gz / {이름}.br 를 같이 두면 서버는 그대로 골라 보내기만 함 (실시간 압축 없음).
+content hash 파일명({stem}.{hash12}{확장자})은 내용이 바뀌면 URL이 바뀌므로 브라우저가 길게 캐시해도 됨.
+웹은 web/public/assets.json ({track}/{논리 이름} → URL·encodings)로 실제 URL을 찾음 (web assetManifest.ts).
+assets.json 갱신은 트랙 단위로 병합하고 assets.json.lock 잠금으로 직렬화 (동시 extract·일괄 실행이 서로의 항목을 잃지 않음).
+
+압축 대상은 COMPRESSIBLE_SUFFIXES (.json). .oab·.peaks·.evb는 웹이 HTTP Range로 일부만 읽으므로
+Content-Encoding을 붙이면 Range 오프셋이 맞지 않음 → 압축하지 않고 hash 파일명만 적용.
+br은 brotli 패키지가 있을 때만 (available_encodings).
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+ENCODINGS: dict[str, str] = {"gzip": ".gz", "br": ".br"}
+COMPRESSIBLE_SUFFIXES = (".json",)
+ASSET_MANIFEST_NAME = "assets.json"
+ASSET_MANIFEST_VERSION = 2  # 2: 키 = {track}/{논리 이름}, tracks 기록
+HASH_NAME_LEN = 12
+
+
+def available_encodings() -> tuple[str, ...]:
+    """이 환경에서 쓸 수 있는 encoding (gzip은 항상, br은 brotli 설치 시)."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return ("gzip",)
+    return ("gzip", "br")
+
+
+def is_compressible(name: str) -> bool:
+    return Path(name).suffix in COMPRESSIBLE_SUFFIXES
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """최고 압축 수준. gzip은 mtime=0 → 같은 입력이면 같은 바이트 (content hash·캐시 재사용)."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br":
+        import brotli
+
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"알 수 없는 encoding: {encoding} (가능: {', '.join(ENCODINGS)})")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{time.monotonic_ns()}")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_precompressed(path: Path | str, encodings: Iterable[str] = ("gzip",)) -> dict[str, Path]:
+    """path 옆에 {이름}.gz / {이름}.br 기록 (임시 파일 → rename). Returns: {encoding: 경로}"""
+    path = Path(path)
+    data = path.read_bytes()
+    out = {}
+    for encoding in encodings:
+        dest = path.with_name(path.name + ENCODINGS[encoding])
+        _write_atomic(dest, compress_bytes(data, encoding))
+        out[encoding] = dest
+    return out
+
+
+def hashed_name(name: str, content_hash: str) -> str:
+    """"streams_sections_cnn.json" → "streams_sections_cnn.{hash12}.json" (디렉터리 부분은 유지)."""
+    path = Path(name)
+    return path.with_name(f"{path.stem}.{content_hash[:HASH_NAME_LEN]}{path.suffix}").as_posix()
+
+
+def load_asset_manifest(dest_dir: Path | str) -> dict[str, Any]:
+    """assets.json. 없거나 깨졌거나 이전 버전(트랙 없는 키)이면 빈 manifest."""
+    try:
+        with open(Path(dest_dir) / ASSET_MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get("version") != ASSET_MANIFEST_VERSION:
+        return {"version": ASSET_MANIFEST_VERSION, "tracks": {}, "assets": {}}
+    manifest.setdefault("tracks", {})
+    manifest.setdefault("assets", {})
+    return manifest
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """path 잠금 파일에 프로세스 간 배타 잠금 (POSIX flock, Windows msvcrt)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK은 약 10초 재시도 후 실패 → 계속 대기
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def update_asset_manifest(dest_dir: Path | str, track: str, entries: dict[str, dict[str, Any]]) -> Path:
+    """
+    dest_dir/assets.json에 트랙 항목 병합 (키 = {track}/{논리 이름}, 다른 트랙 항목은 그대로).
+    항목: {url, hash, size, encodings}. 같은 트랙의 이전 hash 파일명이 바뀌면 그 파일(+ 압축본)만 삭제.
+    읽기-병합-쓰기는 assets.json.lock 잠금 안에서 (동시 게시 직렬화), 쓰기는 임시 파일 → rename.
+    """
+    dest_dir = Path(dest_dir)
+    path = dest_dir / ASSET_MANIFEST_NAME
+    track_prefix = f"/{track}/"
+    with _file_lock(dest_dir / f"{ASSET_MANIFEST_NAME}.lock"):
+        manifest = load_asset_manifest(dest_dir)
+        assets = manifest["assets"]
+        for name, entry in entries.items():
+            key = f"{track}/{name}"
+            old = assets.get(key)
+            old_url = (old or {}).get("url", "")
+            if old_url.startswith(track_prefix) and old_url not in (entry["url"], f"/{key}"):
+                stale = dest_dir / old_url.lstrip("/")
+                for stale_path in [stale, *(stale.with_name(stale.name + ext) for ext in ENCODINGS.values())]:
+                    stale_path.unlink(missing_ok=True)
+            assets[key] = entry
+        manifest["tracks"][track] = {"updated": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        _write_atomic(path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+    return path
@@ -36,11 +36,17 @@ print(f"입력: {audio_path}")
 # %%
 # Stem 분리 실행 (CPU라서 1~2분 이상 걸릴 수 있음)
 out_dir = os.path.join(project_root, 'audio_engine', 'samples', 'stems')
+# 같은 오디오(파일명 무관)·모델 설정이면 이전 분리 결과를 재사용 → 재실행 시 분리 생략
+stem_cache_dir = os.path.join(project_root, 'audio_engine', 'samples', 'cache', 'stems')
+# "flac": 16-bit 무손실 압축 stem (엔진 reader는 wav/flac 모두 읽음)
+stem_format = "wav"
 
 result = stems.separate(
     audio_path,
     out_dir=out_dir,
     model_name="htdemucs",
+    cache_dir=stem_cache_dir,
+    stem_format=stem_format,
 )
 
 print("분리 완료:")
@@ -1,6 +1,8 @@
 # %% [markdown]
 # # 04. 드럼 스템 음역대별 분류 (drum_low, drum_mid, drum_high)
-# 기존 stems/htdemucs/<track>/ 폴더에 drum_low.wav, drum_mid.wav, drum_high.wav 저장
+# 기존 stems/htdemucs/<track>/ 폴더에 drum_low, drum_mid, drum_high 저장 (STEM_FORMAT: "wav" | "flac")
+# (선택) CNN band 파이프라인은 대역 파일이 없으면 drums.wav를 메모리에서 같은 방식으로 분할해 사용.
+# 이 스크립트는 청취·시각화용 파일이 필요할 때만 실행.
 #
 
 # %%
@@ -17,28 +19,24 @@ def find_project_root():
 project_root = find_project_root()
 sys.path.insert(0, project_root)
 
-import librosa
-import soundfile as sf
-from audio_engine.engine.onset.pipeline import filter_y_into_bands
-from audio_engine.engine.onset.constants import BAND_HZ
+from audio_engine.engine.io import stem_file
+from audio_engine.engine.onset.band_split import load_drum_bands, write_band_files
 
 # %%
 stems_dir = os.path.join(project_root, 'audio_engine', 'samples', 'stems', 'htdemucs')
 track_name = "sample_animal_spirits_3_45"
-drums_path = os.path.join(stems_dir, track_name, 'drums.wav')
-if not os.path.exists(drums_path):
+# flac: 16-bit 무손실 (WAV 대비 보통 절반 이하 용량). 엔진 reader는 형식 무관
+STEM_FORMAT = "wav"
+drums_path = stem_file(os.path.join(stems_dir, track_name), 'drums')
+if not drums_path.exists():
     track_name = "sample_animal_spirits"
-    drums_path = os.path.join(stems_dir, track_name, 'drums.wav')
-assert os.path.exists(drums_path), f"drums.wav 없음: {drums_path}"
-stem_dir = os.path.dirname(drums_path)
+    drums_path = stem_file(os.path.join(stems_dir, track_name), 'drums')
+assert drums_path.exists(), f"drums stem 없음: {drums_path}"
+stem_dir = drums_path.parent
 
 # %%
-y, sr = librosa.load(drums_path, sr=None, mono=True)
-y_low, y_mid, y_high = filter_y_into_bands(y, sr, BAND_HZ)
-
-for name, seg in [("drum_low", y_low), ("drum_mid", y_mid), ("drum_high", y_high)]:
-    out_path = os.path.join(stem_dir, f"{name}.wav")
-    sf.write(out_path, seg, sr)
+bands = load_drum_bands(drums_path)
+for out_path in write_band_files(bands, stem_dir, STEM_FORMAT).values():
     print(f"저장: {out_path}")
 
 print("완료.")
@@ -2,6 +2,8 @@
 10. madmom CNN 기반 드럼 low/mid/high stem별 onset 포인트 → 막대그래프용 JSON
 stem 폴더명만 지정. stems/htdemucs/{STEM_FOLDER_NAME}/ 에서
 drum_low.wav, drum_mid.wav, drum_high.wav 사용.
+drums stem 스펙트로그램 타일(.spec)도 함께 저장 → 뷰어 대역 행 배경.
+출력은 artifact 저장소(samples/cache/artifacts)에 트랙별로 기록하고 web/public/{트랙}/에 링크로 게시.
 """
 import sys
 import os
@@ -21,10 +23,11 @@ def find_project_root():
 project_root = find_project_root()
 sys.path.insert(0, project_root)
 
-from audio_engine.engine.onset import (
-    compute_cnn_band_onsets,
-    write_drum_band_energy_json,
-)
+import json
+
+from audio_engine.engine.artifact_store import store_outputs
+from audio_engine.engine.extract_stages import write_cnn_band_onsets
+from audio_engine.engine.web_assets import available_encodings
 
 # 폴더명만 지정 (stems/htdemucs/{STEM_FOLDER_NAME}/ 아래 drum_low/mid/high.wav 필요)
 STEM_FOLDER_NAME = "sample_animal_spirits_3_45"
@@ -36,13 +39,33 @@ stems_base_dir = os.path.join(
     "stems",
     "htdemucs",
 )
+# CNN activation 캐시 (stem 내용이 같으면 threshold·floor·merge 튜닝 시 추론 생략)
+activation_cache_dir = os.path.join(project_root, "audio_engine", "samples", "cache", "activations")
+# 출력 content-addressed 저장소 (같은 내용이면 다시 쓰지 않음, web/public/{트랙}/은 링크 + .gz/.br·hash 파일명으로 게시)
+artifact_store_dir = os.path.join(project_root, "audio_engine", "samples", "cache", "artifacts")
+web_public_dir = os.path.join(project_root, "web", "public")
+samples_dir = os.path.join(project_root, "audio_engine", "samples")
 
-result = compute_cnn_band_onsets(STEM_FOLDER_NAME, stems_base_dir)
+# 10단계 처리는 extract_stages와 공유 (CLI: python -m audio_engine.scripts.extract)
+outputs = write_cnn_band_onsets(
+    os.path.join(stems_base_dir, STEM_FOLDER_NAME), samples_dir, cache_dir=activation_cache_dir
+)
+json_path = outputs["json"]
+with open(json_path, encoding="utf-8") as f:
+    result = json.load(f)
 bands = result["bands"]
 print(f"폴더: {STEM_FOLDER_NAME} (CNN)")
 print(f"duration: {result['duration_sec']}s, Low: {len(bands['low'])} Mid: {len(bands['mid'])} High: {len(bands['high'])} onset")
+print(f"  스펙트로그램 타일: {outputs['spec']}")
 
-samples_dir = os.path.join(project_root, "audio_engine", "samples")
-json_path = os.path.join(samples_dir, "cnn_band_onsets.json")
-write_drum_band_energy_json(result, json_path, project_root=project_root)
+status = store_outputs(
+    artifact_store_dir,
+    STEM_FOLDER_NAME,
+    [json_path, outputs["spec"]],
+    publish_dir=web_public_dir if os.path.isdir(web_public_dir) else None,
+    encodings=available_encodings(),
+    hashed_names=True,
+)
+changed = [name for name, st in status.items() if st != "unchanged"]
+print(f"  artifact 저장소: {len(status)}개 중 변경 {len(changed)}개 ({artifact_store_dir})")
 print(f"저장 완료: {json_path}")
@@ -1,6 +1,8 @@
 """
 11. CNN + ODF 기반 스트림·레이어(P0/P1/P2)·섹션
 compute_cnn_band_onsets_with_odf → build_streams → assign_layer_to_streams → segment_sections
+이벤트는 LOD 피라미드(streams_sections_cnn.lod/)로도 저장 → 뷰어는 보이는 타일만 로드.
+drums stem 파형 피크(.peaks)도 함께 저장 → 뷰어는 오디오 디코드 없이 파형 표시.
 """
 import sys
 import os
@@ -20,14 +22,11 @@ def find_project_root():
 project_root = find_project_root()
 sys.path.insert(0, project_root)
 
-from audio_engine.engine.onset import (
-    compute_cnn_band_onsets_with_odf,
-    build_streams,
-    simplify_shaker_clap_streams,
-    segment_sections,
-    assign_layer_to_streams,
-    write_streams_sections_json,
-)
+import json
+
+from audio_engine.engine.artifact_store import store_outputs
+from audio_engine.engine.extract_stages import write_streams_layers
+from audio_engine.engine.web_assets import available_encodings
 
 STEM_FOLDER_NAME = "sample_animal_spirits_3_45"
 stems_base_dir = os.path.join(
@@ -37,95 +36,37 @@ stems_base_dir = os.path.join(
     "stems",
     "htdemucs",
 )
+# CNN·ODF activation 캐시 (stem 내용이 같으면 threshold·floor·merge 튜닝 시 추론 생략)
+activation_cache_dir = os.path.join(project_root, "audio_engine", "samples", "cache", "activations")
+# 출력 content-addressed 저장소 (같은 내용이면 다시 쓰지 않음, web/public/{트랙}/은 링크 + .gz/.br·hash 파일명으로 게시)
+artifact_store_dir = os.path.join(project_root, "audio_engine", "samples", "cache", "artifacts")
+web_public_dir = os.path.join(project_root, "web", "public")
+samples_dir = os.path.join(project_root, "audio_engine", "samples")
 
-
-def extract_keypoints(streams: list[dict], sections: list[dict]) -> list[dict]:
-    """섹션 경계 + 스트림 accent 시점을 키포인트로 추출."""
-    keypoints = []
-    seen = set()
-    for sec in sections:
-        t_start = round(float(sec.get("start", 0)), 4)
-        t_end = round(float(sec.get("end", 0)), 4)
-        sid = sec.get("id", 0)
-        if t_start not in seen:
-            seen.add(t_start)
-            keypoints.append({
-                "time": t_start,
-                "type": "section_boundary",
-                "section_id": sid,
-                "label": "섹션 시작",
-            })
-        if t_end not in seen:
-            seen.add(t_end)
-            keypoints.append({
-                "time": t_end,
-                "type": "section_boundary",
-                "section_id": sid,
-                "label": "섹션 끝",
-            })
-    for s in streams:
-        stream_id = s.get("id", "")
-        for t in s.get("accents") or []:
-            t = round(float(t), 4)
-            if t not in seen:
-                seen.add(t)
-                keypoints.append({
-                    "time": t,
-                    "type": "accent",
-                    "stream_id": stream_id,
-                    "label": "accent",
-                })
-    keypoints.sort(key=lambda x: x["time"])
-    return keypoints
-
-
-LAYER_COLORS = {"P0": "#2ecc71", "P1": "#f39c12", "P2": "#3498db"}
-
-band_onsets, band_strengths, duration, sr = compute_cnn_band_onsets_with_odf(
-    STEM_FOLDER_NAME, stems_base_dir
+# 11단계 처리(스트림·레이어·섹션·키포인트·LOD·피크)는 extract_stages와 공유 (CLI: python -m audio_engine.scripts.extract)
+outputs = write_streams_layers(
+    os.path.join(stems_base_dir, STEM_FOLDER_NAME), samples_dir, cache_dir=activation_cache_dir
 )
+json_path = outputs["json"]
+with open(json_path, encoding="utf-8") as f:
+    doc = json.load(f)
 print(f"폴더: {STEM_FOLDER_NAME} (CNN+ODF)")
-print(f"duration: {duration:.2f}s, sr: {sr}")
-
-streams = build_streams(band_onsets, band_strengths)
-simplify_shaker_clap_streams(streams)
-layer_map = assign_layer_to_streams(streams)
-for s in streams:
-    s["layer"] = layer_map.get(s["id"], "P2")
-sections = segment_sections(streams, duration)
-keypoints = extract_keypoints(streams, sections)
-print(f"스트림: {len(streams)}개, 섹션: {len(sections)}개, 키포인트: {len(keypoints)}개")
-
-events_out = []
-for s in streams:
-    layer = s.get("layer", "P2")
-    evs = s.get("events") or []
-    str_list = s.get("strengths") or []
-    for i, t in enumerate(evs):
-        str_val = float(str_list[i]) if i < len(str_list) else s.get("strength_median", 0)
-        events_out.append({
-            "time": round(float(t), 4),
-            "t": round(float(t), 4),
-            "band": s.get("band", ""),
-            "stream_id": s.get("id", ""),
-            "layer": layer,
-            "strength": round(float(str_val), 4),
-            "color": LAYER_COLORS.get(layer, "#5a9fd4"),
-        })
-events_out.sort(key=lambda e: e["time"])
-print(f"  이벤트: {len(events_out)}개")
+print(f"duration: {doc['duration_sec']:.2f}s, sr: {doc['sr']}")
+print(
+    f"스트림: {len(doc['streams'])}개, 섹션: {len(doc['sections'])}개, "
+    f"키포인트: {len(doc.get('keypoints') or [])}개"
+)
+print(f"  파형 피크: {outputs['peaks']} ({os.path.getsize(outputs['peaks']) / 1024:.1f} KB)")
+print(f"  LOD 피라미드: {outputs['lod']} (JSON 이벤트 포함: {'events' in doc})")
 
-samples_dir = os.path.join(project_root, "audio_engine", "samples")
-json_path = os.path.join(samples_dir, "streams_sections_cnn.json")
-write_streams_sections_json(
-    json_path,
-    source=STEM_FOLDER_NAME,
-    sr=sr,
-    duration_sec=duration,
-    streams=streams,
-    sections=sections,
-    keypoints=keypoints,
-    project_root=project_root,
-    events=events_out,
+status = store_outputs(
+    artifact_store_dir,
+    STEM_FOLDER_NAME,
+    [json_path, outputs["lod"], outputs["peaks"]],
+    publish_dir=web_public_dir if os.path.isdir(web_public_dir) else None,
+    encodings=available_encodings(),
+    hashed_names=True,
 )
+changed = [name for name, st in status.items() if st != "unchanged"]
+print(f"  artifact 저장소: {len(status)}개 중 변경 {len(changed)}개 ({artifact_store_dir})")
 print(f"저장 완료: {json_path}")
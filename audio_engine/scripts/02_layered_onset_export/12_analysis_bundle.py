@@ -0,0 +1,117 @@
+"""
+12. 분석 번들 (01~07 출력을 트랙당 파일 1개로)
+컨텍스트 1회 생성 → energy·clarity·temporal·spectral·context·layered + streams_sections 섹션 → .oab 저장.
+공통 이벤트 열(index·time·frame·strength)은 한 번만 기록. 웹은 번들 1개를 받아 필요한 섹션만 디코드.
+출력은 artifact 저장소(samples/cache/artifacts)에 트랙별로 기록하고 web/public/{트랙}/에 링크로 게시.
+"""
+import sys
+import os
+import time
+
+
+def find_project_root():
+    cwd = os.path.abspath(os.getcwd())
+    while cwd:
+        if os.path.isdir(os.path.join(cwd, "audio_engine")) and os.path.isdir(
+            os.path.join(cwd, "web")
+        ):
+            return cwd
+        cwd = os.path.dirname(cwd)
+    return os.path.abspath(os.path.join(os.path.dirname(os.getcwd()), "..", ".."))
+
+
+project_root = find_project_root()
+sys.path.insert(0, project_root)
+
+from audio_engine.engine.artifact_store import store_outputs
+from audio_engine.engine.web_assets import available_encodings
+from audio_engine.engine.io import stem_file
+from audio_engine.engine.onset import (
+    build_context_with_band_evidence,
+    build_streams,
+    segment_sections,
+)
+from audio_engine.engine.onset.bundle import (
+    build_feature_sections,
+    read_bundle_index,
+    write_analysis_bundle,
+)
+from audio_engine.engine.onset.export import build_streams_sections_doc
+from audio_engine.engine.onset.waveform_peaks import write_waveform_peaks
+
+
+def extract_keypoints(streams: list[dict], sections: list[dict]) -> list[dict]:
+    """섹션 경계 + 스트림 accent 시점을 키포인트로 추출 (07과 동일)."""
+    keypoints = []
+    seen = set()
+    for sec in sections:
+        sid = sec.get("id", 0)
+        for t, label in ((sec.get("start", 0), "섹션 시작"), (sec.get("end", 0), "섹션 끝")):
+            t = round(float(t), 4)
+            if t not in seen:
+                seen.add(t)
+                keypoints.append({"time": t, "type": "section_boundary", "section_id": sid, "label": label})
+    for s in streams:
+        for t in s.get("accents") or []:
+            t = round(float(t), 4)
+            if t not in seen:
+                seen.add(t)
+                keypoints.append({"time": t, "type": "accent", "stream_id": s.get("id", ""), "label": "accent"})
+    keypoints.sort(key=lambda x: x["time"])
+    return keypoints
+
+
+# %%
+track_name = "sample_animal_spirits_3_45"
+audio_path = stem_file(os.path.join(project_root, "audio_engine", "samples", "stems", "htdemucs", track_name), "drums")
+if not audio_path.exists():
+    audio_path = os.path.join(project_root, "audio_engine", "samples", "sample_animal_spirits.mp3")
+source = os.path.basename(audio_path)
+# 출력 content-addressed 저장소 (같은 내용이면 다시 쓰지 않음, web/public/{트랙}/은 링크 + .gz/.br·hash 파일명으로 게시)
+artifact_store_dir = os.path.join(project_root, "audio_engine", "samples", "cache", "artifacts")
+web_public_dir = os.path.join(project_root, "web", "public")
+
+start = time.perf_counter()
+ctx = build_context_with_band_evidence(str(audio_path), include_temporal=True)
+print(f"파일: {source}, 길이: {ctx.duration:.2f} 초, 이벤트: {ctx.n_events}")
+
+# %%
+# 파형 피크: 컨텍스트가 이미 디코드한 ctx.y 재사용 (웹은 오디오 디코드 없이 파형 표시)
+peaks_path = write_waveform_peaks(
+    ctx.y, ctx.sr, os.path.join(project_root, "audio_engine", "samples", f"{track_name}.peaks")
+)
+print(f"파형 피크: {peaks_path} ({os.path.getsize(peaks_path) / 1024:.1f} KB)")
+
+# %%
+sections = build_feature_sections(ctx, source)
+if ctx.band_onset_times is not None:
+    streams = build_streams(ctx.band_onset_times, ctx.band_onset_strengths)
+    parts = segment_sections(streams, ctx.duration)
+    sections["streams_sections"] = build_streams_sections_doc(
+        source,
+        ctx.sr,
+        ctx.duration,
+        streams,
+        parts,
+        extract_keypoints(streams, parts),
+        events=sections["layered"]["events"],
+        waveform_peaks=os.path.basename(peaks_path),  # 번들 기준 상대 경로 (web/public/{track}/)
+    )
+
+# %%
+bundle_path = os.path.join(project_root, "audio_engine", "samples", f"{track_name}.oab")
+bundle_path = write_analysis_bundle(bundle_path, ctx, sections, source=source)
+index = read_bundle_index(bundle_path)
+print(f"저장 완료: {bundle_path} ({os.path.getsize(bundle_path) / 1024:.1f} KB, {time.perf_counter() - start:.1f}s)")
+for name, entry in index["sections"].items():
+    print(f"  {name}: {entry['length'] / 1024:.1f} KB")
+status = store_outputs(
+    artifact_store_dir,
+    track_name,
+    [bundle_path, peaks_path],
+    publish_dir=web_public_dir if os.path.isdir(web_public_dir) else None,
+    encodings=available_encodings(),
+    hashed_names=True,
+)
+changed = [name for name, st in status.items() if st != "unchanged"]
+print(f"  artifact 저장소: {len(status)}개 중 변경 {len(changed)}개 ({artifact_store_dir})")
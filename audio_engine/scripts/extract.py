@@ -1,3 +1,111 @@
 """
 CLI 엔트리 포인트 - 키포인트 추출 실행
+
+번호 스크립트(02 → 04 → 10 → 11)를 단계 DAG로 한 번에 실행. 단계 키(입력 hash + 설정 + onset 상수)가
+지난 실행과 같으면 그 단계는 생략 → 상수만 바꾸면 분석 단계만, 오디오가 같으면 분리는 생략.
+
+    python -m audio_engine.scripts.extract samples/sample_animal_spirits_3_45.wav
+    python -m audio_engine.scripts.extract track.wav --stages streams_layers --force streams_layers
+    python -m audio_engine.scripts.extract track.wav --dry-run
 """
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from audio_engine.engine.extract_stages import WEB_PUBLIC_DIR, ExtractConfig, extract_stages, publish_outputs
+from audio_engine.engine.io import STEM_FORMATS
+from audio_engine.engine.onset.warmup import warm_process
+from audio_engine.engine.stage_graph import StageResult, run_stages
+from audio_engine.engine.stems import SEPARATION_BACKENDS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    stage_names = [s.name for s in extract_stages()]
+    p = argparse.ArgumentParser(description="오디오 → stem 분리 → 대역 분할 → CNN onset·스트림/레이어 JSON (단계 캐시)")
+    p.add_argument("audio", type=Path, help="입력 오디오 (wav, mp3, flac 등)")
+    p.add_argument("--track", help="트랙 이름 (기본: 파일명). stem 폴더·출력·캐시 기록 이름")
+    p.add_argument("--stages", nargs="+", choices=stage_names, help="실행할 단계 (의존 단계 포함). 기본 전체")
+    p.add_argument("--force", nargs="+", default=[], choices=stage_names, help="캐시와 무관하게 다시 실행할 단계")
+    p.add_argument("--dry-run", action="store_true", help="실행하지 않고 단계별 캐시 상태만 출력")
+    add_config_arguments(p)
+    p.add_argument("--workers", type=int, default=None, help="대역별 CNN 워커 프로세스 수 (2 이상이면 병렬)")
+    p.add_argument("--out-dir", type=Path, help="출력 폴더 (기본 samples/cache/outputs/{track})")
+    p.add_argument("--no-publish", action="store_true", help="web/public에 게시하지 않음 (artifact 저장소에는 기록)")
+    return p
+
+
+def add_config_arguments(p: argparse.ArgumentParser) -> None:
+    """트랙 공통 추출 설정 인자 (extract_batch와 공유)."""
+    p.add_argument("--backend", default="demucs", choices=sorted(SEPARATION_BACKENDS), help="stem 분리 backend")
+    p.add_argument("--model", default="htdemucs", help="Demucs 모델 이름 (backend=demucs)")
+    p.add_argument("--stem-format", default="wav", choices=sorted(STEM_FORMATS))
+    p.add_argument("--cnn-runtime", default=None, choices=("madmom", "numpy"), help="기본 constants.CNN_RUNTIME")
+
+
+def config_kwargs(args: argparse.Namespace) -> dict:
+    """add_config_arguments 인자 → ExtractConfig.from_audio kwargs."""
+    kwargs = {"backend": args.backend, "model_name": args.model, "stem_format": args.stem_format}
+    if args.cnn_runtime:
+        kwargs["cnn_runtime"] = args.cnn_runtime
+    return kwargs
+
+
+def config_from_args(args: argparse.Namespace) -> ExtractConfig:
+    kwargs = {**config_kwargs(args), "max_workers": args.workers}
+    if args.out_dir:
+        kwargs["out_dir"] = args.out_dir.resolve()
+    return ExtractConfig.from_audio(args.audio, track=args.track, **kwargs)
+
+
+def print_stage(result: StageResult) -> None:
+    label = {"ran": f"실행 {result.wall_sec:.1f}s", "cached": "캐시", "skipped": "실행 예정"}[result.status]
+    print(f"  {result.name:<16} {label}")
+
+
+def print_warmup(status: dict | None) -> None:
+    """warm_process 결과 1줄 (None = librosa 없음, 캐시 경로만 설정)."""
+    if status is None:
+        print("워밍업: librosa 없음 (Numba 캐시 경로만 설정)")
+        return
+    cache = status["numba_cache"]
+    note = "" if cache["effective"] else f" (미적용: {', '.join(cache['imported_before'])} 먼저 import됨)"
+    print(f"워밍업: {status['total_sec']:.1f}s, Numba 캐시 {cache['cache_dir']}{note}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.audio.exists():
+        print(f"오디오 파일 없음: {args.audio}", file=sys.stderr)
+        return 1
+    cfg = config_from_args(args)
+    print(f"트랙: {cfg.track} ({cfg.audio_path})")
+    if not args.dry_run:
+        print_warmup(warm_process())
+    results = run_stages(
+        extract_stages(),
+        cfg,
+        cfg.track,
+        cfg.stage_state_dir,
+        targets=args.stages,
+        force=args.force,
+        dry_run=args.dry_run,
+        on_stage=print_stage,
+    )
+    if args.dry_run:
+        return 0
+    publish_dir = None if args.no_publish or not WEB_PUBLIC_DIR.is_dir() else WEB_PUBLIC_DIR
+    status = publish_outputs(cfg, results, publish_dir=publish_dir)
+    if status:
+        changed = [name for name, st in status.items() if st != "unchanged"]
+        print(f"  artifact 저장소: {len(status)}개 중 변경 {len(changed)}개 ({cfg.artifact_store_dir})")
+    print(f"출력: {cfg.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+일괄 추출 CLI - 카탈로그(glob·디렉터리·manifest)의 트랙마다 extract와 같은 단계 DAG 실행
+
+단계별 프로세스 풀·동시 실행 수(--jobs), 단계 기록 = 체크포인트 → 중단 후 같은 명령으로 재개.
+진행 기록: samples/cache/batch/{name}.json (트랙별 단계 상태·오류·처리량).
+
+    python -m audio_engine.scripts.extract_batch "music/**/*.flac"
+    python -m audio_engine.scripts.extract_batch catalog.json --jobs separate=1 cnn_band_onsets=4
+    python -m audio_engine.scripts.extract_batch music/ --stages band_split --backend bandsplit
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from audio_engine.engine.batch import DEFAULT_STAGE_CONCURRENCY, load_catalog, run_batch
+from audio_engine.engine.extract_stages import CACHE_DIR, WEB_PUBLIC_DIR, extract_stages
+from audio_engine.engine.onset.warmup import warm_process
+from audio_engine.engine.stage_graph import StageResult
+from audio_engine.scripts.extract import add_config_arguments, config_kwargs, print_warmup
+
+
+def parse_jobs(values: list[str], stage_names: list[str]) -> dict[str, int]:
+    """["separate=1", "cnn_band_onsets=4"] → {단계: 수}."""
+    jobs = {}
+    for value in values:
+        name, sep, n = value.partition("=")
+        if not sep or name not in stage_names or not n.isdigit() or int(n) < 1:
+            raise argparse.ArgumentTypeError(f"--jobs 형식: 단계=수 (단계: {', '.join(stage_names)}), 받은 값: {value}")
+        jobs[name] = int(n)
+    return jobs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    stage_names = [s.name for s in extract_stages()]
+    defaults = " ".join(f"{k}={v}" for k, v in DEFAULT_STAGE_CONCURRENCY.items())
+    p = argparse.ArgumentParser(description="카탈로그 일괄 추출 (단계별 프로세스 풀, 체크포인트·재개, 처리량 보고)")
+    p.add_argument("sources", nargs="+", help="오디오 파일·디렉터리·glob(따옴표로)·manifest(.json/.txt)")
+    p.add_argument("--jobs", nargs="+", default=[], metavar="STAGE=N", help=f"단계별 동시 실행 수 (기본 {defaults})")
+    p.add_argument("--stages", nargs="+", choices=stage_names, help="실행할 단계 (의존 단계 포함). 기본 전체")
+    p.add_argument("--force", nargs="+", default=[], choices=stage_names, help="모든 트랙에서 다시 실행할 단계")
+    p.add_argument("--name", default="batch", help="진행 기록 이름 (samples/cache/batch/{name}.json)")
+    p.add_argument("--publish", action="store_true", help="트랙마다 web/public/{track}/에 게시 (기본: artifact 저장소에만)")
+    add_config_arguments(p)
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        jobs = parse_jobs(args.jobs, [s.name for s in extract_stages()])
+        entries = load_catalog(args.sources)
+    except (argparse.ArgumentTypeError, FileNotFoundError, ValueError) as exc:
+        parser.error(str(exc))
+    if not entries:
+        parser.error("카탈로그에 오디오 파일이 없습니다")
+    journal_path = CACHE_DIR / "batch" / f"{args.name}.json"
+    print(f"트랙 {len(entries)}개, 진행 기록: {journal_path}")
+    # 캐시 경로(환경 변수)는 단계 풀 워커에 상속, 워커는 initializer에서 단계별로 다시 워밍업
+    print_warmup(warm_process())
+
+    def on_event(track: str, stage: str, result: StageResult | None, error: str | None) -> None:
+        if error is not None:
+            print(f"  [실패] {track}: {error}")
+        elif result.status == "ran":
+            print(f"  {track}: {stage} 실행 {result.wall_sec:.1f}s")
+        else:
+            print(f"  {track}: {stage} 캐시")
+
+    stats = run_batch(
+        entries,
+        config_kwargs=config_kwargs(args),
+        concurrency=jobs,
+        targets=args.stages,
+        force=args.force,
+        journal_path=journal_path,
+        publish_dir=WEB_PUBLIC_DIR if args.publish and WEB_PUBLIC_DIR.is_dir() else None,
+        on_event=on_event,
+    )
+    print(
+        f"완료: 처리 {stats.processed} / 캐시 {stats.cached} / 실패 {stats.failed}, "
+        f"{stats.wall_sec / 60:.1f}분"
+    )
+    print(
+        f"처리량: {stats.tracks_per_hour:.1f} tracks/hour, "
+        f"{stats.audio_hours_per_hour:.2f} audio-hours/hour (오디오 {stats.audio_sec / 3600:.2f}시간)"
+    )
+    busy = ", ".join(f"{name} {sec:.0f}s" for name, sec in stats.stage_sec.items())
+    print(f"단계별 실행 시간 합: {busy}")
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""bandsplit backend로 stems.separate 2회: 두 번째는 stem 캐시 hit, stem 바이트 동일."""
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("soundfile")
+pytest.importorskip("librosa")
+
+from audio_engine.engine import stems  # noqa: E402
+
+
+def _write_wav(path, sr=44100, duration_sec=1.0):
+    t = np.arange(int(sr * duration_sec)) / sr
+    left = 0.3 * np.sin(2 * np.pi * 80 * t) + 0.1 * np.sin(2 * np.pi * 6000 * t)
+    right = 0.3 * np.sin(2 * np.pi * 440 * t)
+    pcm = (np.stack([left, right], axis=1) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(sr)
+        f.writeframes(pcm.tobytes())
+
+
+def test_bandsplit_second_call_hits_cache(tmp_path):
+    audio = tmp_path / "clip.wav"
+    _write_wav(audio)
+    cache_dir = tmp_path / "cache"
+    stats = stems.get_separation_worker("bandsplit").stats
+
+    tracks_before, hits_before = stats.tracks, stats.cache_hits
+    first = stems.separate(str(audio), out_dir=str(tmp_path / "a"), backend="bandsplit", cache_dir=str(cache_dir))
+    first_bytes = {name: open(path, "rb").read() for name, path in first.items()}
+    assert (stats.tracks, stats.cache_hits) == (tracks_before + 1, hits_before)
+
+    second = stems.separate(str(audio), out_dir=str(tmp_path / "b"), backend="bandsplit", cache_dir=str(cache_dir))
+    assert (stats.tracks, stats.cache_hits) == (tracks_before + 1, hits_before + 1)
+
+    assert set(second) == set(first) == {"vocals", "drums", "bass", "other"}
+    for name, path in second.items():
+        assert open(path, "rb").read() == first_bytes[name]
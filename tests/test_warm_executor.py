@@ -0,0 +1,29 @@
+"""get_warm_executor 풀이 깨진 뒤(워커 비정상 종료) 다음 호출이 새 풀로 성공하는지."""
+import multiprocessing
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from audio_engine.engine.onset import madmom_processors
+
+
+@pytest.fixture
+def no_madmom_warmup(monkeypatch):
+    # 워커 initializer의 madmom 프로세서 로드를 생략 (fork 워커는 부모의 패치를 그대로 물려받음)
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("fork 시작 방식에서만 initializer 패치가 워커에 적용됨")
+    monkeypatch.setattr(madmom_processors, "warm_processors", lambda *args, **kwargs: None)
+    yield
+    madmom_processors.shutdown_warm_executors()
+
+
+def test_broken_pool_is_replaced(no_madmom_warmup):
+    broken = madmom_processors.get_warm_executor(2)
+    with pytest.raises(BrokenProcessPool):
+        madmom_processors.run_on_warm_executor({"low": (os._exit, (1,))}, 2)
+
+    result = madmom_processors.run_on_warm_executor({"low": (abs, (-3,)), "high": (abs, (4,))}, 2)
+
+    assert result == {"low": 3, "high": 4}
+    assert madmom_processors.get_warm_executor(2) is not broken
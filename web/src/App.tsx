@@ -62,6 +62,7 @@ function App() {
   const [streamsSectionsData, setStreamsSectionsData] = useState<StreamsSectionsData | null>(null);
   const [tabStreamsSectionsData, setTabStreamsSectionsData] = useState<Partial<Record<TabId, StreamsSectionsData | null>>>({});
   const [tabDrumBandData, setTabDrumBandData] = useState<Partial<Record<TabId, DrumBandEnergyJsonData | null>>>({});
+  const [tabPeaksUrl, setTabPeaksUrl] = useState<Partial<Record<TabId, string | null>>>({});
 
   const handleJsonLoaded = useCallback(
     (newEvents: EventPoint[]) => {
@@ -127,6 +128,13 @@ function App() {
     [activeTab]
   );
 
+  const handleWaveformPeaksLoaded = useCallback(
+    (url: string | null) => {
+      setTabPeaksUrl((prev) => ({ ...prev, [activeTab]: url }));
+    },
+    [activeTab]
+  );
+
   const toggleLayer = useCallback(
     (layer: string) => {
       setTabVisibleLayers((prev) => {
@@ -209,6 +217,7 @@ function App() {
                   onContextLoaded={tab.id === "08" ? handleContextLoaded : undefined}
                   onDrumBandEnergyLoaded={tab.id === "04c" || tab.id === "10" || tab.id === "11" ? handleDrumBandEnergyLoaded : undefined}
                   onStreamsSectionsLoaded={tab.id === "12" ? handleStreamsSectionsLoadedForTab : undefined}
+                  onWaveformPeaksLoaded={handleWaveformPeaksLoaded}
                   samplePath={tab.samplePath}
                   sampleLabel={`${tab.label} 샘플 로드`}
                 />
@@ -276,6 +285,7 @@ function App() {
                       audioUrl={audioUrl}
                       events={tabEvents[tab.id] ?? []}
                       visibleLayers={tabVisibleLayers[tab.id] ?? new Set()}
+                      peaksUrl={tabPeaksUrl[tab.id]}
                     />
                     <div className="filter-section">
                       {(tabEvents[tab.id] ?? []).length > 0 && (
@@ -1,7 +1,8 @@
 import { useCallback, useEffect, useRef, useState } from "react";
 import WaveSurfer from "wavesurfer.js";
 import type { DrumBandEnergyJsonData, DrumBandOnsetEvent } from "../types/drumBandEnergy";
-import { applyBandFilter, type BandId } from "../utils/bandFilter";
+import { applyBandFilter, BAND_HZ, type BandId } from "../utils/bandFilter";
+import { SpectrogramBackdrop } from "./SpectrogramBackdrop";
 
 const WAVEFORM_HEIGHT = 100;
 const DEFAULT_MIN_PX_PER_SEC = 50;
@@ -251,6 +252,8 @@ export function DrumBandEnergyBarView({
 
   const scaleX = duration > 0 ? xScale : xScaleByDuration;
   const displayDuration = duration > 0 ? duration : durationSec;
+  const chartRange: [number, number] = duration > 0 ? visibleRange : [0, durationSec];
+  const spectrogramUrl = drumBandData?.spectrogram;
 
   const renderBandRow = (
     key: "low" | "mid" | "high",
@@ -266,12 +269,21 @@ export function DrumBandEnergyBarView({
         </span>
         <div
           className="energy-bar-row-chart"
-          style={{ width: chartWidth, height: ROW_HEIGHT }}
+          style={{ width: chartWidth, height: ROW_HEIGHT, position: "relative" }}
         >
+          {spectrogramUrl && (
+            <SpectrogramBackdrop
+              manifestUrl={spectrogramUrl}
+              visibleRange={chartRange}
+              width={chartWidth}
+              height={ROW_HEIGHT}
+              freqRange={[BAND_HZ[key].highpass, BAND_HZ[key].lowpass]}
+            />
+          )}
           <svg
             width={chartWidth}
             height={ROW_HEIGHT}
-            style={{ display: "block" }}
+            style={{ display: "block", position: "relative" }}
           >
             {events.map((e, i) => {
               const x = scaleX(e.t) - BAR_WIDTH_PX / 2;
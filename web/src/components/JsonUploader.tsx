@@ -7,7 +7,10 @@ import type { SpectralJsonData } from "../types/spectralEvent";
 import type { ContextJsonData } from "../types/contextEvent";
 import type { StreamsSectionsData } from "../types/streamsSections";
 import type { DrumBandEnergyJsonData } from "../types/drumBandEnergy";
+import { parseEventPayload } from "../utils/columnarEvents";
+import { decodeAnalysisBundle, fetchAnalysisBundle, type AnalysisBundle } from "../utils/analysisBundle";
 import { parseEventsFromJson, parseEnergyJson, parseClarityJson, parseTemporalJson, parseSpectralJson, parseContextJson, parseStreamsSectionsJson, parseDrumBandEnergyJson } from "../utils/parseEvents";
+import { resolveAssetUrl, resolveDocumentRefs } from "../utils/assetManifest";
 
 interface JsonUploaderProps {
   onJsonLoaded: (events: EventPoint[]) => void;
@@ -18,6 +21,8 @@ interface JsonUploaderProps {
   onContextLoaded?: (data: ContextJsonData | null) => void;
   onStreamsSectionsLoaded?: (data: StreamsSectionsData | null) => void;
   onDrumBandEnergyLoaded?: (data: DrumBandEnergyJsonData | null) => void;
+  /** 문서의 waveform_peaks (.peaks 경로, 없으면 null) */
+  onWaveformPeaksLoaded?: (url: string | null) => void;
   samplePath: string;
   sampleLabel: string;
 }
@@ -31,7 +36,8 @@ function processLoadedData(
   onSpectralLoaded?: (data: SpectralJsonData | null) => void,
   onContextLoaded?: (data: ContextJsonData | null) => void,
   onStreamsSectionsLoaded?: (data: StreamsSectionsData | null) => void,
-  onDrumBandEnergyLoaded?: (data: DrumBandEnergyJsonData | null) => void
+  onDrumBandEnergyLoaded?: (data: DrumBandEnergyJsonData | null) => void,
+  onWaveformPeaksLoaded?: (url: string | null) => void
 ) {
   const events = parseEventsFromJson(data);
   onJsonLoaded(events);
@@ -49,6 +55,48 @@ function processLoadedData(
   onStreamsSectionsLoaded?.(streamsSections ?? null);
   const drumBandEnergy = parseDrumBandEnergyJson(data);
   onDrumBandEnergyLoaded?.(drumBandEnergy ?? null);
+  onWaveformPeaksLoaded?.(waveformPeaksUrl(data));
+}
+
+function waveformPeaksUrl(data: unknown): string | null {
+  if (!data || typeof data !== "object") return null;
+  const url = (data as Record<string, unknown>).waveform_peaks;
+  return typeof url === "string" ? url : null;
+}
+
+/**
+ * 업로드한 문서는 URL이 없음 → 상대 참조(.peaks·.lod·.spec)의 기준 URL.
+ * 문서 source = 트랙 이름 = 게시 폴더(web/public/{트랙}/), 없으면 샘플 문서 URL(같은 폴더의 다른 출력으로 간주).
+ */
+async function uploadedDocumentBase(data: unknown, samplePath: string): Promise<string> {
+  const source = data && typeof data === "object" ? (data as Record<string, unknown>).source : undefined;
+  if (typeof source === "string" && source && !source.includes("/")) return `/${encodeURIComponent(source)}/`;
+  return resolveAssetUrl(samplePath);
+}
+
+/** 분석 번들(.oab): 섹션별로 해당 파서에 전달. 이벤트 포인트는 layered(없으면 energy) 섹션 기준 */
+function processLoadedBundle(
+  bundle: AnalysisBundle,
+  onJsonLoaded: (events: EventPoint[]) => void,
+  onEnergyLoaded?: (data: EnergyJsonData | null) => void,
+  onClarityLoaded?: (data: ClarityJsonData | null) => void,
+  onTemporalLoaded?: (data: TemporalJsonData | null) => void,
+  onSpectralLoaded?: (data: SpectralJsonData | null) => void,
+  onContextLoaded?: (data: ContextJsonData | null) => void,
+  onStreamsSectionsLoaded?: (data: StreamsSectionsData | null) => void,
+  onWaveformPeaksLoaded?: (url: string | null) => void
+): number {
+  const s = bundle.sections;
+  const events = parseEventsFromJson(s.layered ?? s.energy);
+  onJsonLoaded(events);
+  onEnergyLoaded?.(parseEnergyJson(s.energy));
+  onClarityLoaded?.(parseClarityJson(s.clarity));
+  onTemporalLoaded?.(parseTemporalJson(s.temporal));
+  onSpectralLoaded?.(parseSpectralJson(s.spectral));
+  onContextLoaded?.(parseContextJson(s.context));
+  onStreamsSectionsLoaded?.(parseStreamsSectionsJson(s.streams_sections));
+  onWaveformPeaksLoaded?.(waveformPeaksUrl(s.streams_sections));
+  return events.length;
 }
 
 export function JsonUploader({
@@ -60,6 +108,7 @@ export function JsonUploader({
   onContextLoaded,
   onStreamsSectionsLoaded,
   onDrumBandEnergyLoaded,
+  onWaveformPeaksLoaded,
   samplePath,
   sampleLabel,
 }: JsonUploaderProps) {
@@ -73,30 +122,64 @@ export function JsonUploader({
     setSampleError(null);
     e.target.value = "";
     const reader = new FileReader();
-    reader.onload = () => {
+    reader.onload = async () => {
       try {
-        const data = JSON.parse(reader.result as string);
+        if (file.name.endsWith(".oab")) {
+          const bundle = decodeAnalysisBundle(reader.result as ArrayBuffer);
+          const s = bundle.sections;
+          const base = await uploadedDocumentBase(s.streams_sections, samplePath);
+          const resolved = { ...bundle, sections: { ...s, streams_sections: resolveDocumentRefs(s.streams_sections, base) } };
+          const eventCount = processLoadedBundle(resolved, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onWaveformPeaksLoaded);
+          setLoadedInfo({ source: file.name, eventCount });
+          return;
+        }
+        const parsed = parseEventPayload(reader.result as string | ArrayBuffer);
+        const data = resolveDocumentRefs(parsed, await uploadedDocumentBase(parsed, samplePath));
         const events = parseEventsFromJson(data);
-        processLoadedData(data, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onDrumBandEnergyLoaded);
+        processLoadedData(data, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onDrumBandEnergyLoaded, onWaveformPeaksLoaded);
         setLoadedInfo({ source: file.name, eventCount: events.length });
       } catch (err) {
         console.error("JSON 파싱 실패:", err);
+        setSampleError(err instanceof Error ? `업로드 실패: ${err.message}` : "업로드 실패");
         setLoadedInfo(null);
       }
     };
-    reader.readAsText(file);
+    // .evb: columnar 바이너리 컨테이너, .oab: 트랙 분석 번들 (audio_engine onset/columnar.py, bundle.py)
+    if (file.name.endsWith(".evb") || file.name.endsWith(".oab")) reader.readAsArrayBuffer(file);
+    else reader.readAsText(file);
   };
 
   const loadSample = () => {
     setSampleError(null);
-    fetch(samplePath)
-      .then((res) => {
+    if (samplePath.endsWith(".oab")) {
+      resolveAssetUrl(samplePath)
+        .then(async (url) => {
+          // 번들 안 streams_sections의 .peaks 참조는 번들 기준 상대 경로
+          const bundle = await fetchAnalysisBundle(url);
+          const s = bundle.sections;
+          return { ...bundle, sections: { ...s, streams_sections: resolveDocumentRefs(s.streams_sections, url) } };
+        })
+        .then((bundle) => {
+          const eventCount = processLoadedBundle(bundle, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onWaveformPeaksLoaded);
+          setLoadedInfo({ source: `샘플 (${samplePath.replace(/^\//, "")})`, eventCount });
+        })
+        .catch((err) => {
+          setSampleError(err instanceof Error ? err.message : "로드 실패");
+          setLoadedInfo(null);
+        });
+      return;
+    }
+    resolveAssetUrl(samplePath)
+      .then(async (url) => {
+        const res = await fetch(url);
         if (!res.ok) throw new Error("파일 없음 (해당 노트북에서 JSON 생성 후 public 복사 필요)");
-        return res.json();
+        const raw = samplePath.endsWith(".evb") ? await res.arrayBuffer() : await res.text();
+        // .peaks·.lod·.spec 참조는 문서 기준 상대 경로 (web/public/{트랙}/)
+        return resolveDocumentRefs(parseEventPayload(raw), url);
       })
       .then((data) => {
         const events = parseEventsFromJson(data);
-        processLoadedData(data, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onDrumBandEnergyLoaded);
+        processLoadedData(data, onJsonLoaded, onEnergyLoaded, onClarityLoaded, onTemporalLoaded, onSpectralLoaded, onContextLoaded, onStreamsSectionsLoaded, onDrumBandEnergyLoaded, onWaveformPeaksLoaded);
         setLoadedInfo({ source: `샘플 (${samplePath.replace(/^\//, "")})`, eventCount: events.length });
       })
       .catch((err) => {
@@ -109,7 +192,7 @@ export function JsonUploader({
     <div className="uploader">
       <input
         type="file"
-        accept=".json"
+        accept=".json,.evb,.oab"
         onChange={handleChange}
         style={{ display: "none" }}
         id={inputId}
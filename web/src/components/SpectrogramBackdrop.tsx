@@ -0,0 +1,73 @@
+import { useEffect, useState } from "react";
+import { SpectrogramTiles } from "../utils/spectrogramTiles";
+
+const BACKDROP_OPACITY = 0.45;
+
+interface SpectrogramBackdropProps {
+  /** spectrogram_tiles manifest.json URL */
+  manifestUrl: string;
+  visibleRange: [number, number];
+  width: number;
+  height: number;
+  /** 표시할 주파수 구간 [Hz, Hz] (없으면 manifest 전체) */
+  freqRange?: [number, number];
+}
+
+/** 미리 계산된 스펙트로그램 타일을 보이는 구간만 <img>로 깔아 주는 배경 (부모는 position: relative) */
+export function SpectrogramBackdrop({
+  manifestUrl,
+  visibleRange,
+  width,
+  height,
+  freqRange,
+}: SpectrogramBackdropProps) {
+  const [tiles, setTiles] = useState<SpectrogramTiles | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    setTiles(null);
+    SpectrogramTiles.load(manifestUrl)
+      .then((t) => {
+        if (!cancelled) setTiles(t);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+    };
+  }, [manifestUrl]);
+
+  if (!tiles || width <= 0 || height <= 0) return null;
+
+  const [start, end] = visibleRange;
+  const dur = Math.max(0.001, end - start);
+  const { f_min, f_max, n_freq } = tiles.manifest;
+  const [lo, hi] = freqRange ?? [f_min, f_max];
+  const rowTop = tiles.freqToRow(hi);
+  const rowBottom = tiles.freqToRow(lo);
+  if (rowBottom - rowTop <= 0) return null;
+  const yScale = height / (rowBottom - rowTop);
+
+  return (
+    <div
+      className="spectrogram-backdrop"
+      style={{ position: "absolute", inset: 0, overflow: "hidden", pointerEvents: "none", opacity: BACKDROP_OPACITY }}
+    >
+      {tiles.tilesInRange(start, end, width).map((tile) => (
+        <img
+          key={tile.url}
+          src={tile.url}
+          alt=""
+          draggable={false}
+          style={{
+            position: "absolute",
+            left: ((tile.t0 - start) / dur) * width,
+            width: ((tile.t1 - tile.t0) / dur) * width,
+            top: -rowTop * yScale,
+            height: n_freq * yScale,
+            maxWidth: "none",
+          }}
+        />
+      ))}
+    </div>
+  );
+}
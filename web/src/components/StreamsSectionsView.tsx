@@ -3,6 +3,8 @@ import WaveSurfer from "wavesurfer.js";
 import { LayerTimelineStrip } from "./LayerTimelineStrip";
 import { StreamsTimelineStrip } from "./StreamsTimelineStrip";
 import { applyBandFilter, type BandId } from "../utils/bandFilter";
+import { EventPyramid, visibleEvents } from "../utils/eventPyramid";
+import { loadWithPeaks } from "../utils/waveformPeaks";
 import type { StreamsSectionsData } from "../types/streamsSections";
 import type { EventPoint } from "../types/event";
 
@@ -15,6 +17,7 @@ const DEFAULT_MIN_PX_PER_SEC = 50;
 const ZOOM_FACTOR = 1.5;
 const MIN_ZOOM = 10;
 const MAX_ZOOM = 500;
+const NO_EVENTS: EventPoint[] = [];
 const SECTION_COLORS = ["#3498db22", "#2ecc7122", "#f39c1222", "#e74c3c22", "#9b59b622"];
 
 const LAYER_ORDER = ["P0", "P1", "P2"] as const;
@@ -66,6 +69,11 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
   const [filteredCache, setFilteredCache] = useState<Record<BandId, string>>({});
   const [filterLoading, setFilterLoading] = useState(false);
   const blobUrlsRef = useRef<string[]>([]);
+  const rowsRef = useRef<HTMLDivElement>(null);
+  const [rowsWidth, setRowsWidth] = useState(0);
+  const [pyramid, setPyramid] = useState<EventPyramid | null>(null);
+  const [pyramidError, setPyramidError] = useState<string | null>(null);
+  const [lodEvents, setLodEvents] = useState<EventPoint[]>([]);
 
   useEffect(() => {
     if (!audioUrl) return;
@@ -82,6 +90,8 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
       : filteredCache[selectedBand]
         ? filteredCache[selectedBand]
         : audioUrl;
+  // 피크는 전체 drums 기준 → 밴드 필터 오디오에는 쓰지 않음
+  const peaksUrl = selectedBand === "all" ? data?.waveform_peaks : undefined;
 
   useEffect(() => {
     if (!audioUrl) return;
@@ -129,7 +139,7 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
       normalize: true,
     });
     wavesurferRef.current = ws;
-    ws.load(effectiveAudioUrl);
+    loadWithPeaks(ws, effectiveAudioUrl, peaksUrl, DEFAULT_MIN_PX_PER_SEC).catch(() => {});
     ws.on("ready", () => {
       const d = ws.getDuration();
       setDuration(d);
@@ -154,13 +164,67 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
       ws.destroy();
       wavesurferRef.current = null;
     };
-  }, [effectiveAudioUrl]);
+  }, [effectiveAudioUrl, peaksUrl]);
 
-  const numStripRows = data?.events ? 1 + LAYER_ORDER.length : 0;
+  // LOD 피라미드가 있으면 보이는 타일만 로드해 그림 (긴 트랙은 JSON에 events가 없을 수 있음)
+  useEffect(() => {
+    setPyramid(null);
+    setPyramidError(null);
+    setLodEvents([]);
+    if (!data?.event_pyramid) return;
+    let cancelled = false;
+    EventPyramid.load(data.event_pyramid)
+      .then((p) => {
+        if (!cancelled) setPyramid(p);
+      })
+      .catch((err) => {
+        if (!cancelled) setPyramidError(err instanceof Error ? err.message : String(err));
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [data?.event_pyramid]);
+
+  const hasEvents = !!data?.events?.length || (pyramid?.index.n_events ?? 0) > 0;
+
+  useEffect(() => {
+    const el = rowsRef.current;
+    if (!el) return;
+    const ro = new ResizeObserver((entries) => setRowsWidth(entries[0]?.contentRect?.width ?? 0));
+    ro.observe(el);
+    return () => ro.disconnect();
+  }, [hasEvents]);
+
+  const stripVisibleRange: [number, number] =
+    duration > 0 ? visibleRange : [0, Math.max(1, data?.duration_sec ?? 1)];
+  const [rangeStart, rangeEnd] = stripVisibleRange;
+
+  useEffect(() => {
+    if (!pyramid) return;
+    let cancelled = false;
+    pyramid
+      .eventsInRange(rangeStart, rangeEnd, rowsWidth || window.innerWidth)
+      .then((evs) => {
+        if (!cancelled) setLodEvents(evs);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+    };
+  }, [pyramid, rangeStart, rangeEnd, rowsWidth]);
+
+  // 피라미드 타일은 이미 줌에 맞게 솎아져 있음. 인라인 events만 보이는 구간·픽셀 단위로 솎음
+  const baseEvents = pyramid ? lodEvents : data?.events ?? NO_EVENTS;
+  const stripEvents = useMemo(
+    () => (pyramid ? baseEvents : visibleEvents(baseEvents, [rangeStart, rangeEnd], rowsWidth)),
+    [baseEvents, pyramid, rangeStart, rangeEnd, rowsWidth]
+  );
+
+  const numStripRows = hasEvents ? 1 + LAYER_ORDER.length : 0;
   const totalStripBlockHeight = numStripRows * STRIP_ROW_HEIGHT;
 
   useEffect(() => {
-    if (!effectiveAudioUrl || !data?.events?.length || !stripBgRef.current || totalStripBlockHeight <= 0) return;
+    if (!effectiveAudioUrl || !hasEvents || !stripBgRef.current || totalStripBlockHeight <= 0) return;
 
     const el = stripBgRef.current;
     const bgWs = WaveSurfer.create({
@@ -176,7 +240,7 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
       normalize: true,
     });
     stripBgWsRef.current = bgWs;
-    bgWs.load(effectiveAudioUrl);
+    loadWithPeaks(bgWs, effectiveAudioUrl, peaksUrl, minPxPerSec).catch(() => {});
 
     const mainWs = wavesurferRef.current;
     const syncScroll = () => {
@@ -192,7 +256,7 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
       bgWs.destroy();
       stripBgWsRef.current = null;
     };
-  }, [effectiveAudioUrl, data?.events?.length, totalStripBlockHeight]);
+  }, [effectiveAudioUrl, peaksUrl, hasEvents, totalStripBlockHeight]);
 
   useEffect(() => {
     const bg = stripBgWsRef.current;
@@ -222,13 +286,15 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
 
   const eventsByLayer = useMemo(
     () =>
-      data?.events
+      hasEvents
         ? LAYER_ORDER.map((layer) => ({
             layer,
-            events: eventsForLayer(data.events!, layer),
+            events: pyramid
+              ? eventsForLayer(baseEvents, layer)
+              : visibleEvents(eventsForLayer(baseEvents, layer), [rangeStart, rangeEnd], rowsWidth),
           }))
         : [],
-    [data?.events]
+    [hasEvents, baseEvents, pyramid, rangeStart, rangeEnd, rowsWidth]
   );
 
   if (!data) {
@@ -241,8 +307,6 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
 
   const { streams, sections, keypoints, duration_sec } = data;
   const dur = duration_sec || duration || 1;
-  const stripVisibleRange: [number, number] =
-    duration > 0 ? visibleRange : [0, Math.max(1, duration_sec ?? 1)];
   const currentSection = sections.find(
     (sec) => currentTime >= sec.start && currentTime < sec.end
   ) ?? null;
@@ -253,9 +317,14 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
         <span>스트림 {streams.length}개</span>
         <span>섹션 {sections.length}개</span>
         <span>키포인트 {keypoints.length}개</span>
-        {data.events && <span>이벤트(P0/P1/P2) {data.events.length}개</span>}
+        {hasEvents && <span>이벤트(P0/P1/P2) {data.events?.length ?? pyramid?.index.n_events}개</span>}
         {data.source && <span>소스: {data.source}</span>}
       </div>
+      {pyramidError && !data.events?.length && (
+        <p className="streams-sections-warning" role="alert">
+          이벤트 LOD 피라미드({data.event_pyramid})를 불러오지 못했고 JSON에 인라인 이벤트가 없어 이벤트를 표시할 수 없습니다: {pyramidError}
+        </p>
+      )}
 
       {audioUrl && (
         <>
@@ -343,8 +412,8 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
         </div>
       )}
 
-      {data.events && data.events.length > 0 && (
-        <div className="tab09-layer-rows" style={{ marginTop: 12, position: "relative" }}>
+      {hasEvents && (
+        <div className="tab09-layer-rows" ref={rowsRef} style={{ marginTop: 12, position: "relative" }}>
           <div
             ref={stripBgRef}
             aria-hidden
@@ -360,7 +429,7 @@ export function StreamsSectionsView({ audioUrl, data }: StreamsSectionsViewProps
           <div style={{ position: "relative", zIndex: 1 }}>
             <LayerTimelineStrip
               label="포인트 (P0/P1/P2 겹침)"
-              events={data.events}
+              events={stripEvents}
               currentTime={currentTime}
               visibleRange={stripVisibleRange}
               height={STRIP_HEIGHT}
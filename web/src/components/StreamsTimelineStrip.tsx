@@ -101,7 +101,16 @@ export function StreamsTimelineStrip({
               const cy = y + ROW_HEIGHT / 2;
               const bandColor = BAND_COLORS[stream.band] ?? "#888";
               const { x: segX, w: segW } = xSpan(stream.start, stream.end);
-              const events = stream.events ?? [];
+              // 보이는 구간만, 같은 픽셀 열의 점은 하나만 (시간순 events)
+              const events: number[] = [];
+              let lastPx = -Infinity;
+              for (const t of stream.events ?? []) {
+                if (t < visibleStart || t > visibleEnd) continue;
+                const px = Math.floor(xScale(t));
+                if (px === lastPx) continue;
+                lastPx = px;
+                events.push(t);
+              }
 
               return (
                 <g key={stream.id}>
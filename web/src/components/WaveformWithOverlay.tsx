@@ -1,6 +1,8 @@
 import { useEffect, useRef, useState } from "react";
 import WaveSurfer from "wavesurfer.js";
 import type { EventPoint } from "../types/event";
+import { visibleEvents } from "../utils/eventPyramid";
+import { loadWithPeaks } from "../utils/waveformPeaks";
 
 const WAVEFORM_HEIGHT = 120;
 /** 강함/중간/약함 또는 P0/P1/P2 → y 위치 (0=top, 1=middle, 2=bottom) */
@@ -24,12 +26,15 @@ interface WaveformWithOverlayProps {
   audioUrl: string | null;
   events: EventPoint[];
   visibleLayers: Set<string>;
+  /** (선택) .peaks 경로. 있으면 오디오 디코드 없이 파형 표시 */
+  peaksUrl?: string | null;
 }
 
 export function WaveformWithOverlay({
   audioUrl,
   events,
   visibleLayers,
+  peaksUrl,
 }: WaveformWithOverlayProps) {
   const containerRef = useRef<HTMLDivElement>(null);
   const wavesurferRef = useRef<WaveSurfer | null>(null);
@@ -57,7 +62,7 @@ export function WaveformWithOverlay({
       normalize: true,
     });
 
-    ws.load(audioUrl);
+    loadWithPeaks(ws, audioUrl, peaksUrl, DEFAULT_MIN_PX_PER_SEC).catch(() => {});
 
     ws.on("ready", () => {
       const d = ws.getDuration();
@@ -95,7 +100,7 @@ export function WaveformWithOverlay({
       ws.destroy();
       wavesurferRef.current = null;
     };
-  }, [audioUrl]);
+  }, [audioUrl, peaksUrl]);
 
   // 오버레이 영역 크기 측정
   useEffect(() => {
@@ -117,6 +122,14 @@ export function WaveformWithOverlay({
       : 0;
 
   const filteredEvents = events.filter((e) => visibleLayers.has(e.layer));
+  // 레이어(높이)별로 보이는 구간 + 픽셀 열당 1개만 그림
+  const drawnEvents = Array.from(visibleLayers).flatMap((layer) =>
+    visibleEvents(
+      filteredEvents.filter((e) => e.layer === layer),
+      visibleRange,
+      overlaySize.width
+    )
+  );
 
   // 강함/중간/약함 → 높이 3단 (강함=상단, 중간=중앙, 약함=하단)
   const yFromLayer = (layer: string) => {
@@ -214,7 +227,7 @@ export function WaveformWithOverlay({
           height={overlaySize.height}
           style={{ display: "block", pointerEvents: "none" }}
         >
-          {filteredEvents.map((event, i) => (
+          {drawnEvents.map((event, i) => (
             <circle
               key={`${event.t}-${event.layer}-${i}`}
               cx={xScale(event.t)}
@@ -19,4 +19,6 @@ export interface DrumBandEnergyJsonData {
     high: DrumBandOnsetEvent[];
   };
   meta: DrumBandEnergyMeta;
+  /** 스펙트로그램 타일 manifest URL (spectrogram_tiles.py, 없으면 배경 없음) */
+  spectrogram?: string;
 }
@@ -19,6 +19,14 @@ export interface SectionItem {
   summary: Record<string, number | string>;
 }
 
+/** 계층 섹션 노드 (segment_sections_hierarchical). level 0 = 가장 큰 윈도우 */
+export interface SectionTreeNode extends SectionItem {
+  level: number;
+  window_sec: number;
+  parent_id: number | null;
+  children: SectionTreeNode[];
+}
+
 export interface KeypointItem {
   time: number;
   type: string;
@@ -36,6 +44,12 @@ export interface StreamsSectionsData {
   streams: StreamItem[];
   sections: SectionItem[];
   keypoints: KeypointItem[];
+  /** (선택) 줌 레벨별 중첩 섹션 트리 */
+  section_tree?: SectionTreeNode[];
+  /** (선택) 이벤트 LOD 피라미드 index.json 경로. events가 없으면 보이는 타일만 로드 */
+  event_pyramid?: string;
+  /** (선택) 파형 피크 .peaks 경로. 있으면 오디오 디코드 없이 파형 표시 */
+  waveform_peaks?: string;
   /** 정밀도 기반 P0/P1/P2 이벤트(roles 포함). 레이어 표시용 */
   events?: EventPoint[];
 }
@@ -0,0 +1,126 @@
+/**
+ * 트랙 분석 번들 (.oab) 리더 — audio_engine/engine/onset/bundle.py 와 같은 구조
+ *
+ * "OABN" | u32 버전 | u32 인덱스 길이 | 인덱스 JSON | 8바이트 정렬 | timeline blob | 섹션 blob...
+ * 섹션 blob = columnar .evb. 공통 열(index·time·frame·strength)은 { timeline: 이름 } 참조.
+ *
+ * fetchAnalysisBundle(url, sections)은 HTTP Range로 인덱스 + 요청 섹션만 받음 (Range 미지원 서버면 전체 1회).
+ * 섹션 문서는 기존 개별 JSON(onset_events_*.json, streams_sections.json)과 같은 행 형식 → parseEvents.ts 그대로 사용.
+ */
+import { blockColumns, decodeEventBinary, expandColumnar, type ColumnBlock } from "./columnarEvents";
+
+const BUNDLE_MAGIC = "OABN";
+const BUNDLE_VERSION = 1;
+const ALIGN = 8;
+/** 인덱스를 한 번에 받을 첫 Range 크기 (인덱스가 더 크면 한 번 더 요청) */
+const INDEX_PROBE_BYTES = 4096;
+
+interface BlobEntry {
+  offset: number;
+  length: number;
+}
+
+export interface BundleIndex {
+  source: string;
+  sr: number;
+  duration_sec: number;
+  bpm: number;
+  n_events: number;
+  timeline: BlobEntry;
+  sections: Record<string, BlobEntry>;
+}
+
+export interface AnalysisBundle {
+  index: BundleIndex;
+  /** 섹션 이름 → 행 형식 문서 (요청한 섹션만) */
+  sections: Record<string, unknown>;
+}
+
+function parseIndex(bytes: Uint8Array): { index: BundleIndex; base: number } | { needed: number } {
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+  if (magic !== BUNDLE_MAGIC) throw new Error("OABN 번들이 아닙니다");
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const version = view.getUint32(4, true);
+  if (version > BUNDLE_VERSION) throw new Error(`지원하지 않는 OABN 버전: ${version}`);
+  const indexLen = view.getUint32(8, true);
+  const start = 12 + indexLen;
+  if (bytes.byteLength < start) return { needed: start };
+  const index = JSON.parse(new TextDecoder().decode(bytes.subarray(12, start))) as BundleIndex;
+  return { index, base: start + ((ALIGN - (start % ALIGN)) % ALIGN) };
+}
+
+/** timeline 참조 열 → 실제 값 배열 */
+function resolveTimeline(doc: Record<string, unknown>, timeline: Record<string, ArrayLike<unknown>>) {
+  const block = doc.events as ColumnBlock | undefined;
+  if (!block || typeof block !== "object" || !("columns" in block)) return doc;
+  for (const [name, col] of Object.entries(block.columns)) {
+    if (col && typeof col === "object" && "timeline" in col) {
+      block.columns[name] = timeline[(col as { timeline: string }).timeline];
+    }
+  }
+  return doc;
+}
+
+/** 번들 전체(또는 필요한 blob을 담은) 바이트 → 섹션 문서 */
+function decodeSections(
+  index: BundleIndex,
+  readBlob: (entry: BlobEntry) => ArrayBuffer,
+  names: string[]
+): Record<string, unknown> {
+  const timelineDoc = decodeEventBinary(readBlob(index.timeline));
+  const timeline = blockColumns(timelineDoc.events as ColumnBlock);
+  const sections: Record<string, unknown> = {};
+  for (const name of names) {
+    const entry = index.sections[name];
+    if (!entry) continue;
+    sections[name] = expandColumnar(resolveTimeline(decodeEventBinary(readBlob(entry)), timeline));
+  }
+  return sections;
+}
+
+/** 메모리의 .oab ArrayBuffer → 번들 (sections 미지정 시 전체 섹션) */
+export function decodeAnalysisBundle(buffer: ArrayBuffer, sections?: string[]): AnalysisBundle {
+  const parsed = parseIndex(new Uint8Array(buffer));
+  if ("needed" in parsed) throw new Error("OABN 번들이 잘렸습니다");
+  const { index, base } = parsed;
+  const names = sections ?? Object.keys(index.sections);
+  const readBlob = (e: BlobEntry) => buffer.slice(base + e.offset, base + e.offset + e.length);
+  return { index, sections: decodeSections(index, readBlob, names) };
+}
+
+async function fetchRange(url: string, start: number, end: number): Promise<{ full: boolean; buffer: ArrayBuffer }> {
+  const res = await fetch(url, { headers: { Range: `bytes=${start}-${end - 1}` } });
+  if (!res.ok) throw new Error(`번들 로드 실패: ${res.status}`);
+  return { full: res.status !== 206, buffer: await res.arrayBuffer() };
+}
+
+/**
+ * URL의 번들에서 필요한 섹션만 로드.
+ * Range 지원 시: 인덱스 1회 + (timeline ~ 요청 섹션 구간) 1회. 미지원 시 첫 응답이 전체 파일.
+ */
+export async function fetchAnalysisBundle(url: string, sections?: string[]): Promise<AnalysisBundle> {
+  const probe = await fetchRange(url, 0, INDEX_PROBE_BYTES);
+  if (probe.full) return decodeAnalysisBundle(probe.buffer, sections);
+
+  let head = new Uint8Array(probe.buffer);
+  let parsed = parseIndex(head);
+  if ("needed" in parsed) {
+    const more = await fetchRange(url, 0, parsed.needed);
+    if (more.full) return decodeAnalysisBundle(more.buffer, sections);
+    head = new Uint8Array(more.buffer);
+    parsed = parseIndex(head);
+    if ("needed" in parsed) throw new Error("OABN 인덱스를 읽지 못했습니다");
+  }
+  const { index, base } = parsed;
+  const names = (sections ?? Object.keys(index.sections)).filter((n) => n in index.sections);
+  const entries = [index.timeline, ...names.map((n) => index.sections[n])];
+  const lo = Math.min(...entries.map((e) => e.offset));
+  const hi = Math.max(...entries.map((e) => e.offset + e.length));
+  const span = await fetchRange(url, base + lo, base + hi);
+  const spanStart = span.full ? 0 : base + lo;
+  const readBlob = (e: BlobEntry) => {
+    const from = base + e.offset - spanStart;
+    return span.buffer.slice(from, from + e.length);
+  };
+  return { index, sections: decodeSections(index, readBlob, names) };
+}
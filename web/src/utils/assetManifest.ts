@@ -0,0 +1,89 @@
+/**
+ * web/public/assets.json 리더 — audio_engine/engine/web_assets.py 와 같은 구조
+ *
+ * { version: 2, tracks: { 트랙: { updated } }, assets: { "{트랙}/{논리 이름}": { url, hash, size, encodings } } }
+ * url = content hash 파일명 (/{트랙}/{stem}.{hash12}{확장자}) → 내용이 바뀌면 URL이 바뀌어 브라우저 캐시를 길게 써도 됨.
+ * resolveAssetUrl("/트랙/streams_sections_cnn.peaks")는 manifest에 있으면 hash URL, 없으면 원래 URL.
+ * 트랙 없는 샘플 경로("/streams_sections_cnn.json")는 선택 트랙(?track=, 없으면 마지막으로 게시된 트랙) 기준.
+ * 문서 안 참조(waveform_peaks·event_pyramid·spectrogram)는 트랙 상대 경로 → resolveDocumentRefs로 문서 URL 기준 절대 경로.
+ */
+
+const ASSET_MANIFEST_URL = "/assets.json";
+const ASSET_MANIFEST_VERSION = 2;
+
+export interface AssetEntry {
+  url: string;
+  hash: string;
+  size: number;
+  encodings: string[];
+}
+
+interface AssetManifest {
+  tracks: Record<string, { updated: string }>;
+  assets: Record<string, AssetEntry>;
+}
+
+let manifest: Promise<AssetManifest> | null = null;
+
+/** manifest는 페이지당 1회 로드 (manifest 자체는 재검증). 이전 버전(트랙 없는 키)은 무시 */
+function loadManifest(): Promise<AssetManifest> {
+  if (!manifest) {
+    manifest = fetch(ASSET_MANIFEST_URL, { cache: "no-cache" })
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) =>
+        data && data.version === ASSET_MANIFEST_VERSION && typeof data.assets === "object"
+          ? { tracks: data.tracks ?? {}, assets: data.assets }
+          : { tracks: {}, assets: {} }
+      )
+      .catch(() => ({ tracks: {}, assets: {} }));
+  }
+  return manifest;
+}
+
+/** 선택 트랙: 페이지 URL ?track=, 없으면 가장 최근에 게시된 트랙 (없으면 null) */
+function selectedTrack(m: AssetManifest): string | null {
+  const param = new URLSearchParams(window.location.search).get("track");
+  if (param && param in m.tracks) return param;
+  let latest: string | null = null;
+  for (const [track, info] of Object.entries(m.tracks)) {
+    if (latest === null || info.updated > m.tracks[latest].updated) latest = track;
+  }
+  return latest;
+}
+
+/** 루트 기준 경로("/트랙/이름" 또는 샘플 "/이름") → 게시된 hash URL. manifest에 없으면 그대로 */
+export async function resolveAssetUrl(url: string): Promise<string> {
+  if (!url.startsWith("/")) return url;
+  const m = await loadManifest();
+  const key = url.slice(1);
+  const direct = m.assets[key];
+  if (direct) return direct.url;
+  const track = key.includes("/") ? null : selectedTrack(m);
+  const entry = track ? m.assets[`${track}/${key}`] : undefined;
+  return entry?.url ?? url;
+}
+
+/** 문서가 트랙 상대 경로로 가리키는 필드 (audio_engine extract_stages·12_analysis_bundle) */
+const DOCUMENT_REF_KEYS = ["waveform_peaks", "event_pyramid", "spectrogram"] as const;
+
+/** "streams_sections_cnn.peaks" + 문서 URL "/트랙/streams_sections_cnn.{hash}.json" → "/트랙/streams_sections_cnn.peaks" */
+export function resolveDocumentRef(ref: string, docUrl: string): string {
+  if (ref.startsWith("/") || /^[a-z][a-z0-9+.-]*:/i.test(ref)) return ref;
+  return new URL(ref, new URL(docUrl, window.location.origin)).pathname;
+}
+
+/** 문서의 상대 참조 필드를 docUrl 기준 절대 경로로 바꾼 얕은 복사본 (객체가 아니면 그대로) */
+export function resolveDocumentRefs<T>(data: T, docUrl: string): T {
+  if (!data || typeof data !== "object" || Array.isArray(data)) return data;
+  const obj = data as Record<string, unknown>;
+  let out: Record<string, unknown> | null = null;
+  for (const key of DOCUMENT_REF_KEYS) {
+    const ref = obj[key];
+    if (typeof ref !== "string") continue;
+    const resolved = resolveDocumentRef(ref, docUrl);
+    if (resolved === ref) continue;
+    out = out ?? { ...obj };
+    out[key] = resolved;
+  }
+  return (out ?? obj) as T;
+}
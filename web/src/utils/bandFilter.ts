@@ -5,7 +5,7 @@
 
 export type BandId = "low" | "mid" | "high";
 
-const BAND_HZ: Record<BandId, { highpass: number; lowpass: number }> = {
+export const BAND_HZ: Record<BandId, { highpass: number; lowpass: number }> = {
   low: { highpass: 20, lowpass: 200 },
   mid: { highpass: 200, lowpass: 3000 },
   high: { highpass: 3000, lowpass: 10000 },
@@ -0,0 +1,196 @@
+/**
+ * columnar 이벤트 형식 디코더 (audio_engine/engine/onset/columnar.py 와 같은 스키마)
+ *
+ * - columnar JSON: { format: "columnar", events: { n, keys, columns, aliases }, ... }
+ * - 바이너리 (.evb): "OEVB" | u32 버전 | u32 헤더 길이 | 헤더 JSON | 8바이트 정렬 | TypedArray 버퍼
+ *
+ * expandColumnar()는 행 형식(events: [{...}])으로 되돌림 → parseEvents.ts 파서가 형식 무관하게 동작.
+ * 숫자 열을 그대로 쓰려면 blockColumns() (TypedArray, 행 객체 생성 없음).
+ */
+
+export const COLUMNAR_FORMAT = "columnar";
+const BINARY_MAGIC = "OEVB";
+const BINARY_VERSION = 1;
+const ALIGN = 8;
+const EVENT_TABLE_KEYS = ["events", "bands"];
+
+type ColumnValues = ArrayLike<unknown>;
+
+export interface ColumnBlock {
+  n: number;
+  keys: string[];
+  columns: Record<string, unknown>;
+  aliases?: Record<string, string>;
+}
+
+interface BufferRef {
+  buf: number;
+  decimals?: number;
+  nulls?: boolean;
+  bool?: boolean;
+  int?: boolean;
+}
+
+interface BufferSpec {
+  offset: number;
+  count: number;
+  dtype: string;
+}
+
+function isObject(v: unknown): v is Record<string, unknown> {
+  return v != null && typeof v === "object" && !Array.isArray(v) && !ArrayBuffer.isView(v);
+}
+
+function isBlock(v: unknown): v is ColumnBlock {
+  return isObject(v) && "columns" in v && "keys" in v && "n" in v;
+}
+
+function isBufferRef(v: unknown): v is BufferRef {
+  return isObject(v) && typeof v.buf === "number";
+}
+
+export function isColumnarDoc(data: unknown): boolean {
+  return isObject(data) && data.format === COLUMNAR_FORMAT;
+}
+
+/** 블록의 열 하나 → 값 배열 (const·dict 펼침). absent 행 정보는 별도. */
+function columnValues(col: unknown, n: number): ColumnValues {
+  if (Array.isArray(col) || ArrayBuffer.isView(col)) return col as ColumnValues;
+  if (!isObject(col)) return new Array(n).fill(null);
+  if ("values" in col) return columnValues(col.values, n);
+  if ("const" in col) return new Array(n).fill(col.const);
+  const dict = Array.isArray(col.dict) ? col.dict : [];
+  const codes = (col.codes ?? []) as ArrayLike<number>;
+  const out = new Array(codes.length);
+  for (let i = 0; i < codes.length; i++) out[i] = dict[codes[i]];
+  return out;
+}
+
+/** 블록 → { 필드: 값 배열 } (alias 포함). 숫자 열은 바이너리에서 읽었으면 TypedArray. */
+export function blockColumns(block: ColumnBlock): Record<string, ColumnValues> {
+  const aliases = block.aliases ?? {};
+  const out: Record<string, ColumnValues> = {};
+  for (const key of block.keys) {
+    const src = aliases[key] ?? key;
+    out[key] = out[src] ?? columnValues(block.columns[src], block.n);
+  }
+  return out;
+}
+
+/** 블록 → 행 객체 배열 (키 순서·생략된 키 복원) */
+export function blockToRows(block: ColumnBlock): Record<string, unknown>[] {
+  const aliases = block.aliases ?? {};
+  const cols = blockColumns(block);
+  const absent: Record<string, Set<number>> = {};
+  for (const key of block.keys) {
+    const col = block.columns[aliases[key] ?? key];
+    absent[key] = new Set(isObject(col) && Array.isArray(col.absent) ? (col.absent as number[]) : []);
+  }
+  const rows: Record<string, unknown>[] = new Array(block.n);
+  for (let i = 0; i < block.n; i++) {
+    const row: Record<string, unknown> = {};
+    for (const key of block.keys) {
+      if (!absent[key].has(i)) row[key] = cols[key][i];
+    }
+    rows[i] = row;
+  }
+  return rows;
+}
+
+const expandedCache = new WeakMap<object, unknown>();
+
+/** columnar 문서 → 행 형식 문서. columnar가 아니면 그대로 반환 (같은 입력은 1회만 변환). */
+export function expandColumnar(data: unknown): unknown {
+  if (!isColumnarDoc(data)) return data;
+  const doc = data as Record<string, unknown>;
+  const cached = expandedCache.get(doc);
+  if (cached) return cached;
+  const out: Record<string, unknown> = {};
+  for (const [key, value] of Object.entries(doc)) {
+    if (key === "format" || key === "format_version") continue;
+    if (isBlock(value)) {
+      out[key] = blockToRows(value);
+    } else if (EVENT_TABLE_KEYS.includes(key) && isObject(value) && Object.values(value).every(isBlock)) {
+      out[key] = Object.fromEntries(
+        Object.entries(value).map(([name, block]) => [name, blockToRows(block as ColumnBlock)])
+      );
+    } else {
+      out[key] = value;
+    }
+  }
+  expandedCache.set(doc, out);
+  return out;
+}
+
+function readBuffer(buffer: ArrayBuffer, base: number, spec: BufferSpec): ArrayLike<number> {
+  const offset = base + spec.offset;
+  switch (spec.dtype) {
+    case "f4":
+      return new Float32Array(buffer, offset, spec.count);
+    case "f8":
+      return new Float64Array(buffer, offset, spec.count);
+    case "i4":
+      return new Int32Array(buffer, offset, spec.count);
+    case "u1":
+      return new Uint8Array(buffer, offset, spec.count);
+    case "u2":
+      return new Uint16Array(buffer, offset, spec.count);
+    default:
+      throw new Error(`지원하지 않는 dtype: ${spec.dtype}`);
+  }
+}
+
+/** 버퍼 + 열 메타 → JSON과 같은 값 (f4는 decimals 반올림, NaN→null, u1→boolean) */
+function resolveNumeric(raw: ArrayLike<number>, ref: BufferRef): ColumnValues {
+  if (ref.bool) return Array.from(raw, (v) => v !== 0);
+  if (ref.int) return raw;
+  let values: ArrayLike<number> = raw;
+  if (ref.decimals != null) {
+    const p = 10 ** ref.decimals;
+    const rounded = new Float64Array(raw.length);
+    for (let i = 0; i < raw.length; i++) rounded[i] = Math.round(raw[i] * p) / p;
+    values = rounded;
+  }
+  if (ref.nulls) return Array.from(values, (v) => (Number.isNaN(v) ? null : v));
+  return values;
+}
+
+/** .evb ArrayBuffer → columnar 문서 (숫자 열은 TypedArray) */
+export function decodeEventBinary(buffer: ArrayBuffer): Record<string, unknown> {
+  const bytes = new Uint8Array(buffer);
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+  if (magic !== BINARY_MAGIC) throw new Error("OEVB 컨테이너가 아닙니다");
+  const view = new DataView(buffer);
+  const version = view.getUint32(4, true);
+  if (version > BINARY_VERSION) throw new Error(`지원하지 않는 OEVB 버전: ${version}`);
+  const headLen = view.getUint32(8, true);
+  const start = 12 + headLen;
+  const header = JSON.parse(new TextDecoder().decode(bytes.subarray(12, start))) as Record<string, unknown>;
+  const base = start + ((ALIGN - (start % ALIGN)) % ALIGN);
+  const specs = (header.buffers ?? []) as BufferSpec[];
+  delete header.buffers;
+  const raw = specs.map((spec) => readBuffer(buffer, base, spec));
+
+  const unpackBlock = (block: ColumnBlock) => {
+    for (const [name, col] of Object.entries(block.columns)) {
+      if (isBufferRef(col)) {
+        block.columns[name] = resolveNumeric(raw[col.buf], col);
+      } else if (isObject(col) && isBufferRef(col.values)) {
+        block.columns[name] = { ...col, values: resolveNumeric(raw[col.values.buf], col.values) };
+      } else if (isObject(col) && isBufferRef(col.codes)) {
+        block.columns[name] = { ...col, codes: raw[col.codes.buf] };
+      }
+    }
+  };
+  for (const value of Object.values(header)) {
+    if (isBlock(value)) unpackBlock(value);
+    else if (isObject(value)) Object.values(value).filter(isBlock).forEach(unpackBlock);
+  }
+  return header;
+}
+
+/** 응답 본문(텍스트 JSON 또는 .evb ArrayBuffer) → 행 형식 문서 */
+export function parseEventPayload(raw: string | ArrayBuffer): unknown {
+  const data = typeof raw === "string" ? JSON.parse(raw) : decodeEventBinary(raw);
+  return expandColumnar(data);
+}
@@ -0,0 +1,127 @@
+/**
+ * 이벤트 LOD 피라미드 리더 — audio_engine/engine/onset/event_pyramid.py 와 같은 구조
+ *
+ * {이름}.lod/index.json + {level}/{tile}.json (columnar compact JSON).
+ * 레벨 l = 트랙을 2^l 타일로 나눔, 타일당 최대 max_per_tile개 (P0 > P1 > P2, strength 순). 마지막 레벨 = 전체.
+ *
+ * EventPyramid.eventsInRange(start, end, widthPx)는 줌에 맞는 레벨을 골라 보이는 타일만 요청 (타일은 캐시).
+ * visibleEvents()는 이미 메모리에 있는 이벤트를 보이는 구간 + 픽셀 간격으로 솎음 (피라미드 없는 뷰용).
+ */
+import type { EventPoint } from "../types/event";
+import { expandColumnar } from "./columnarEvents";
+import { normalizeEvent } from "./parseEvents";
+
+const PYRAMID_FORMAT = "event_pyramid";
+const PYRAMID_VERSION = 1;
+/** 화면 폭 대비 목표 점 간격 (px). 보이는 이벤트 수 추정치가 width / 이 값 이하인 레벨 중 가장 세밀한 것 */
+const PX_PER_EVENT = 3;
+
+export interface PyramidLevel {
+  level: number;
+  tile_sec: number;
+  n_tiles: number;
+  complete: boolean;
+  counts: number[];
+}
+
+export interface PyramidIndex {
+  format: string;
+  format_version: number;
+  source: string;
+  duration_sec: number;
+  n_events: number;
+  max_per_tile: number;
+  layer_priority: string[];
+  tile_path: string;
+  levels: PyramidLevel[];
+}
+
+export class EventPyramid {
+  readonly index: PyramidIndex;
+  private readonly baseUrl: string;
+  private readonly tiles = new Map<string, Promise<EventPoint[]>>();
+
+  private constructor(index: PyramidIndex, baseUrl: string) {
+    this.index = index;
+    this.baseUrl = baseUrl;
+  }
+
+  /** index.json URL → 피라미드 */
+  static async load(indexUrl: string): Promise<EventPyramid> {
+    const res = await fetch(indexUrl);
+    if (!res.ok) throw new Error(`피라미드 index 로드 실패: ${res.status}`);
+    const index = (await res.json()) as PyramidIndex;
+    if (index.format !== PYRAMID_FORMAT) throw new Error("event_pyramid index가 아닙니다");
+    if (index.format_version > PYRAMID_VERSION) throw new Error(`지원하지 않는 피라미드 버전: ${index.format_version}`);
+    return new EventPyramid(index, indexUrl.slice(0, indexUrl.lastIndexOf("/") + 1));
+  }
+
+  /** 보이는 구간 길이·폭(px) → 레벨. 다음 레벨의 추정 이벤트 수가 예산을 넘거나 현재 레벨이 전체면 멈춤 */
+  pickLevel(visibleSec: number, widthPx: number): PyramidLevel {
+    const { levels, max_per_tile } = this.index;
+    const budget = Math.max(1, widthPx / PX_PER_EVENT);
+    let chosen = levels[0];
+    for (const lv of levels.slice(1)) {
+      if (chosen.complete) break;
+      const tilesVisible = Math.max(1, visibleSec / lv.tile_sec);
+      if (tilesVisible * max_per_tile > budget) break;
+      chosen = lv;
+    }
+    return chosen;
+  }
+
+  private loadTile(level: number, tile: number): Promise<EventPoint[]> {
+    const key = `${level}/${tile}`;
+    let p = this.tiles.get(key);
+    if (!p) {
+      const url = this.baseUrl + this.index.tile_path.replace("{level}", String(level)).replace("{tile}", String(tile));
+      p = fetch(url)
+        .then((res) => {
+          if (!res.ok) throw new Error(`타일 로드 실패: ${res.status}`);
+          return res.json();
+        })
+        .then((data) => {
+          const doc = expandColumnar(data) as { events?: Record<string, unknown>[] };
+          return (doc.events ?? []).map(normalizeEvent);
+        });
+      p.catch(() => this.tiles.delete(key));
+      this.tiles.set(key, p);
+    }
+    return p;
+  }
+
+  /** [start, end] 구간에 보이는 타일의 이벤트 (시간순). 빈 타일은 요청하지 않음 */
+  async eventsInRange(start: number, end: number, widthPx: number): Promise<EventPoint[]> {
+    const lv = this.pickLevel(Math.max(0.001, end - start), widthPx);
+    const first = Math.max(0, Math.floor(start / lv.tile_sec));
+    const last = Math.min(lv.n_tiles - 1, Math.floor(end / lv.tile_sec));
+    const requests: Promise<EventPoint[]>[] = [];
+    for (let i = first; i <= last; i++) {
+      if (lv.counts[i] > 0) requests.push(this.loadTile(lv.level, i));
+    }
+    return (await Promise.all(requests)).flat();
+  }
+}
+
+/**
+ * 시간순 이벤트 → 보이는 구간 안, 같은 픽셀 열에 겹치는 점은 strength 큰 것 하나만.
+ * events가 시간순이 아니어도 동작 (구간 필터 후 픽셀 열 단위로 비교).
+ */
+export function visibleEvents<T extends { t: number; strength: number }>(
+  events: T[],
+  visibleRange: [number, number],
+  widthPx: number,
+  minPx = 1
+): T[] {
+  const [start, end] = visibleRange;
+  const dur = Math.max(0.001, end - start);
+  if (widthPx <= 0) return events.filter((e) => e.t >= start && e.t <= end);
+  const cols = new Map<number, T>();
+  for (const e of events) {
+    if (e.t < start || e.t > end) continue;
+    const col = Math.floor((((e.t - start) / dur) * widthPx) / minPx);
+    const prev = cols.get(col);
+    if (!prev || e.strength > prev.strength) cols.set(col, e);
+  }
+  return Array.from(cols.values()).sort((a, b) => a.t - b.t);
+}
@@ -6,11 +6,13 @@ import type { SpectralEvent, SpectralJsonData } from "../types/spectralEvent";
 import type { ContextEvent, ContextJsonData } from "../types/contextEvent";
 import type { StreamsSectionsData } from "../types/streamsSections";
 import type { DrumBandEnergyJsonData } from "../types/drumBandEnergy";
+import { expandColumnar } from "./columnarEvents";
 
 const DEFAULT_POINT_COLOR = "#5a9fd4";
 
 /** 02_clarity 형식(metadata + attack_time_ms, clarity_score) → Clarity 데이터 반환, 아니면 null */
 export function parseClarityJson(data: unknown): ClarityJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   const metaRaw = obj.metadata ?? obj.meta;
@@ -45,6 +47,7 @@ export function parseClarityJson(data: unknown): ClarityJsonData | null {
 
 /** 03_temporal 형식(metadata + grid_align_score, temporal_score) → Temporal 데이터 반환, 아니면 null */
 export function parseTemporalJson(data: unknown): TemporalJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   const metaRaw = obj.metadata ?? obj.meta;
@@ -89,6 +92,7 @@ export function parseTemporalJson(data: unknown): TemporalJsonData | null {
 
 /** 04_spectral 형식(metadata + focus_score, spectral_centroid_hz) → Spectral 데이터 반환, 아니면 null */
 export function parseSpectralJson(data: unknown): SpectralJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   const metaRaw = obj.metadata ?? obj.meta;
@@ -134,6 +138,7 @@ export function parseSpectralJson(data: unknown): SpectralJsonData | null {
 
 /** 05_context 형식(metadata + snr_db, dependency_score) → Context 데이터 반환, 아니면 null */
 export function parseContextJson(data: unknown): ContextJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   const metaRaw = obj.metadata ?? obj.meta;
@@ -177,6 +182,7 @@ export function parseContextJson(data: unknown): ContextJsonData | null {
 
 /** 04 형식(energy_rms_min 있음) → 전체 에너지 데이터 반환, 아니면 null */
 export function parseEnergyJson(data: unknown): EnergyJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   if (obj.energy_rms_min == null || !Array.isArray(obj.events)) return null;
@@ -224,8 +230,11 @@ export function parseEnergyJson(data: unknown): EnergyJsonData | null {
  * 2. onset_events.json (03_visualize_point): events[] (t, strength, texture, color, layer)
  * 3. events[] 래퍼
  * 4. 배열 직접 [{ t, strength?, color?, layer? }]
+ *
+ * columnar JSON·.evb(decodeEventBinary) 문서는 expandColumnar로 행 형식으로 펼친 뒤 같은 규칙 적용 (모든 parse* 공통).
  */
 export function parseEventsFromJson(data: unknown): EventPoint[] {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return [];
 
   const obj = data as Record<string, unknown>;
@@ -302,6 +311,7 @@ export function parseEventsFromJson(data: unknown): EventPoint[] {
 
 /** drum_band_energy.json 형식 (bands: { low, mid, high } 각각 [ { t, energy } ]) */
 export function parseDrumBandEnergyJson(data: unknown): DrumBandEnergyJsonData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   const bandsRaw = obj.bands;
@@ -329,11 +339,13 @@ export function parseDrumBandEnergyJson(data: unknown): DrumBandEnergyJsonData |
       duration_sec: Number(obj.duration_sec ?? 0),
       sr: Number(obj.sr ?? 22050),
     },
+    spectrogram: typeof obj.spectrogram === "string" ? obj.spectrogram : undefined,
   };
 }
 
 /** 07_streams_sections → streams_sections.json 형식 (events 있으면 P0/P1/P2 roles 파싱) */
 export function parseStreamsSectionsJson(data: unknown): StreamsSectionsData | null {
+  data = expandColumnar(data);
   if (!data || typeof data !== "object") return null;
   const obj = data as Record<string, unknown>;
   if (!Array.isArray(obj.streams) || !Array.isArray(obj.sections) || !Array.isArray(obj.keypoints))
@@ -348,6 +360,11 @@ export function parseStreamsSectionsJson(data: unknown): StreamsSectionsData | n
     streams: obj.streams as StreamsSectionsData["streams"],
     sections: obj.sections as StreamsSectionsData["sections"],
     keypoints: obj.keypoints as StreamsSectionsData["keypoints"],
+    section_tree: Array.isArray(obj.section_tree)
+      ? (obj.section_tree as StreamsSectionsData["section_tree"])
+      : undefined,
+    event_pyramid: typeof obj.event_pyramid === "string" ? obj.event_pyramid : undefined,
+    waveform_peaks: typeof obj.waveform_peaks === "string" ? obj.waveform_peaks : undefined,
     events,
   };
 }
@@ -375,7 +392,7 @@ function primaryFromRoles(roles: EventPoint["roles"]): string {
   return "P0";
 }
 
-function normalizeEvent(item: Record<string, unknown>): EventPoint {
+export function normalizeEvent(item: Record<string, unknown>): EventPoint {
   const t = Number(item.t ?? item.time ?? 0);
   const strength = Math.min(1, Math.max(0, Number(item.strength ?? 0.7)));
   const textureRaw = Number(item.texture);
@@ -0,0 +1,118 @@
+/**
+ * 스펙트로그램 타일 리더 — audio_engine/engine/onset/spectrogram_tiles.py 와 같은 구조
+ *
+ * {이름}.spec/manifest.json + {level}/{tile}.png (8-bit grayscale, 위쪽 = 높은 주파수).
+ * 레벨 k = frames_per_column 프레임/열, 타일 = tile_width 열. 주파수는 f_min~f_max 로그 간격 n_freq행.
+ *
+ * SpectrogramTiles.tilesInRange(start, end, widthPx)는 줌에 맞는 레벨의 보이는 타일 URL·시간 구간만 반환.
+ * freqToRow(hz)는 이미지 행 위치 (0 = 맨 위) → 대역별 크롭에 사용.
+ */
+
+const SPEC_FORMAT = "spectrogram_tiles";
+const SPEC_VERSION = 1;
+
+export interface SpectrogramLevel {
+  level: number;
+  frames_per_column: number;
+  column_sec: number;
+  n_columns: number;
+  n_tiles: number;
+}
+
+export interface SpectrogramManifest {
+  format: string;
+  format_version: number;
+  source: string;
+  sr: number;
+  n_fft: number;
+  hop_length: number;
+  duration_sec: number;
+  n_freq: number;
+  freq_scale: "log";
+  f_min: number;
+  f_max: number;
+  top_db: number;
+  tile_width: number;
+  tile_path: string;
+  levels: SpectrogramLevel[];
+}
+
+export interface SpectrogramTile {
+  url: string;
+  /** 타일 시작·끝 시간 (초) */
+  t0: number;
+  t1: number;
+  /** 타일 열 수 (마지막 타일은 tile_width보다 작을 수 있음) */
+  columns: number;
+}
+
+const manifests = new Map<string, Promise<SpectrogramTiles>>();
+
+export class SpectrogramTiles {
+  readonly manifest: SpectrogramManifest;
+  private readonly baseUrl: string;
+
+  private constructor(manifest: SpectrogramManifest, baseUrl: string) {
+    this.manifest = manifest;
+    this.baseUrl = baseUrl;
+  }
+
+  /** manifest.json URL → 타일 세트 (같은 URL은 한 번만 로드) */
+  static load(manifestUrl: string): Promise<SpectrogramTiles> {
+    let p = manifests.get(manifestUrl);
+    if (!p) {
+      p = fetch(manifestUrl)
+        .then((res) => {
+          if (!res.ok) throw new Error(`스펙트로그램 manifest 로드 실패: ${res.status}`);
+          return res.json();
+        })
+        .then((manifest: SpectrogramManifest) => {
+          if (manifest.format !== SPEC_FORMAT) throw new Error("spectrogram_tiles manifest가 아닙니다");
+          if (manifest.format_version > SPEC_VERSION) {
+            throw new Error(`지원하지 않는 스펙트로그램 버전: ${manifest.format_version}`);
+          }
+          return new SpectrogramTiles(manifest, manifestUrl.slice(0, manifestUrl.lastIndexOf("/") + 1));
+        });
+      p.catch(() => manifests.delete(manifestUrl));
+      manifests.set(manifestUrl, p);
+    }
+    return p;
+  }
+
+  /** 보이는 구간 길이·폭(px) → 레벨. 열 폭이 1px 이상 되는 레벨 중 가장 거친 것 (없으면 가장 세밀한 것) */
+  pickLevel(visibleSec: number, widthPx: number): SpectrogramLevel {
+    const secPerPx = visibleSec / Math.max(1, widthPx);
+    let chosen = this.manifest.levels[0];
+    for (const lv of this.manifest.levels) {
+      if (lv.column_sec <= secPerPx) chosen = lv;
+    }
+    return chosen;
+  }
+
+  /** [start, end] 구간에 보이는 타일 (시간순) */
+  tilesInRange(start: number, end: number, widthPx: number): SpectrogramTile[] {
+    const { tile_width, tile_path } = this.manifest;
+    const lv = this.pickLevel(Math.max(0.001, end - start), widthPx);
+    const tileSec = lv.column_sec * tile_width;
+    const first = Math.max(0, Math.floor(start / tileSec));
+    const last = Math.min(lv.n_tiles - 1, Math.floor(end / tileSec));
+    const tiles: SpectrogramTile[] = [];
+    for (let i = first; i <= last; i++) {
+      const columns = Math.min(tile_width, lv.n_columns - i * tile_width);
+      tiles.push({
+        url: this.baseUrl + tile_path.replace("{level}", String(lv.level)).replace("{tile}", String(i)),
+        t0: i * tileSec,
+        t1: i * tileSec + columns * lv.column_sec,
+        columns,
+      });
+    }
+    return tiles;
+  }
+
+  /** 주파수(Hz) → 이미지 세로 위치 (0 = 맨 위 = f_max, n_freq = 맨 아래 = f_min). 범위 밖은 잘림 */
+  freqToRow(hz: number): number {
+    const { f_min, f_max, n_freq } = this.manifest;
+    const f = Math.min(f_max, Math.max(f_min, hz));
+    return n_freq * (1 - Math.log(f / f_min) / Math.log(f_max / f_min));
+  }
+}
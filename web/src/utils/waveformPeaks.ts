@@ -0,0 +1,126 @@
+/**
+ * 파형 피크 피라미드 (.peaks) 리더 — audio_engine/engine/onset/waveform_peaks.py 와 같은 구조
+ *
+ * "OWPK" | u32 버전 | u32 헤더 길이 | 헤더 JSON | 8바이트 정렬 | 레벨 데이터 ([min0, max0, min1, max1, ...] int8|int16)
+ * 헤더 = { sr, duration_sec, n_samples, bits, scale, levels: [{ samples_per_pixel, length, offset, nbytes }] }
+ *
+ * fetchWaveformPeaks(url, pxPerSec)는 헤더 + 줌에 맞는 레벨 1개만 HTTP Range로 받음 (미지원 서버면 전체 1회).
+ * loadWithPeaks(ws, audioUrl, peaksUrl)는 피크로 바로 그리고 오디오는 재생용으로만 로드 (디코드 생략).
+ */
+import type WaveSurfer from "wavesurfer.js";
+import { resolveAssetUrl } from "./assetManifest";
+
+const PEAKS_MAGIC = "OWPK";
+const PEAKS_VERSION = 1;
+const ALIGN = 8;
+const HEADER_PROBE_BYTES = 4096;
+/** 줌 인 여유: 레벨은 pxPerSec * 이 값 이상의 해상도 중 가장 거친 것 */
+const ZOOM_HEADROOM = 4;
+
+interface PeaksLevelEntry {
+  samples_per_pixel: number;
+  length: number;
+  offset: number;
+  nbytes: number;
+}
+
+export interface PeaksHeader {
+  sr: number;
+  duration_sec: number;
+  n_samples: number;
+  bits: number;
+  scale: number;
+  levels: PeaksLevelEntry[];
+}
+
+export interface WaveformPeaks {
+  duration: number;
+  samplesPerPixel: number;
+  /** [min0, max0, min1, max1, ...] 원래 진폭 단위 (WaveSurfer channelData로 바로 사용) */
+  peaks: Float32Array;
+}
+
+function parseHeader(bytes: Uint8Array): { header: PeaksHeader; base: number } | { needed: number } {
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+  if (magic !== PEAKS_MAGIC) throw new Error("OWPK 피크 파일이 아닙니다");
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const version = view.getUint32(4, true);
+  if (version > PEAKS_VERSION) throw new Error(`지원하지 않는 피크 파일 버전: ${version}`);
+  const headLen = view.getUint32(8, true);
+  const start = 12 + headLen;
+  if (bytes.byteLength < start) return { needed: start };
+  const header = JSON.parse(new TextDecoder().decode(bytes.subarray(12, start))) as PeaksHeader;
+  return { header, base: start + ((ALIGN - (start % ALIGN)) % ALIGN) };
+}
+
+/** px/s → 레벨. 초당 피크 쌍 수가 pxPerSec * ZOOM_HEADROOM 이상인 레벨 중 가장 거친 것 (없으면 가장 세밀한 것) */
+export function pickPeaksLevel(header: PeaksHeader, pxPerSec: number): PeaksLevelEntry {
+  const need = pxPerSec * ZOOM_HEADROOM;
+  let chosen = header.levels[0];
+  for (const lv of header.levels) {
+    if (header.sr / lv.samples_per_pixel >= need) chosen = lv;
+  }
+  return chosen;
+}
+
+function toPeaks(header: PeaksHeader, level: PeaksLevelEntry, buffer: ArrayBuffer, byteOffset: number): WaveformPeaks {
+  const count = 2 * level.length;
+  const raw =
+    header.bits === 16
+      ? new Int16Array(buffer.slice(byteOffset, byteOffset + count * 2))
+      : new Int8Array(buffer.slice(byteOffset, byteOffset + count));
+  const k = header.scale / (header.bits === 16 ? 32767 : 127);
+  const peaks = new Float32Array(count);
+  for (let i = 0; i < count; i++) peaks[i] = raw[i] * k;
+  return { duration: header.duration_sec, samplesPerPixel: level.samples_per_pixel, peaks };
+}
+
+async function fetchRange(url: string, start: number, end: number): Promise<{ full: boolean; buffer: ArrayBuffer }> {
+  const res = await fetch(url, { headers: { Range: `bytes=${start}-${end - 1}` } });
+  if (!res.ok) throw new Error(`피크 로드 실패: ${res.status}`);
+  return { full: res.status !== 206, buffer: await res.arrayBuffer() };
+}
+
+/** 메모리의 .peaks ArrayBuffer → 줌에 맞는 레벨 피크 */
+export function decodeWaveformPeaks(buffer: ArrayBuffer, pxPerSec: number): WaveformPeaks {
+  const parsed = parseHeader(new Uint8Array(buffer));
+  if ("needed" in parsed) throw new Error("OWPK 피크 파일이 잘렸습니다");
+  const level = pickPeaksLevel(parsed.header, pxPerSec);
+  return toPeaks(parsed.header, level, buffer, parsed.base + level.offset);
+}
+
+/** URL의 .peaks에서 헤더 + 레벨 1개만 로드 */
+export async function fetchWaveformPeaks(url: string, pxPerSec: number): Promise<WaveformPeaks> {
+  url = await resolveAssetUrl(url);
+  let probe = await fetchRange(url, 0, HEADER_PROBE_BYTES);
+  if (probe.full) return decodeWaveformPeaks(probe.buffer, pxPerSec);
+  let parsed = parseHeader(new Uint8Array(probe.buffer));
+  if ("needed" in parsed) {
+    probe = await fetchRange(url, 0, parsed.needed);
+    if (probe.full) return decodeWaveformPeaks(probe.buffer, pxPerSec);
+    parsed = parseHeader(new Uint8Array(probe.buffer));
+    if ("needed" in parsed) throw new Error("OWPK 헤더를 읽지 못했습니다");
+  }
+  const { header, base } = parsed;
+  const level = pickPeaksLevel(header, pxPerSec);
+  const span = await fetchRange(url, base + level.offset, base + level.offset + level.nbytes);
+  return toPeaks(header, level, span.buffer, span.full ? base + level.offset : 0);
+}
+
+/**
+ * 피크가 있으면 WaveSurfer에 피크·길이를 넘겨 디코드 없이 그림 (오디오는 재생용 스트리밍).
+ * peaksUrl이 없거나 로드 실패 시 기존처럼 ws.load(audioUrl).
+ */
+export async function loadWithPeaks(
+  ws: WaveSurfer,
+  audioUrl: string,
+  peaksUrl: string | null | undefined,
+  pxPerSec: number
+): Promise<void> {
+  let loaded: WaveformPeaks | null = null;
+  if (peaksUrl) {
+    loaded = await fetchWaveformPeaks(peaksUrl, pxPerSec).catch(() => null);
+  }
+  if (loaded) await ws.load(audioUrl, [loaded.peaks], loaded.duration);
+  else await ws.load(audioUrl);
+}
@@ -1,7 +1,56 @@
-import { defineConfig } from 'vite'
+import fs from 'node:fs'
+import path from 'node:path'
+import { defineConfig, type Connect, type Plugin } from 'vite'
 import react from '@vitejs/plugin-react'
 
+// audio_engine web_assets.py가 게시한 미리 압축본({이름}.br / .gz)을 그대로 전송 (서버 실시간 압축 없음).
+// Range 요청(.oab·.peaks)은 압축본과 오프셋이 다르므로 그대로 원본.
+const PRECOMPRESSED = [
+  { encoding: 'br', ext: '.br' },
+  { encoding: 'gzip', ext: '.gz' },
+]
+const CONTENT_TYPES: Record<string, string> = { '.json': 'application/json; charset=utf-8' }
+// {stem}.{hash12}.{확장자}: 내용이 바뀌면 이름이 바뀌므로 영구 캐시
+const HASHED_NAME = /\.[0-9a-f]{12}\.[a-z]+$/
+
+function precompressedMiddleware(baseDir: () => string): Connect.NextHandleFunction {
+  return (req, res, next) => {
+    if (req.method !== 'GET' || req.headers.range) return next()
+    const url = decodeURIComponent((req.url ?? '').split('?')[0])
+    const type = CONTENT_TYPES[path.extname(url)]
+    if (!type) return next()
+    const dir = baseDir()
+    const file = path.join(dir, url)
+    if (!file.startsWith(dir + path.sep)) return next()
+    const accept = String(req.headers['accept-encoding'] ?? '')
+    for (const { encoding, ext } of PRECOMPRESSED) {
+      if (!accept.includes(encoding) || !fs.existsSync(file + ext)) continue
+      res.setHeader('Content-Type', type)
+      res.setHeader('Content-Encoding', encoding)
+      res.setHeader('Vary', 'Accept-Encoding')
+      if (HASHED_NAME.test(url)) res.setHeader('Cache-Control', 'public, max-age=31536000, immutable')
+      fs.createReadStream(file + ext).pipe(res)
+      return
+    }
+    next()
+  }
+}
+
+function precompressedPublic(): Plugin {
+  return {
+    name: 'precompressed-public',
+    configureServer(server) {
+      server.middlewares.use(precompressedMiddleware(() => server.config.publicDir))
+    },
+    configurePreviewServer(server) {
+      server.middlewares.use(
+        precompressedMiddleware(() => path.resolve(server.config.root, server.config.build.outDir))
+      )
+    },
+  }
+}
+
 // https://vite.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), precompressedPublic()],
 })